@@ -0,0 +1,142 @@
+"""
+Async login and registration views for ASGI deployments.
+
+Same URLs, request bodies and responses as LoginView and
+RegistrationView, but the PBKDF2 work runs in the bounded hashing pool
+(core.hashing_pool) and database access in sync_to_async, so a login
+storm does not block the thread that serves the sync views. Enabled
+with ``AUTH_ASYNC_VIEWS`` (core/asgi.py turns it on by default).
+
+DRF 3.14 views are sync only, so these are plain Django views that
+reuse the DRF serializers for validation and return JsonResponse.
+"""
+
+import json
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import authenticate
+from django.contrib.auth.hashers import make_password
+from django.http import JsonResponse
+from django.views import View
+from rest_framework import status
+
+from accounts.tokens import issue_login_tokens, set_refresh_cookie
+from core.hashing_pool import PoolBusy, PoolTimeout, run_in_pool
+from .serializers import LoginSerializer, RegistrationSerializer
+
+
+class AsyncAuthView(View):
+    """
+    Base for the async auth views: body parsing, CSRF and overload handling.
+    """
+
+    http_method_names = ['post', 'options']
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        """
+        Exempt the view from CSRF, like DRF does for token-authenticated APIs.
+        """
+        view = super().as_view(**initkwargs)
+        view.csrf_exempt = True
+        return view
+
+    async def dispatch(self, request, *args, **kwargs):
+        """
+        Answer 400 on a malformed body and 503 when the hashing pool is full.
+        """
+        try:
+            self.data = _parse_body(request)
+        except ValueError:
+            return JsonResponse(
+                {'error': 'Malformed request body.'}, status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            return await super().dispatch(request, *args, **kwargs)
+        except (PoolBusy, PoolTimeout):
+            response = JsonResponse(
+                {'error': 'Server is busy, please try again.'},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+            response['Retry-After'] = '1'
+            return response
+
+    async def login_response(self, user, status_code):
+        """
+        Build the same response body and refresh cookie as the sync views.
+        """
+        token, refresh = await sync_to_async(issue_login_tokens)(user)
+        response = JsonResponse({
+            'token': token,
+            'user_id': user.id,
+            'username': user.username,
+            'email': user.email
+        }, status=status_code)
+        if refresh is not None:
+            set_refresh_cookie(response, refresh)
+        return response
+
+
+class AsyncRegistrationView(AsyncAuthView):
+    """
+    Async counterpart of RegistrationView.
+
+    POST /api/registration/
+    """
+
+    async def post(self, request):
+        """
+        Validate, hash the password in the pool, then create the user.
+        """
+        serializer = RegistrationSerializer(data=self.data)
+        if not await sync_to_async(serializer.is_valid)():
+            return JsonResponse(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        password_hash = await run_in_pool(make_password, serializer.validated_data['password'])
+        user = await sync_to_async(serializer.save)(password_hash=password_hash)
+
+        return await self.login_response(user, status.HTTP_201_CREATED)
+
+
+class AsyncLoginView(AsyncAuthView):
+    """
+    Async counterpart of LoginView.
+
+    POST /api/login/
+    """
+
+    async def post(self, request):
+        """
+        Run authenticate() in the pool and return the token.
+        """
+        serializer = LoginSerializer(data=self.data)
+        if not serializer.is_valid():
+            return JsonResponse(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        user = await run_in_pool(
+            authenticate,
+            username=serializer.validated_data['username'],
+            password=serializer.validated_data['password']
+        )
+        if user is None:
+            return JsonResponse(
+                {'error': 'Invalid username or password.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return await self.login_response(user, status.HTTP_200_OK)
+
+
+def _parse_body(request):
+    """
+    Read a JSON or form-encoded request body into a dict.
+
+    Raises:
+        ValueError: The body is not valid JSON or not an object.
+    """
+    if request.content_type != 'application/json':
+        return request.POST
+    data = json.loads(request.body or b'{}')
+    if not isinstance(data, dict):
+        raise ValueError('Expected a JSON object.')
+    return data
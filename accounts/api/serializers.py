@@ -5,6 +5,9 @@ Serializers for user authentication.
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
+from core.sparse_fields import SparseFieldsetMixin
+from core.write_queue import run_write
+from reviews.api.serializers import RatingSummaryField
 
 User = get_user_model()
 
@@ -50,16 +53,25 @@ class RegistrationSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         """
         Create new user with hashed password and user type.
+
+        ``save(password_hash=...)`` stores a password that was already
+        hashed, e.g. in the hashing pool of the async registration view.
+        The password is hashed before the insert is handed to the write
+        queue (core.write_queue), so hashing never holds the write lock.
         """
         validated_data.pop('repeated_password')
+        password_hash = validated_data.pop('password_hash', None)
 
-        user = User.objects.create_user(
-            username=validated_data['username'],
-            email=validated_data['email'],
-            password=validated_data['password'],
+        user = User(
+            username=User.normalize_username(validated_data['username']),
+            email=User.objects.normalize_email(validated_data['email']),
             type=validated_data.get('type', 'customer')
         )
-
+        if password_hash is None:
+            user.set_password(validated_data['password'])
+        else:
+            user.password = password_hash
+        run_write(user.save)
         return user
 
 
@@ -78,11 +90,12 @@ class LoginSerializer(serializers.Serializer):
     )
     
     
-class UserProfileSerializer(serializers.ModelSerializer):
+class UserProfileSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for reading and updating user profile.
 
-    Excludes sensitive fields like password.
+    Excludes sensitive fields like password. Reads support
+    ?fields= / ?omit= (core.sparse_fields).
     """
 
     class Meta:
@@ -101,4 +114,19 @@ class UserProfileSerializer(serializers.ModelSerializer):
             'created_at',
             'updated_at'
         ]
-        read_only_fields = ['id', 'created_at', 'updated_at']
\ No newline at end of file
+        read_only_fields = ['id', 'created_at', 'updated_at']
+
+
+class BusinessProfileSerializer(UserProfileSerializer):
+    """
+    Business profile card: the profile plus review count and average rating.
+
+    The numbers come from the BusinessRating row joined by the view,
+    never from AVG() over the reviews.
+    """
+
+    review_count = RatingSummaryField('review_count')
+    average_rating = RatingSummaryField('average_rating')
+
+    class Meta(UserProfileSerializer.Meta):
+        fields = UserProfileSerializer.Meta.fields + ['review_count', 'average_rating']
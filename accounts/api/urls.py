@@ -2,15 +2,25 @@
 URL configuration for accounts app - Authentication.
 """
 
+from django.conf import settings
 from django.urls import path
-from . import views
+from . import async_views, views
 
 app_name = 'accounts'
 
+if settings.AUTH_ASYNC_VIEWS:
+    RegistrationView = async_views.AsyncRegistrationView
+    LoginView = async_views.AsyncLoginView
+else:
+    RegistrationView = views.RegistrationView
+    LoginView = views.LoginView
+
 urlpatterns = [
     # Authentication
-    path('registration/', views.RegistrationView.as_view(), name='registration'),
-    path('login/', views.LoginView.as_view(), name='login'),
+    path('registration/', RegistrationView.as_view(), name='registration'),
+    path('login/', LoginView.as_view(), name='login'),
+    path('token/refresh/', views.TokenRefreshView.as_view(), name='token-refresh'),
+    path('token/revoke/', views.TokenRevokeView.as_view(), name='token-revoke'),
     
     # Profiles
     path('profile/<int:pk>/', views.ProfileView.as_view(), name='profile-detail'),
@@ -5,10 +5,15 @@ Views for user authentication.
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from rest_framework.authtoken.models import Token
 from rest_framework.permissions import AllowAny
+from django.conf import settings
 from django.contrib.auth import authenticate, get_user_model
+from django.core import signing
 
+from core.query_budget import QueryBudgetMixin
+from core.sparse_fields import SparseFieldsetViewMixin
+from core.streaming import StreamingListMixin
+from accounts.tokens import login_response, refresh_tokens, revoke_refresh_token, set_refresh_cookie
 from .serializers import (
     RegistrationSerializer,
     LoginSerializer
@@ -17,7 +22,7 @@ from .serializers import (
 User = get_user_model()
 
 
-class RegistrationView(APIView):
+class RegistrationView(QueryBudgetMixin, APIView):
     """
     API view for user registration.
 
@@ -27,6 +32,7 @@ class RegistrationView(APIView):
     """
 
     permission_classes = [AllowAny]
+    query_budget = {'POST': 7}
 
     def post(self, request):
         """
@@ -37,20 +43,16 @@ class RegistrationView(APIView):
         if serializer.is_valid():
             user = serializer.save()
 
-            
-            token, created = Token.objects.get_or_create(user=user)
-
-            return Response({
-                'token': token.key,
+            return login_response(user, {
                 'user_id': user.id,
                 'username': user.username,
                 'email': user.email
-            }, status=status.HTTP_201_CREATED)
+            }, status.HTTP_201_CREATED)
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-class LoginView(APIView):
+class LoginView(QueryBudgetMixin, APIView):
     """
     API view for user login.
 
@@ -60,6 +62,7 @@ class LoginView(APIView):
     """
 
     permission_classes = [AllowAny]
+    query_budget = {'POST': 5}
 
     def post(self, request):
         """
@@ -74,14 +77,11 @@ class LoginView(APIView):
             user = authenticate(username=username, password=password)
 
             if user:
-                token, created = Token.objects.get_or_create(user=user)
-
-                return Response({
-                    'token': token.key,
+                return login_response(user, {
                     'user_id': user.id,
                     'username': user.username,
                     'email': user.email
-                }, status=status.HTTP_200_OK)
+                }, status.HTTP_200_OK)
 
             return Response(
                 {'error': 'Invalid username or password.'},
@@ -89,23 +89,104 @@ class LoginView(APIView):
             )
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-    
+
+
+def _refresh_token_from(request):
+    """
+    Read a refresh token from the request body or the refresh cookie.
+    """
+    return request.data.get('refresh') or request.COOKIES.get(settings.SIGNED_TOKEN_REFRESH_COOKIE)
+
+
+class TokenRefreshView(QueryBudgetMixin, APIView):
+    """
+    API view to renew a signed access token.
+
+    POST /api/token/refresh/
+    Takes the refresh token from the refresh cookie (or ``refresh`` in
+    the body), returns a new access token and rotates the cookie.
+    No permissions required.
+    """
+
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    # The user with its token generation
+    query_budget = {'POST': 1}
+
+    def post(self, request):
+        """
+        Handle POST request for a token refresh.
+        """
+        refresh = _refresh_token_from(request)
+        if not refresh:
+            return Response(
+                {'error': 'Refresh token is required.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            user, access, refresh = refresh_tokens(refresh)
+        except (signing.BadSignature, KeyError, TypeError):
+            return Response(
+                {'error': 'Invalid or expired refresh token.'},
+                status=status.HTTP_401_UNAUTHORIZED
+            )
+
+        response = Response({'token': access, 'user_id': user.id}, status=status.HTTP_200_OK)
+        return set_refresh_cookie(response, refresh)
+
+
+class TokenRevokeView(QueryBudgetMixin, APIView):
+    """
+    API view to revoke refresh tokens (logout).
+
+    POST /api/token/revoke/
+    Revokes all refresh tokens of the user the refresh token from the
+    cookie (or ``refresh`` in the body) belongs to, and clears the
+    cookie. Already issued access tokens stay valid until they expire.
+    No permissions required.
+    """
+
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    # The user with its token generation, then bumping the generation
+    query_budget = {'POST': 2}
+
+    def post(self, request):
+        """
+        Handle POST request for a token revocation.
+        """
+        refresh = _refresh_token_from(request)
+        if refresh:
+            try:
+                revoke_refresh_token(refresh)
+            except (signing.BadSignature, KeyError, TypeError):
+                # Invalid or expired tokens cannot be used anyway
+                pass
+
+        response = Response(status=status.HTTP_204_NO_CONTENT)
+        response.delete_cookie(settings.SIGNED_TOKEN_REFRESH_COOKIE)
+        return response
+
+
 from rest_framework import generics
 from rest_framework.permissions import IsAuthenticated
-from .serializers import UserProfileSerializer
+from core.pagination import KeysetCursorPagination
+from .serializers import BusinessProfileSerializer, UserProfileSerializer
 
 
-class ProfileView(generics.RetrieveUpdateAPIView):
+class ProfileView(QueryBudgetMixin, SparseFieldsetViewMixin, generics.RetrieveUpdateAPIView):
     """
     API view to retrieve or update a user profile.
 
-    GET   /api/profile/<pk>/  - retrieve any profile (auth required)
+    GET   /api/profile/<pk>/  - retrieve any profile (auth required,
+                                ?fields= / ?omit= supported)
     PATCH /api/profile/<pk>/  - update only own profile (owner check)
     """
 
     queryset = User.objects.all()
     serializer_class = UserProfileSerializer
     permission_classes = [IsAuthenticated]
+    query_budget = {'GET': 2, 'PUT': 5, 'PATCH': 5}
 
     def get_object(self):
         """
@@ -120,27 +201,40 @@ class ProfileView(generics.RetrieveUpdateAPIView):
         return instance
 
 
-class ProfileBusinessView(generics.ListAPIView):
+class ProfileBusinessView(
+    QueryBudgetMixin, SparseFieldsetViewMixin, StreamingListMixin, generics.ListAPIView
+):
     """
     GET /api/profiles/business/
     Lists all business user profiles. Requires authentication.
+    Cursor-paginated (?cursor=, ?page_size=); ?stream=1 streams all profiles;
+    ?fields= / ?omit= select the returned fields. Each card includes
+    review_count and average_rating.
     """
 
-    serializer_class = UserProfileSerializer
+    queryset = User.objects.filter(type='business').select_related('rating_summary')
+    serializer_class = BusinessProfileSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = KeysetCursorPagination
+    query_budget = {'GET': 2}
+    # Cursor pagination orders by created_at, id
+    sparse_always = ('id', 'created_at')
 
-    def get_queryset(self):
-        return User.objects.filter(type='business')
 
-
-class ProfileCustomerView(generics.ListAPIView):
+class ProfileCustomerView(
+    QueryBudgetMixin, SparseFieldsetViewMixin, StreamingListMixin, generics.ListAPIView
+):
     """
     GET /api/profiles/customer/
     Lists all customer user profiles. Requires authentication.
+    Cursor-paginated (?cursor=, ?page_size=); ?stream=1 streams all profiles;
+    ?fields= / ?omit= select the returned fields.
     """
 
+    queryset = User.objects.filter(type='customer')
     serializer_class = UserProfileSerializer
     permission_classes = [IsAuthenticated]
-
-    def get_queryset(self):
-        return User.objects.filter(type='customer')
\ No newline at end of file
+    pagination_class = KeysetCursorPagination
+    query_budget = {'GET': 2}
+    # Cursor pagination orders by created_at, id
+    sparse_always = ('id', 'created_at')
\ No newline at end of file
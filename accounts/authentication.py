@@ -0,0 +1,200 @@
+"""
+Token authentication with an in-process cache.
+
+DRF's TokenAuthentication joins Token and User on every authenticated
+request. CachedTokenAuthentication keeps the result in a bounded LRU
+with a TTL, keyed by token key, so repeated requests with the same
+token skip the query.
+
+Entries are dropped when the Token is deleted and when the User is
+saved (profile updates, deactivation) or deleted, see
+accounts.signals. The cache lives in each worker process, so with
+several workers a change made in one process reaches the others at the
+latest after ``TOKEN_AUTH_CACHE_TTL`` seconds.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core import signing
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+
+from .tokens import is_signed, verify_access_token
+
+
+class TokenCache:
+    """
+    Thread-safe LRU mapping token key -> (user, token) with a TTL.
+    """
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._keys_by_user = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """
+        Return (user, token) copies for a key, or None if missing or expired.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            _, user, token = entry
+        return _snapshot(user, token)
+
+    def set(self, key, user, token):
+        """
+        Store a user snapshot for a key, evicting the least recently used entry.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl, *_snapshot(user, token))
+            self._keys_by_user.setdefault(user.pk, set()).add(key)
+            while len(self._entries) > self.maxsize:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate_key(self, key):
+        """
+        Drop the entry of one token key.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def invalidate_user(self, user_id):
+        """
+        Drop every entry that belongs to a user.
+        """
+        with self._lock:
+            for key in list(self._keys_by_user.get(user_id, ())):
+                self._remove(key)
+
+    def clear(self):
+        """
+        Drop all entries.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_user.clear()
+
+    def reset_stats(self):
+        """
+        Reset the hit/miss counters.
+        """
+        with self._lock:
+            self.hits = self.misses = 0
+
+    def stats(self):
+        """
+        Return hit/miss counters and the current size.
+
+        Returns:
+            dict: ``hits``, ``misses``, ``hit_rate`` (0.0 - 1.0) and ``size``.
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'size': len(self._entries),
+            }
+
+    def _remove(self, key):
+        _, user, _ = self._entries.pop(key)
+        keys = self._keys_by_user.get(user.pk)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[user.pk]
+
+
+def _snapshot(user, token):
+    """
+    Copy a user and token so callers never share instances with the cache.
+    """
+    user = copy.copy(user)
+    token = copy.copy(token)
+    token.user = user
+    return user, token
+
+
+token_cache = TokenCache(
+    maxsize=getattr(settings, 'TOKEN_AUTH_CACHE_SIZE', 10000),
+    ttl=getattr(settings, 'TOKEN_AUTH_CACHE_TTL', 60),
+)
+
+
+def get_stats():
+    """
+    Return hit/miss metrics of the token cache in this process.
+    """
+    return token_cache.stats()
+
+
+def reset_stats():
+    """
+    Reset hit/miss metrics of the token cache in this process.
+    """
+    token_cache.reset_stats()
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    Drop-in replacement for TokenAuthentication backed by ``token_cache``.
+
+    Failed lookups (unknown key, inactive user) are not cached, so they
+    always reach the database and raise the usual AuthenticationFailed.
+    """
+
+    def authenticate_credentials(self, key):
+        """
+        Return (user, token) from the cache, or look them up and cache them.
+        """
+        cached = token_cache.get(key)
+        if cached is not None:
+            return cached
+        user, token = super().authenticate_credentials(key)
+        token_cache.set(key, user, token)
+        return user, token
+
+
+class SignedTokenAuthentication(CachedTokenAuthentication):
+    """
+    Accept signed access tokens (accounts.tokens) next to authtoken keys.
+
+    Signed tokens are verified from their signature alone, without a
+    query; any other key falls through to CachedTokenAuthentication.
+    """
+
+    def authenticate_credentials(self, key):
+        """
+        Return (user, token) for a signed token or an authtoken key.
+        """
+        if not is_signed(key):
+            return super().authenticate_credentials(key)
+        try:
+            user = verify_access_token(key)
+        except signing.SignatureExpired:
+            raise exceptions.AuthenticationFailed('Token has expired.')
+        except (signing.BadSignature, KeyError, TypeError):
+            raise exceptions.AuthenticationFailed('Invalid token.')
+        if not user.is_active:
+            raise exceptions.AuthenticationFailed('User inactive or deleted.')
+        return user, key
@@ -0,0 +1,122 @@
+"""
+Management command that benchmarks offer reads during a login storm.
+"""
+
+import asyncio
+import random
+import statistics
+import time
+import types
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.test import AsyncClient, override_settings
+from django.urls import include, path
+from rest_framework.authtoken.models import Token
+
+from accounts.api.async_views import AsyncLoginView
+from accounts.api.views import LoginView
+from offers.models import Offer
+
+User = get_user_model()
+
+PASSWORD = 'BenchmarkPass123!'
+
+
+class Command(BaseCommand):
+    """
+    Mix logins with offer list reads through the ASGI handler.
+
+    Requests go through django.test.AsyncClient, i.e. the same ASGI
+    handler core/asgi.py serves, so sync views share one thread as
+    they do under an ASGI server. The run is repeated with the sync
+    LoginView and with AsyncLoginView (hashing pool) and reports the
+    offer read latency and login outcomes of each. Seeded rows are
+    committed, because the pool threads use their own connections,
+    and deleted at the end.
+    """
+
+    help = 'Benchmark offer read latency during a login storm, sync vs. async login.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--logins', type=int, default=40, help='Login requests per run.')
+        parser.add_argument('--reads', type=int, default=400, help='Offer list requests per run.')
+        parser.add_argument('--concurrency', type=int, default=20, help='Requests in flight.')
+        parser.add_argument('--offers', type=int, default=50, help='Offers to seed.')
+
+    def handle(self, *args, **options):
+        """
+        Seed, run both modes and print read latency percentiles.
+        """
+        user = User.objects.create_user(
+            username='benchmark-login', password=PASSWORD, type='business'
+        )
+        try:
+            Offer.objects.bulk_create([
+                Offer(user=user, title=f'Offer {i}', description='Benchmark offer',
+                      min_price=10, min_delivery_time=3)
+                for i in range(options['offers'])
+            ])
+            token = Token.objects.create(user=user).key
+            self.stdout.write(
+                f"{options['logins']} logins + {options['reads']} offer reads, "
+                f"{options['concurrency']} in flight"
+            )
+            for label, view in (('sync login', LoginView), ('async login', AsyncLoginView)):
+                with override_settings(ROOT_URLCONF=_urlconf(view), ALLOWED_HOSTS=['testserver']):
+                    result = asyncio.run(self._run(token, options))
+                self._report(label, *result)
+        finally:
+            user.delete()
+
+    async def _run(self, token, options):
+        """
+        Fire logins and reads in random order, bounded by --concurrency.
+        """
+        client = AsyncClient()
+        limit = asyncio.Semaphore(options['concurrency'])
+        read_times = []
+        login_codes = []
+
+        async def login():
+            async with limit:
+                response = await client.post(
+                    '/api/login/', {'username': 'benchmark-login', 'password': PASSWORD},
+                    content_type='application/json'
+                )
+                login_codes.append(response.status_code)
+
+        async def read():
+            async with limit:
+                start = time.perf_counter()
+                response = await client.get('/api/offers/', HTTP_AUTHORIZATION=f'Token {token}')
+                if response.status_code != 200:
+                    raise CommandError(f'Offer read failed with {response.status_code}.')
+                read_times.append(time.perf_counter() - start)
+
+        jobs = [login] * options['logins'] + [read] * options['reads']
+        random.Random(0).shuffle(jobs)
+        start = time.perf_counter()
+        await asyncio.gather(*(job() for job in jobs))
+        return time.perf_counter() - start, read_times, login_codes
+
+    def _report(self, label, elapsed, read_times, login_codes):
+        read_ms = sorted(t * 1000 for t in read_times)
+        p95 = read_ms[int(len(read_ms) * 0.95) - 1]
+        codes = ', '.join(f'{code}: {login_codes.count(code)}' for code in sorted(set(login_codes)))
+        self.stdout.write(
+            f'  {label:12} total {elapsed:6.1f} s | offer reads p50 '
+            f'{statistics.median(read_ms):7.1f} ms, p95 {p95:7.1f} ms | logins {codes}'
+        )
+
+
+def _urlconf(login_view):
+    """
+    Build a URLconf that serves /api/login/ with ``login_view``.
+    """
+    module = types.ModuleType('benchmark_login_urls')
+    module.urlpatterns = [
+        path('api/login/', login_view.as_view()),
+        path('api/', include('offers.api.urls')),
+    ]
+    return module
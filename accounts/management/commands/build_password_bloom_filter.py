@@ -0,0 +1,76 @@
+"""
+Management command that builds the breached-password Bloom filter.
+"""
+
+import gzip
+import os
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.password_validation import build_bloom_filter, filter_parameters
+
+
+class Command(BaseCommand):
+    """
+    Build the file read by BreachedPasswordValidator from a plain-text list.
+
+    The list has one password per line and may be gzip-compressed
+    (``.gz``). The file is read twice: once to count the entries for
+    sizing, once to fill the filter, so memory stays at the size of the
+    bit array. Standard input ('-') is read once and needs --count.
+    """
+
+    help = 'Build the breached-password Bloom filter from a plain-text list.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="Password list, one per line ('-' for stdin, .gz allowed).")
+        parser.add_argument(
+            '--output', default=None,
+            help='Filter file (default: settings.BREACHED_PASSWORDS_BLOOM_FILTER).'
+        )
+        parser.add_argument(
+            '--fp-rate', type=float, default=0.001, help='Target false positive rate.'
+        )
+        parser.add_argument(
+            '--count', type=int, default=None,
+            help='Number of entries, if known; required when reading stdin.'
+        )
+
+    def handle(self, *args, **options):
+        """
+        Size the filter, fill it and write it atomically.
+        """
+        path = options['path']
+        output = options['output'] or settings.BREACHED_PASSWORDS_BLOOM_FILTER
+        if not 0 < options['fp_rate'] < 1:
+            raise CommandError('--fp-rate must be between 0 and 1.')
+
+        count = options['count']
+        if count is None:
+            if path == '-':
+                raise CommandError('--count is required when reading from stdin.')
+            with self._open(path) as f:
+                count = sum(1 for _ in f)
+
+        num_bits, num_hashes = filter_parameters(count, options['fp_rate'])
+        self.stdout.write(
+            f'Sizing for {count} entries: {num_bits // 8 / 2**20:.1f} MB, {num_hashes} hashes'
+        )
+        os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+        with self._open(path) as f:
+            added, _, _ = build_bloom_filter(
+                (line.rstrip('\n') for line in f), count, output, options['fp_rate']
+            )
+        self.stdout.write(self.style.SUCCESS(f'Wrote {added} passwords to {output}'))
+
+    def _open(self, path):
+        if path == '-':
+            return open(sys.stdin.fileno(), encoding='utf-8', errors='replace', closefd=False)
+        try:
+            if path.endswith('.gz'):
+                return gzip.open(path, 'rt', encoding='utf-8', errors='replace')
+            return open(path, encoding='utf-8', errors='replace')
+        except OSError as exc:
+            raise CommandError(f'Cannot read {path}: {exc}')
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-17 07:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['type', 'created_at', 'id'], name='user_type_created_at_id_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-17 09:54
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_revokedtoken'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TokenGeneration',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('generation', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.DeleteModel(
+            name='RevokedToken',
+        ),
+    ]
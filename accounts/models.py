@@ -2,6 +2,7 @@
 User models for authentication and profile management.
 """
 
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.db import models
 
@@ -56,7 +57,34 @@ class User(AbstractUser):
         ordering = ['-created_at']
         verbose_name = 'User'
         verbose_name_plural = 'Users'
+        indexes = [
+            models.Index(fields=['type', '-created_at', 'id'], name='user_type_created_at_id_idx'),
+        ]
 
     def __str__(self):
         """String representation of User."""
-        return f"{self.username} ({self.get_type_display()})"
\ No newline at end of file
+        return f"{self.username} ({self.get_type_display()})"
+
+
+class TokenGeneration(models.Model):
+    """
+    Refresh token generation of a user who has logged out (accounts.tokens).
+
+    Refresh tokens carry the generation they were issued in. Logging out
+    bumps it, which revokes every refresh token issued before. Users who
+    never logged out have no row and are in generation 0, so the table
+    only grows with users who revoked, not with refresh traffic.
+
+    Attributes:
+        user (OneToOneField): The user.
+        generation (int): Current refresh token generation.
+    """
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, primary_key=True
+    )
+    generation = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        """String representation of TokenGeneration."""
+        return f"{self.user_id}: {self.generation}"
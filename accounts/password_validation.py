@@ -0,0 +1,199 @@
+"""
+Breached-password validator backed by a memory-mapped Bloom filter.
+
+Django's CommonPasswordValidator keeps its 20k passwords in a Python
+set per worker. A corpus of millions of breached passwords would cost
+hundreds of MB per process that way. BreachedPasswordValidator
+instead checks a Bloom filter file built by the
+``build_password_bloom_filter`` command: the file is mmap'ed read-only,
+so every worker shares the same pages through the OS page cache, and a
+lookup only touches ``num_hashes`` bytes of it.
+
+A Bloom filter has no false negatives; at the build's false positive
+rate (0.1% by default) a password that was never breached is rejected
+as "too common", which is acceptable for a registration check.
+
+File layout: 16-byte header (``MAGIC``, version, number of hash
+functions as uint16, number of bits as uint64), followed by the bit
+array. Entries are lowercased and stripped, as in
+CommonPasswordValidator.
+"""
+
+import hashlib
+import logging
+import math
+import mmap
+import os
+import struct
+import tempfile
+import threading
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.utils.translation import gettext as _
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'PWBF'
+VERSION = 1
+HEADER = struct.Struct('<4sHHQ')
+
+_filters = {}
+_filters_lock = threading.Lock()
+
+
+def _normalize(password):
+    return password.lower().strip()
+
+
+def _bit_positions(item, num_bits, num_hashes):
+    """
+    Yield the bit indexes of an item (enhanced double hashing).
+    """
+    digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+    h1, h2 = struct.unpack('<QQ', digest)
+    h1 %= num_bits
+    h2 %= num_bits
+    for i in range(num_hashes):
+        yield h1
+        h1 = (h1 + h2) % num_bits
+        h2 = (h2 + i + 1) % num_bits
+
+
+def filter_parameters(count, false_positive_rate):
+    """
+    Return the optimal (num_bits, num_hashes) for a filter.
+
+    Args:
+        count (int): Number of entries.
+        false_positive_rate (float): Target rate, e.g. 0.001.
+
+    Returns:
+        tuple: (num_bits, num_hashes).
+    """
+    count = max(count, 1)
+    num_bits = math.ceil(-count * math.log(false_positive_rate) / math.log(2) ** 2)
+    num_bits = max(8, math.ceil(num_bits / 8) * 8)
+    num_hashes = max(1, round(num_bits / count * math.log(2)))
+    return num_bits, num_hashes
+
+
+def build_bloom_filter(passwords, count, path, false_positive_rate=0.001):
+    """
+    Write a Bloom filter file for an iterable of passwords.
+
+    The file is written next to ``path`` and moved into place, so
+    running validators keep using the old file until the new one is
+    complete.
+
+    Args:
+        passwords (iterable): Plain-text passwords.
+        count (int): Expected number of passwords, used for sizing.
+        path (str): Output file.
+        false_positive_rate (float): Target false positive rate.
+
+    Returns:
+        tuple: (entries added, num_bits, num_hashes).
+    """
+    num_bits, num_hashes = filter_parameters(count, false_positive_rate)
+    bits = bytearray(num_bits // 8)
+    added = 0
+    for password in passwords:
+        password = _normalize(password)
+        if not password:
+            continue
+        for position in _bit_positions(password, num_bits, num_hashes):
+            bits[position >> 3] |= 1 << (position & 7)
+        added += 1
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, num_hashes, num_bits))
+            f.write(bits)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return added, num_bits, num_hashes
+
+
+class BloomFilter:
+    """
+    Read-only, memory-mapped Bloom filter file.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.num_hashes, self.num_bits = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f'{path} is not a password Bloom filter file.')
+        if len(self._mmap) < HEADER.size + self.num_bits // 8:
+            raise ValueError(f'{path} is truncated.')
+
+    def __contains__(self, password):
+        data = self._mmap
+        for position in _bit_positions(_normalize(password), self.num_bits, self.num_hashes):
+            if not data[HEADER.size + (position >> 3)] & (1 << (position & 7)):
+                return False
+        return True
+
+
+def get_bloom_filter(path):
+    """
+    Return the mapped filter for a path, or None if the file does not exist.
+
+    Filters are opened once per process; a rebuilt file (new inode or
+    mtime) is picked up on the next call.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    key = (os.fspath(path), stat.st_ino, stat.st_mtime_ns)
+    bloom = _filters.get(key)
+    if bloom is None:
+        with _filters_lock:
+            bloom = _filters.get(key)
+            if bloom is None:
+                for old in [k for k in _filters if k[0] == key[0]]:
+                    del _filters[old]
+                bloom = _filters[key] = BloomFilter(path)
+    return bloom
+
+
+class BreachedPasswordValidator:
+    """
+    Reject passwords found in the breached-password Bloom filter.
+
+    Use it in AUTH_PASSWORD_VALIDATORS with an optional
+    ``OPTIONS: {'path': ...}``; the default is
+    ``settings.BREACHED_PASSWORDS_BLOOM_FILTER``. core.settings adds it
+    when that file exists at startup, so running
+    ``manage.py build_password_bloom_filter <list>`` and restarting
+    enables it. If the file goes missing the validator logs a warning
+    and accepts every password, so keep CommonPasswordValidator
+    configured as well.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or settings.BREACHED_PASSWORDS_BLOOM_FILTER
+        self._warned = False
+
+    def validate(self, password, user=None):
+        bloom = get_bloom_filter(self.path)
+        if bloom is None:
+            if not self._warned:
+                logger.warning('Breached password filter %s not found; skipping check.', self.path)
+                self._warned = True
+            return
+        if password in bloom:
+            raise ValidationError(
+                _('This password is too common.'),
+                code='password_too_common',
+            )
+
+    def get_help_text(self):
+        return _('Your password can’t be a commonly used password.')
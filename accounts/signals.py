@@ -0,0 +1,29 @@
+"""
+Signal handlers for the accounts app.
+"""
+
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from accounts.authentication import token_cache
+
+User = get_user_model()
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_token(sender, instance, **kwargs):
+    """
+    Forget a deleted token, so it stops authenticating immediately.
+    """
+    token_cache.invalidate_key(instance.key)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_tokens(sender, instance, **kwargs):
+    """
+    Drop cached snapshots of a user after a profile change, deactivation or delete.
+    """
+    token_cache.invalidate_user(instance.pk)
@@ -6,7 +6,11 @@ GET    /api/profiles/business/
 GET    /api/profiles/customer/
 """
 
+from unittest import skipUnless
+
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
 from rest_framework.authtoken.models import Token
@@ -177,7 +181,7 @@ class ProfileListAPITest(APITestCase):
         response = self.client.get('/api/profiles/business/')
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        usernames = [user['username'] for user in response.data]
+        usernames = [user['username'] for user in response.data['results']]
         self.assertIn('bizuser', usernames)
         self.assertNotIn('custuser', usernames)
 
@@ -188,7 +192,7 @@ class ProfileListAPITest(APITestCase):
         response = self.client.get('/api/profiles/customer/')
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        usernames = [user['username'] for user in response.data]
+        usernames = [user['username'] for user in response.data['results']]
         self.assertIn('custuser', usernames)
         self.assertNotIn('bizuser', usernames)
 
@@ -199,4 +203,54 @@ class ProfileListAPITest(APITestCase):
         self.client.credentials()
         response = self.client.get('/api/profiles/business/')
 
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
\ No newline at end of file
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+@skipUnless(connection.vendor == 'sqlite', 'Checks SQLite query plans.')
+class ProfileListQueryPlanTest(APITestCase):
+    """
+    Tests that SQLite reads profile pages in index order without sorting.
+    """
+
+    def setUp(self):
+        """
+        Create two users of each type and authenticate.
+        """
+        for i in range(2):
+            User.objects.create_user(username=f'biz{i}', type='business')
+            User.objects.create_user(username=f'cust{i}', type='customer')
+        self.client.force_authenticate(User.objects.get(username='biz0'))
+
+    def _plan(self, url):
+        """
+        Return the EXPLAIN QUERY PLAN details of the page query for a URL.
+        """
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        sql = next(q['sql'] for q in ctx.captured_queries if 'ORDER BY' in q['sql'])
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+            return [row[-1] for row in cursor.fetchall()], response
+
+    def _assert_index_ordered(self, plan):
+        self.assertTrue(any('user_type_created_at_id_idx' in step for step in plan), plan)
+        self.assertFalse(any('TEMP B-TREE' in step for step in plan), plan)
+
+    def test_list_plans(self):
+        """
+        Test that both lists walk the (type, -created_at, id) index.
+        """
+        for url in ('/api/profiles/business/', '/api/profiles/customer/'):
+            with self.subTest(url=url):
+                plan, _ = self._plan(url)
+                self._assert_index_ordered(plan)
+
+    def test_cursor_page_plan(self):
+        """
+        Test that a page after a cursor walks the index from the cursor.
+        """
+        _, response = self._plan('/api/profiles/business/?page_size=1')
+        plan, _ = self._plan(response.data['next'])
+
+        self._assert_index_ordered(plan)
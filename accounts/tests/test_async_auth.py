@@ -0,0 +1,182 @@
+"""
+Tests for the async login/registration views and the hashing pool.
+"""
+
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.test import AsyncRequestFactory, SimpleTestCase, TransactionTestCase, override_settings
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+
+from accounts.api.async_views import AsyncLoginView, AsyncRegistrationView
+from core.hashing_pool import PoolBusy, PoolTimeout, run_in_pool
+
+User = get_user_model()
+
+
+class AsyncAuthViewTest(TransactionTestCase):
+    """
+    Tests that the async views behave like LoginView and RegistrationView.
+
+    TransactionTestCase, because the pool threads use their own
+    database connections and must see committed rows.
+    """
+
+    def setUp(self):
+        """
+        Create a user to log in with.
+        """
+        self.factory = AsyncRequestFactory()
+        self.user = User.objects.create_user(
+            username='testuser', email='test@example.com', password='TestPass123!'
+        )
+
+    def _post(self, view, data):
+        request = self.factory.post('/', json.dumps(data), content_type='application/json')
+        response = async_to_sync(view.as_view())(request)
+        return response, json.loads(response.content)
+
+    def test_login(self):
+        """
+        Test that login returns the same body as LoginView.
+        """
+        response, data = self._post(
+            AsyncLoginView, {'username': 'testuser', 'password': 'TestPass123!'}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(data, {
+            'token': Token.objects.get(user=self.user).key,
+            'user_id': self.user.id,
+            'username': 'testuser',
+            'email': 'test@example.com'
+        })
+
+    def test_login_invalid_password(self):
+        """
+        Test that a wrong password returns 400.
+        """
+        response, data = self._post(
+            AsyncLoginView, {'username': 'testuser', 'password': 'wrong'}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('error', data)
+
+    def test_registration(self):
+        """
+        Test that registration stores a usable password hash.
+        """
+        response, data = self._post(AsyncRegistrationView, {
+            'username': 'newuser',
+            'email': 'new@example.com',
+            'password': 'TestPass123!',
+            'repeated_password': 'TestPass123!',
+            'type': 'business'
+        })
+        user = User.objects.get(username='newuser')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(data['user_id'], user.id)
+        self.assertEqual(user.type, 'business')
+        self.assertTrue(user.check_password('TestPass123!'))
+
+    def test_registration_validation_error(self):
+        """
+        Test that serializer errors are returned as 400.
+        """
+        response, data = self._post(AsyncRegistrationView, {
+            'username': 'testuser',
+            'email': 'new@example.com',
+            'password': 'TestPass123!',
+            'repeated_password': 'Other123!'
+        })
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('username', data)
+
+    def test_malformed_body(self):
+        """
+        Test that invalid JSON returns 400.
+        """
+        request = self.factory.post('/', '{', content_type='application/json')
+
+        response = async_to_sync(AsyncLoginView.as_view())(request)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_busy_pool_returns_503(self):
+        """
+        Test that a full pool answers 503 with Retry-After.
+        """
+        with mock.patch('accounts.api.async_views.run_in_pool', side_effect=PoolBusy):
+            response, _ = self._post(
+                AsyncLoginView, {'username': 'testuser', 'password': 'TestPass123!'}
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response['Retry-After'], '1')
+
+
+class HashingPoolTest(SimpleTestCase):
+    """
+    Tests the queue limit and timeout of run_in_pool.
+    """
+
+    def setUp(self):
+        """
+        Use a private pool with one worker and one queue slot.
+        """
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.slots = threading.BoundedSemaphore(2)
+        patcher = mock.patch(
+            'core.hashing_pool._get_pool', return_value=(self.executor, self.slots)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.executor.shutdown)
+
+    def test_runs_job(self):
+        """
+        Test that the result of the job is returned.
+        """
+        self.assertEqual(async_to_sync(run_in_pool)(sum, [1, 2, 3]), 6)
+
+    def test_rejects_when_full(self):
+        """
+        Test that jobs beyond workers + queue size raise PoolBusy.
+        """
+        release = threading.Event()
+
+        async def scenario():
+            jobs = [asyncio.ensure_future(run_in_pool(release.wait)) for _ in range(2)]
+            await asyncio.sleep(0)
+            try:
+                with self.assertRaises(PoolBusy):
+                    await run_in_pool(release.wait)
+            finally:
+                release.set()
+            return await asyncio.gather(*jobs)
+
+        self.assertEqual(async_to_sync(scenario)(), [True, True])
+
+    @override_settings(PASSWORD_HASHING_TIMEOUT=0.05)
+    def test_timeout(self):
+        """
+        Test that a slow job raises PoolTimeout and frees its slot later.
+        """
+        release = threading.Event()
+
+        with self.assertRaises(PoolTimeout):
+            async_to_sync(run_in_pool)(release.wait)
+        release.set()
+        self.executor.shutdown(wait=True)
+
+        self.assertTrue(self.slots.acquire(blocking=False))
+        self.assertTrue(self.slots.acquire(blocking=False))
@@ -0,0 +1,182 @@
+"""
+Tests for the Bloom-filter breached-password validator.
+"""
+
+import os
+import runpy
+import shutil
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.password_validation import validate_password
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+from rest_framework.test import APITestCase
+from rest_framework import status
+
+from accounts.password_validation import (
+    BreachedPasswordValidator, build_bloom_filter, get_bloom_filter
+)
+
+BREACHED = ['hunter2', 'correcthorse', 'Tr0ub4dor&3', 'letmein2024']
+
+
+class BloomFilterTestMixin:
+    """
+    Build a filter file for the breached list in a temporary directory.
+    """
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        self.path = os.path.join(self.tmpdir, 'breached.bloom')
+        build_bloom_filter(BREACHED, len(BREACHED), self.path)
+
+
+class BreachedPasswordValidatorTest(BloomFilterTestMixin, SimpleTestCase):
+    """
+    Tests lookups, normalization and the missing-file fallback.
+    """
+
+    def test_rejects_breached_password(self):
+        """
+        Test that listed passwords are rejected, ignoring case and whitespace.
+        """
+        validator = BreachedPasswordValidator(path=self.path)
+
+        for password in ('hunter2', 'HUNTER2', ' tr0ub4dor&3 '):
+            with self.assertRaises(ValidationError) as ctx:
+                validator.validate(password)
+            self.assertEqual(ctx.exception.code, 'password_too_common')
+
+    def test_accepts_other_passwords(self):
+        """
+        Test that unlisted passwords pass (allowing for the false positive rate).
+        """
+        validator = BreachedPasswordValidator(path=self.path)
+        rejected = 0
+        for i in range(1000):
+            try:
+                validator.validate(f'Unlisted-{i}')
+            except ValidationError:
+                rejected += 1
+
+        self.assertLess(rejected, 10)
+
+    def test_missing_file_accepts(self):
+        """
+        Test that a filter that was not built yet does not block registration.
+        """
+        validator = BreachedPasswordValidator(path=os.path.join(self.tmpdir, 'missing.bloom'))
+
+        with self.assertLogs('accounts.password_validation', 'WARNING'):
+            validator.validate('hunter2')
+
+    def test_rebuilt_file_is_reloaded(self):
+        """
+        Test that a rebuilt filter replaces the mapped one.
+        """
+        before = get_bloom_filter(self.path)
+        build_bloom_filter(['newly-breached'], 1, self.path)
+        os.utime(self.path, ns=(0, 0))
+
+        after = get_bloom_filter(self.path)
+
+        self.assertIsNot(before, after)
+        self.assertIn('newly-breached', after)
+
+    def test_invalid_file(self):
+        """
+        Test that a file without the header is refused.
+        """
+        with open(self.path, 'wb') as f:
+            f.write(b'not a filter' * 10)
+
+        with self.assertRaises(ValueError):
+            get_bloom_filter(self.path)
+
+
+class BreachedPasswordSettingsTest(BloomFilterTestMixin, SimpleTestCase):
+    """
+    Tests that core.settings registers the validator only once a filter is built.
+    """
+
+    VALIDATOR = 'accounts.password_validation.BreachedPasswordValidator'
+
+    def load_settings(self, path):
+        with mock.patch.dict(os.environ, {'BREACHED_PASSWORDS_BLOOM_FILTER': path}):
+            return runpy.run_module('core.settings')
+
+    def test_not_registered_without_filter(self):
+        """
+        Test that the validator is left out while the filter file does not exist.
+        """
+        settings = self.load_settings(os.path.join(self.tmpdir, 'missing.bloom'))
+
+        names = [validator['NAME'] for validator in settings['AUTH_PASSWORD_VALIDATORS']]
+        self.assertNotIn(self.VALIDATOR, names)
+
+    def test_registered_filter_rejects_listed_password(self):
+        """
+        Test that a built filter is registered and rejects a listed password.
+        """
+        settings = self.load_settings(self.path)
+        validators = settings['AUTH_PASSWORD_VALIDATORS']
+        self.assertIn(self.VALIDATOR, [validator['NAME'] for validator in validators])
+
+        with override_settings(
+            AUTH_PASSWORD_VALIDATORS=validators,
+            BREACHED_PASSWORDS_BLOOM_FILTER=settings['BREACHED_PASSWORDS_BLOOM_FILTER'],
+        ):
+            with self.assertRaises(ValidationError) as ctx:
+                validate_password('letmein2024')
+            validate_password('an unlisted passphrase')
+
+        self.assertIn('password_too_common', [error.code for error in ctx.exception.error_list])
+
+
+class BuildPasswordBloomFilterCommandTest(BloomFilterTestMixin, SimpleTestCase):
+    """
+    Tests for the build_password_bloom_filter command.
+    """
+
+    def test_builds_from_text_list(self):
+        """
+        Test that the command builds a filter containing every line.
+        """
+        source = os.path.join(self.tmpdir, 'list.txt')
+        with open(source, 'w') as f:
+            f.write('\n'.join(['alpha', 'bravo', '', 'charlie']) + '\n')
+        output = os.path.join(self.tmpdir, 'out', 'list.bloom')
+
+        call_command('build_password_bloom_filter', source, output=output, stdout=StringIO())
+        bloom = get_bloom_filter(output)
+
+        self.assertTrue(all(word in bloom for word in ('alpha', 'bravo', 'charlie')))
+
+
+class RegistrationBreachedPasswordTest(BloomFilterTestMixin, APITestCase):
+    """
+    Tests the validator through the registration endpoint.
+    """
+
+    def test_registration_rejects_breached_password(self):
+        """
+        Test that registration returns 400 for a breached password.
+        """
+        validators = [{
+            'NAME': 'accounts.password_validation.BreachedPasswordValidator',
+            'OPTIONS': {'path': self.path},
+        }]
+        with override_settings(AUTH_PASSWORD_VALIDATORS=validators):
+            response = self.client.post('/api/registration/', {
+                'username': 'newuser',
+                'email': 'new@example.com',
+                'password': 'letmein2024',
+                'repeated_password': 'letmein2024'
+            }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('password', response.data)
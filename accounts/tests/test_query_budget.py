@@ -0,0 +1,82 @@
+"""
+Query budget tests for account endpoints.
+Every view in accounts/api/views.py must stay within its declared query_budget.
+"""
+
+from django.contrib.auth import get_user_model
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+
+from core.query_budget import QueryBudgetTestMixin
+
+User = get_user_model()
+
+
+class AccountsQueryBudgetTest(QueryBudgetTestMixin, APITestCase):
+    """
+    Tests that registration, login and profile endpoints respect their budgets.
+    """
+
+    def setUp(self):
+        """
+        Create a business user with a token and a few customers.
+        """
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='bizuser',
+            email='biz@example.com',
+            password='TestPass123!',
+            type='business'
+        )
+        self.token = Token.objects.create(user=self.user)
+        for i in range(3):
+            User.objects.create(username=f'cust{i}', email=f'cust{i}@example.com')
+
+    def test_registration_within_budget(self):
+        """
+        Test POST /api/registration/.
+        """
+        data = {
+            'username': 'newuser',
+            'email': 'new@example.com',
+            'password': 'StrongPass123!',
+            'repeated_password': 'StrongPass123!',
+            'type': 'customer'
+        }
+        response = self.assertWithinQueryBudget('post', '/api/registration/', data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_login_within_budget(self):
+        """
+        Test POST /api/login/ for a user that already has a token.
+        """
+        data = {'username': 'bizuser', 'password': 'TestPass123!'}
+        response = self.assertWithinQueryBudget('post', '/api/login/', data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_profile_retrieve_within_budget(self):
+        """
+        Test GET /api/profile/<pk>/.
+        """
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+        self.assertWithinQueryBudget('get', f'/api/profile/{self.user.id}/')
+
+    def test_profile_update_within_budget(self):
+        """
+        Test PATCH /api/profile/<pk>/ including a username change.
+        """
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+        response = self.assertWithinQueryBudget(
+            'patch', f'/api/profile/{self.user.id}/',
+            {'username': 'renamed', 'location': 'Berlin'}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_profile_lists_within_budget(self):
+        """
+        Test GET /api/profiles/business/ and /api/profiles/customer/.
+        """
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+        self.assertWithinQueryBudget('get', '/api/profiles/business/')
+        self.assertWithinQueryBudget('get', '/api/profiles/customer/')
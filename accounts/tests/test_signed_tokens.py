@@ -0,0 +1,247 @@
+"""
+Tests for signed stateless tokens (AUTH_TOKEN_MODE = 'signed').
+"""
+
+import time
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+
+from core.query_budget import QueryBudgetTestMixin
+
+from accounts.models import TokenGeneration
+from accounts.tokens import issue_access_token, verify_access_token
+
+User = get_user_model()
+
+COOKIE = settings.SIGNED_TOKEN_REFRESH_COOKIE
+
+
+@override_settings(AUTH_TOKEN_MODE='signed')
+class SignedTokenTest(QueryBudgetTestMixin, APITestCase):
+    """
+    Tests issuing, verifying, refreshing and revoking signed tokens.
+    """
+
+    def setUp(self):
+        """
+        Create a business user and log in.
+        """
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='bizuser',
+            email='biz@example.com',
+            password='TestPass123!',
+            type='business'
+        )
+        self.response = self.client.post(
+            '/api/login/', {'username': 'bizuser', 'password': 'TestPass123!'}, format='json'
+        )
+
+    def _authorize(self, token):
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token)
+
+    def test_login_response_shape(self):
+        """
+        Test that login keeps its body and sets the refresh cookie instead.
+        """
+        self.assertEqual(self.response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            set(self.response.data), {'token', 'user_id', 'username', 'email'}
+        )
+        self.assertTrue(self.response.cookies[COOKIE]['httponly'])
+        self.assertFalse(Token.objects.exists())
+
+    def test_registration_issues_signed_token(self):
+        """
+        Test that registration returns a usable signed token.
+        """
+        response = self.client.post('/api/registration/', {
+            'username': 'newuser',
+            'email': 'new@example.com',
+            'password': 'TestPass123!',
+            'repeated_password': 'TestPass123!',
+            'type': 'customer'
+        }, format='json')
+        self._authorize(response.data['token'])
+
+        profile = self.client.get(f"/api/profile/{response.data['user_id']}/")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(profile.status_code, status.HTTP_200_OK)
+        self.assertFalse(Token.objects.exists())
+
+    def test_verification_without_query(self):
+        """
+        Test that authenticating a request does not query the database.
+        """
+        self._authorize(self.response.data['token'])
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post('/api/offers/', {}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(len(ctx.captured_queries), 0)
+
+    def test_request_user_carries_id_and_type(self):
+        """
+        Test that the owner check on profiles works with the token user.
+        """
+        self._authorize(self.response.data['token'])
+
+        response = self.client.patch(
+            f'/api/profile/{self.user.id}/', {'location': 'Berlin'}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_tampered_token_rejected(self):
+        """
+        Test that a token with a changed payload fails verification.
+        """
+        self._authorize(self.response.data['token'][:-1] + 'x')
+
+        response = self.client.get(f'/api/profile/{self.user.id}/')
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_expired_token_rejected(self):
+        """
+        Test that an access token stops working after its TTL.
+        """
+        self._authorize(self.response.data['token'])
+        expired = settings.SIGNED_TOKEN_ACCESS_TTL + 1
+
+        with mock.patch('django.core.signing.time.time', return_value=time.time() + expired):
+            response = self.client.get(f'/api/profile/{self.user.id}/')
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_refresh_rotates_tokens(self):
+        """
+        Test that a refresh returns a new access token and a refresh token that works.
+        """
+        response = self.client.post('/api/token/refresh/')
+        self._authorize(response.data['token'])
+        profile = self.client.get(f'/api/profile/{self.user.id}/')
+        again = self.client.post(
+            '/api/token/refresh/', {'refresh': response.cookies[COOKIE].value}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(profile.status_code, status.HTTP_200_OK)
+        self.assertEqual(again.status_code, status.HTTP_200_OK)
+        self.assertFalse(TokenGeneration.objects.exists())
+
+    def test_refresh_inactive_user_rejected(self):
+        """
+        Test that an inactive user cannot refresh.
+        """
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+
+        response = self.client.post('/api/token/refresh/')
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_revoke(self):
+        """
+        Test that logging out revokes the refresh token and the ones rotated from it.
+        """
+        login_refresh = self.response.cookies[COOKIE].value
+        rotated = self.client.post('/api/token/refresh/').cookies[COOKIE].value
+
+        revoke = self.client.post('/api/token/revoke/', {'refresh': rotated}, format='json')
+        responses = [
+            self.client.post('/api/token/refresh/', {'refresh': token}, format='json')
+            for token in (login_refresh, rotated)
+        ]
+
+        self.assertEqual(revoke.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(
+            [response.status_code for response in responses],
+            [status.HTTP_401_UNAUTHORIZED] * 2
+        )
+
+    def test_login_after_revoke(self):
+        """
+        Test that a new login refreshes and a replayed revoked token changes nothing.
+        """
+        revoked = self.response.cookies[COOKIE].value
+        self.client.post('/api/token/revoke/')
+        login = self.client.post(
+            '/api/login/', {'username': 'bizuser', 'password': 'TestPass123!'}, format='json'
+        )
+
+        replay = self.client.post('/api/token/revoke/', {'refresh': revoked}, format='json')
+        response = self.client.post(
+            '/api/token/refresh/', {'refresh': login.cookies[COOKIE].value}, format='json'
+        )
+
+        self.assertEqual(replay.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(TokenGeneration.objects.get(user=self.user).generation, 1)
+
+    def test_verified_user_fields(self):
+        """
+        Test that the token user carries the id, type and active flag it was issued with.
+        """
+        user = verify_access_token(self.response.data['token'])
+
+        self.assertEqual(
+            (user.pk, user.type, user.is_active, user._state.db),
+            (self.user.pk, 'business', True, 'default')
+        )
+
+    def test_inactive_user_access_token_rejected(self):
+        """
+        Test that an access token issued to an inactive user does not authenticate.
+        """
+        self.user.is_active = False
+        self._authorize(issue_access_token(self.user))
+
+        response = self.client.get(f'/api/profile/{self.user.id}/')
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_refresh_within_query_budget(self):
+        """
+        Test that a refresh stays within the view's query budget.
+        """
+        response = self.assertWithinQueryBudget('post', '/api/token/refresh/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_revoke_within_query_budget(self):
+        """
+        Test that a revocation stays within the view's query budget.
+        """
+        response = self.assertWithinQueryBudget('post', '/api/token/revoke/')
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(TokenGeneration.objects.get(user=self.user).generation, 1)
+
+
+class DatabaseTokenModeTest(APITestCase):
+    """
+    Tests that the default mode still issues authtoken keys.
+    """
+
+    def test_login_issues_authtoken(self):
+        """
+        Test that login returns the user's authtoken key.
+        """
+        user = User.objects.create_user(username='user', password='TestPass123!')
+
+        response = APIClient().post(
+            '/api/login/', {'username': 'user', 'password': 'TestPass123!'}, format='json'
+        )
+
+        self.assertEqual(response.data['token'], Token.objects.get(user=user).key)
+        self.assertNotIn(COOKIE, response.cookies)
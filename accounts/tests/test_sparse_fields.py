@@ -0,0 +1,83 @@
+"""
+Tests for ?fields= / ?omit= on the profile endpoints.
+"""
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+
+User = get_user_model()
+
+
+class ProfileSparseFieldsTest(APITestCase):
+    """
+    Tests that profile reads only select and render the requested fields.
+    """
+
+    def setUp(self):
+        """
+        Create an authenticated business user and a few more business profiles.
+        """
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='bizuser',
+            email='biz@example.com',
+            password='TestPass123!',
+            type='business',
+            description='About me ' * 100
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+        for i in range(3):
+            User.objects.create(username=f'biz{i}', email=f'biz{i}@example.com', type='business')
+
+    def _profile_query(self, url):
+        """
+        GET a URL and return the response and the SQL of the profile query.
+        """
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # The first query authenticates the token
+        return response, ctx.captured_queries[-1]['sql']
+
+    def test_profile_fields(self):
+        """
+        Test ?fields= on GET /api/profile/<pk>/.
+        """
+        response, sql = self._profile_query(f'/api/profile/{self.user.id}/?fields=username,type')
+
+        self.assertEqual(response.data, {'username': 'bizuser', 'type': 'business'})
+        self.assertNotIn('"description"', sql)
+        self.assertNotIn('"password"', sql)
+
+    def test_profile_list_omit_across_pages(self):
+        """
+        Test ?omit= on the business list while paginating by cursor.
+        """
+        usernames = []
+        url = '/api/profiles/business/?omit=description,working_hours&page_size=2'
+        while url:
+            response, sql = self._profile_query(url)
+            for item in response.data['results']:
+                self.assertNotIn('description', item)
+                usernames.append(item['username'])
+            url = response.data['next']
+
+        self.assertNotIn('"description"', sql)
+        self.assertEqual(sorted(usernames), ['biz0', 'biz1', 'biz2', 'bizuser'])
+
+    def test_patch_ignores_fields(self):
+        """
+        Test that ?fields= does not restrict which fields a PATCH can update.
+        """
+        response = self.client.patch(
+            f'/api/profile/{self.user.id}/?fields=id', {'location': 'Berlin'}, format='json'
+        )
+        self.user.refresh_from_db()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.user.location, 'Berlin')
@@ -0,0 +1,47 @@
+"""
+Tests for ?stream=1 on the profile list endpoints.
+"""
+
+import json
+
+from django.contrib.auth import get_user_model
+from rest_framework.test import APITestCase, APIClient
+from rest_framework.authtoken.models import Token
+
+User = get_user_model()
+
+
+class ProfileStreamingAPITest(APITestCase):
+    """
+    Tests for ?stream=1 on the profile lists.
+    """
+
+    def test_business_profiles_streamed(self):
+        """
+        Test that every business profile is streamed to an authenticated user.
+        """
+        user = User.objects.create_user(
+            username='bizuser',
+            email='biz@example.com',
+            password='TestPass123!',
+            type='business'
+        )
+        for i in range(4):
+            User.objects.create(username=f'biz{i}', email=f'biz{i}@example.com', type='business')
+        User.objects.create(username='cust', email='cust@example.com', type='customer')
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION='Token ' + Token.objects.create(user=user).key)
+
+        response = client.get('/api/profiles/business/?stream=1')
+        items = json.loads(b''.join(response.streaming_content))
+
+        self.assertEqual(len(items), 5)
+        self.assertTrue(all(item['type'] == 'business' for item in items))
+
+    def test_requires_authentication(self):
+        """
+        Test that streaming does not bypass the permission check.
+        """
+        response = APIClient().get('/api/profiles/customer/?stream=1')
+
+        self.assertEqual(response.status_code, 401)
@@ -0,0 +1,161 @@
+"""
+Tests for CachedTokenAuthentication and its invalidation.
+"""
+
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import SimpleTestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+
+from accounts.authentication import TokenCache, get_stats, reset_stats, token_cache
+
+User = get_user_model()
+
+
+class CachedTokenAuthenticationTest(APITestCase):
+    """
+    Tests that token lookups are cached and invalidated on changes.
+    """
+
+    def setUp(self):
+        """
+        Create an authenticated business user and start with an empty cache.
+        """
+        token_cache.clear()
+        reset_stats()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='bizuser',
+            email='biz@example.com',
+            password='TestPass123!',
+            type='business'
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+        self.url = f'/api/profile/{self.user.id}/'
+
+    def _token_queries(self):
+        """
+        GET the profile and return how many queries touched the token table.
+        """
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return sum('authtoken_token' in q['sql'] for q in ctx.captured_queries)
+
+    def test_second_request_skips_lookup(self):
+        """
+        Test that only the first request queries the token table.
+        """
+        self.assertEqual(self._token_queries(), 1)
+        self.assertEqual(self._token_queries(), 0)
+
+        stats = get_stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+        self.assertEqual(stats['hit_rate'], 0.5)
+
+    def test_deleted_token_rejected(self):
+        """
+        Test that deleting a token revokes it immediately.
+        """
+        self._token_queries()
+        self.token.delete()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_deactivated_user_rejected(self):
+        """
+        Test that deactivating a user revokes cached access.
+        """
+        self._token_queries()
+        self.user.is_active = False
+        self.user.save()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_profile_update_refreshes_user(self):
+        """
+        Test that a profile PATCH drops the cached user.
+        """
+        self.client.patch(self.url, {'location': 'Berlin'}, format='json')
+        self.assertIsNone(token_cache.get(self.token.key))
+
+        self._token_queries()
+        user, _ = token_cache.get(self.token.key)
+
+        self.assertEqual(user.location, 'Berlin')
+
+    def test_request_user_not_shared(self):
+        """
+        Test that a request gets its own user instance, not the cached one.
+        """
+        first = token_cache.get(self.token.key)
+        self._token_queries()
+
+        first_user, _ = token_cache.get(self.token.key)
+        first_user.username = 'changed'
+        second_user, token = token_cache.get(self.token.key)
+
+        self.assertIsNone(first)
+        self.assertEqual(second_user.username, 'bizuser')
+        self.assertIs(token.user, second_user)
+
+
+class TokenCacheTest(SimpleTestCase):
+    """
+    Tests for the LRU and TTL behaviour of TokenCache.
+    """
+
+    def _entry(self, pk):
+        user = User(pk=pk, username=f'user{pk}')
+        return user, Token(key=f'key{pk}', user=user)
+
+    def test_lru_eviction(self):
+        """
+        Test that the least recently used entry is evicted first.
+        """
+        cache = TokenCache(maxsize=2, ttl=60)
+        for pk in (1, 2):
+            cache.set(f'key{pk}', *self._entry(pk))
+        cache.get('key1')
+        cache.set('key3', *self._entry(3))
+
+        self.assertIsNotNone(cache.get('key1'))
+        self.assertIsNone(cache.get('key2'))
+        self.assertEqual(cache.stats()['size'], 2)
+
+    def test_ttl_expiry(self):
+        """
+        Test that entries expire after the TTL.
+        """
+        cache = TokenCache(maxsize=10, ttl=60)
+        with mock.patch('accounts.authentication.time.monotonic', return_value=1000.0):
+            cache.set('key1', *self._entry(1))
+        with mock.patch('accounts.authentication.time.monotonic', return_value=1059.0):
+            self.assertIsNotNone(cache.get('key1'))
+        with mock.patch('accounts.authentication.time.monotonic', return_value=1061.0):
+            self.assertIsNone(cache.get('key1'))
+
+    def test_invalidate_user(self):
+        """
+        Test that all keys of one user are dropped together.
+        """
+        cache = TokenCache(maxsize=10, ttl=60)
+        user, _ = self._entry(1)
+        cache.set('a', user, Token(key='a', user=user))
+        cache.set('b', user, Token(key='b', user=user))
+        cache.set('c', *self._entry(2))
+
+        cache.invalidate_user(1)
+
+        self.assertEqual(cache.stats()['size'], 1)
+        self.assertIsNotNone(cache.get('c'))
@@ -0,0 +1,240 @@
+"""
+Signed stateless tokens.
+
+With ``AUTH_TOKEN_MODE = 'signed'`` login and registration issue an
+HMAC-signed access token (django.core.signing, keyed by SECRET_KEY)
+instead of a row in ``authtoken_token``. The access token carries the
+user id, type and active flag and its issue time; verifying it is pure
+CPU and needs no query. Access tokens are short-lived
+(``SIGNED_TOKEN_ACCESS_TTL``) and cannot be revoked individually.
+
+A refresh token with a longer lifetime (``SIGNED_TOKEN_REFRESH_TTL``)
+is handed out in an HttpOnly cookie, so the login/registration
+response body keeps its shape. It carries the user's token generation
+(TokenGeneration). Refreshing checks the user and the generation in one
+query and hands out a new refresh token with a fresh lifetime. Logging
+out bumps the generation, which revokes all refresh tokens of the user
+at once; stored state grows with the users who logged out, not with
+refresh traffic.
+"""
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core import signing
+from django.db import router
+from django.db.models import IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from rest_framework.authtoken.models import Token
+from rest_framework.response import Response
+
+from .models import TokenGeneration
+
+ACCESS_SALT = 'accounts.tokens.access'
+REFRESH_SALT = 'accounts.tokens.refresh'
+
+User = get_user_model()
+
+
+def signed_mode():
+    """
+    Return True if login and registration issue signed tokens.
+    """
+    return getattr(settings, 'AUTH_TOKEN_MODE', 'db') == 'signed'
+
+
+def is_signed(key):
+    """
+    Tell a signed token from a 40-character authtoken key.
+
+    Signed tokens always contain the ':' separator of django.core.signing.
+    """
+    return ':' in key
+
+
+def issue_access_token(user):
+    """
+    Create a signed access token for a user.
+
+    Args:
+        user (User): Authenticated user.
+
+    Returns:
+        str: Token for the ``Authorization: Token <token>`` header.
+    """
+    return signing.dumps(
+        {'u': user.pk, 't': user.type, 'a': user.is_active}, salt=ACCESS_SALT
+    )
+
+
+def verify_access_token(token):
+    """
+    Verify a signed access token without touching the database.
+
+    The returned user only has ``id``, ``type`` and ``is_active`` (as
+    of when the token was issued) loaded; other fields are deferred and
+    read from the database on first access.
+
+    Args:
+        token (str): Signed access token.
+
+    Returns:
+        User: User the token was issued to.
+
+    Raises:
+        signing.BadSignature: Token is invalid or expired
+            (signing.SignatureExpired).
+    """
+    payload = signing.loads(token, salt=ACCESS_SALT, max_age=settings.SIGNED_TOKEN_ACCESS_TTL)
+    loaded = {'id': payload['u'], 'type': payload['t'], 'is_active': payload['a']}
+    # from_db() takes the values in the order of the model's fields
+    names = [field.attname for field in User._meta.concrete_fields if field.attname in loaded]
+    return User.from_db(router.db_for_read(User), names, [loaded[name] for name in names])
+
+
+def issue_refresh_token(user, generation=None):
+    """
+    Create a signed refresh token in the user's current token generation.
+
+    Args:
+        user (User): Authenticated user.
+        generation (int): The user's token generation; read from the
+            database if None.
+
+    Returns:
+        str: Token for the refresh cookie.
+    """
+    if generation is None:
+        generation = TokenGeneration.objects.filter(user=user).values_list(
+            'generation', flat=True
+        ).first() or 0
+    return signing.dumps({'u': user.pk, 'g': generation}, salt=REFRESH_SALT)
+
+
+def _load_refresh_token(token):
+    """
+    Verify a refresh token and return its active user.
+
+    Reads the user and its token generation in one query.
+
+    Returns:
+        User: The user, with ``refresh_generation`` set.
+
+    Raises:
+        signing.BadSignature: Token is invalid, expired or revoked, or
+            its user is gone or inactive.
+    """
+    payload = signing.loads(token, salt=REFRESH_SALT, max_age=settings.SIGNED_TOKEN_REFRESH_TTL)
+    generation = TokenGeneration.objects.filter(user=OuterRef('pk')).values('generation')
+    user = (
+        User.objects
+        .filter(pk=payload['u'], is_active=True)
+        .annotate(refresh_generation=Coalesce(
+            Subquery(generation), Value(0), output_field=IntegerField()
+        ))
+        .first()
+    )
+    if user is None:
+        raise signing.BadSignature('User inactive or deleted.')
+    if user.refresh_generation != payload['g']:
+        raise signing.BadSignature('Refresh token has been revoked.')
+    return user
+
+
+def revoke_refresh_token(token):
+    """
+    Revoke every refresh token of the token's user (logout).
+
+    Bumps the user's token generation if ``token`` is still current, so
+    replaying an already revoked token changes nothing.
+
+    Raises:
+        signing.BadSignature: Token is invalid, expired or already revoked.
+    """
+    user = _load_refresh_token(token)
+    generation = user.refresh_generation
+    if generation:
+        TokenGeneration.objects.filter(user=user, generation=generation).update(
+            generation=generation + 1
+        )
+    else:
+        # A row created concurrently means the generation has moved on already
+        TokenGeneration.objects.bulk_create(
+            [TokenGeneration(user=user, generation=1)], ignore_conflicts=True
+        )
+
+
+def refresh_tokens(token):
+    """
+    Exchange a refresh token for a new access token and refresh token.
+
+    The new refresh token has a fresh lifetime; both stay valid until
+    they expire or the user logs out.
+
+    Args:
+        token (str): Signed refresh token.
+
+    Returns:
+        tuple: (user, access token, refresh token).
+
+    Raises:
+        signing.BadSignature: Token is invalid, expired, revoked, or
+            its user is gone or inactive.
+    """
+    user = _load_refresh_token(token)
+    refresh = issue_refresh_token(user, user.refresh_generation)
+    return user, issue_access_token(user), refresh
+
+
+def set_refresh_cookie(response, refresh):
+    """
+    Attach a refresh token to any HttpResponse as an HttpOnly cookie.
+    """
+    response.set_cookie(
+        settings.SIGNED_TOKEN_REFRESH_COOKIE,
+        refresh,
+        max_age=settings.SIGNED_TOKEN_REFRESH_TTL,
+        httponly=True,
+        secure=not settings.DEBUG,
+        samesite='Lax',
+    )
+    return response
+
+
+def issue_login_tokens(user):
+    """
+    Issue the tokens a login or registration hands out.
+
+    Args:
+        user (User): Authenticated user.
+
+    Returns:
+        tuple: (token for the response body, refresh token or None).
+            In signed mode the token is a signed access token and a
+            refresh token is issued; otherwise it is the authtoken key.
+    """
+    if signed_mode():
+        return issue_access_token(user), issue_refresh_token(user)
+    token, _ = Token.objects.get_or_create(user=user)
+    return token.key, None
+
+
+def login_response(user, data, status_code):
+    """
+    Build the login/registration response for the configured token mode.
+
+    ``data`` gets the ``token`` key; in signed mode the refresh token
+    is set as a cookie, otherwise the user's authtoken key is used.
+
+    Args:
+        user (User): Authenticated user.
+        data (dict): Response body without the token.
+        status_code (int): HTTP status of the response.
+
+    Returns:
+        Response: Response with the token added.
+    """
+    token, refresh = issue_login_tokens(user)
+    response = Response({'token': token, **data}, status=status_code)
+    if refresh is not None:
+        set_refresh_cookie(response, refresh)
+    return response
@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
+# Serve login/registration from async views that hash in a bounded pool
+os.environ.setdefault('AUTH_ASYNC_VIEWS', 'True')
 
 application = get_asgi_application()
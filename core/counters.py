@@ -0,0 +1,141 @@
+"""
+Building blocks for incrementally maintained counters.
+
+Counter tables (orders.counters, reviews.ratings, stats.counters) are
+kept up to date from model signals. Two pieces are the same for all of
+them:
+
+- ``upsert_increments`` adds deltas to counter rows keyed by some
+  columns and creates the missing rows, with one
+  ``INSERT ... ON CONFLICT DO UPDATE`` on SQLite and PostgreSQL.
+- ``remember_stored_values`` keeps the stored values of the counted
+  fields on every instance, so a post_save or post_delete handler knows
+  which counter the instance was counted in before the write.
+  ``loaded_values`` and ``saved_values`` read the values an instance
+  has loaded and has just written.
+"""
+
+from django.db import IntegrityError, connections, router, transaction
+from django.db.models import F
+from django.db.models.signals import post_init, pre_save
+
+# Backends that support INSERT ... ON CONFLICT DO UPDATE
+UPSERT_VENDORS = ('sqlite', 'postgresql')
+
+
+def upsert_increments(model, key_fields, value_fields, rows):
+    """
+    Add values to counter rows, creating rows that do not exist yet.
+
+    Runs in the caller's transaction. ``key_fields`` must be covered by
+    a unique constraint. Backends outside UPSERT_VENDORS get an UPDATE
+    per row and an INSERT for rows it did not find.
+
+    Args:
+        model (Model): Counter model.
+        key_fields (tuple): Column names identifying a row.
+        value_fields (tuple): Column names the values are added to.
+        rows (list): Tuples of key values followed by value deltas.
+    """
+    if not rows:
+        return
+    connection = connections[router.db_for_write(model)]
+    if connection.vendor in UPSERT_VENDORS:
+        _upsert(connection, model, key_fields, value_fields, rows)
+        return
+    width = len(key_fields)
+    for row in rows:
+        keys = dict(zip(key_fields, row[:width]))
+        values = dict(zip(value_fields, row[width:]))
+        counters = model._default_manager.filter(**keys)
+        update = {field: F(field) + delta for field, delta in values.items()}
+        if counters.update(**update):
+            continue
+        try:
+            with transaction.atomic(using=connection.alias):
+                model._default_manager.create(**keys, **values)
+        except IntegrityError:
+            # Created concurrently since the UPDATE above
+            counters.update(**update)
+
+
+def _upsert(connection, model, key_fields, value_fields, rows):
+    qn = connection.ops.quote_name
+    table = qn(model._meta.db_table)
+    keys = ', '.join(qn(field) for field in key_fields)
+    columns = ', '.join(qn(field) for field in key_fields + value_fields)
+    placeholder = '(' + ', '.join(['%s'] * (len(key_fields) + len(value_fields))) + ')'
+    assignments = ', '.join(
+        f'{qn(field)} = {table}.{qn(field)} + excluded.{qn(field)}' for field in value_fields
+    )
+    sql = (
+        f'INSERT INTO {table} ({columns}) VALUES {", ".join([placeholder] * len(rows))} '
+        f'ON CONFLICT ({keys}) DO UPDATE SET {assignments}'
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [value for row in rows for value in row])
+
+
+def loaded_values(instance, fields):
+    """
+    Return the values of ``fields`` loaded on an instance.
+
+    Returns:
+        tuple | None: The values, or None if any of the fields is deferred.
+    """
+    values = instance.__dict__
+    if all(field in values for field in fields):
+        return tuple(values[field] for field in fields)
+    return None
+
+
+def saved_values(instance, fields, old):
+    """
+    Return the values of ``fields`` an instance was just saved with.
+
+    Fields that were not loaded, and so not written, keep their value
+    from ``old``.
+
+    Args:
+        instance (Model): The saved instance.
+        fields (tuple): Field attribute names.
+        old (tuple): Stored values before the save, or None for an insert.
+
+    Returns:
+        tuple | None: The values, or None if none of the fields was loaded.
+    """
+    values = instance.__dict__
+    if not any(field in values for field in fields):
+        return None
+    return tuple(
+        values.get(field, old and old[index]) for index, field in enumerate(fields)
+    )
+
+
+def remember_stored_values(model, attribute, fields):
+    """
+    Keep the stored values of ``fields`` on every instance of ``model``.
+
+    Connects a post_init receiver that sets ``attribute`` to the loaded
+    values (None for new instances and for instances loaded with one of
+    the fields deferred), and a pre_save receiver that looks the stored
+    values up if they are still unknown before an update. Handlers that
+    move an instance between counters set ``attribute`` to the saved
+    values after a write.
+
+    Args:
+        model (Model): Model whose instances are tracked.
+        attribute (str): Instance attribute holding the stored values.
+        fields (tuple): Field attribute names, e.g. ``('business_user_id', 'status')``.
+    """
+    def remember(sender, instance, **kwargs):
+        setattr(instance, attribute, loaded_values(instance, fields) if instance.pk else None)
+
+    def load(sender, instance, **kwargs):
+        if getattr(instance, attribute) is None and not instance._state.adding:
+            stored = model._default_manager.filter(pk=instance.pk).values_list(*fields).first()
+            setattr(instance, attribute, stored)
+
+    uid = f'{model._meta.label}.{attribute}'
+    post_init.connect(remember, sender=model, weak=False, dispatch_uid=uid)
+    pre_save.connect(load, sender=model, weak=False, dispatch_uid=uid)
@@ -0,0 +1,95 @@
+"""
+Bounded worker pool for password hashing in async views.
+
+PBKDF2 spends tens of milliseconds of CPU per call. Under ASGI, sync
+views share one thread (``thread_sensitive``), so a burst of logins
+run there blocks every other request. The async login/registration
+views (accounts.api.async_views) hand the hashing to this pool instead
+and await it, leaving the event loop and the sync thread free for
+other traffic.
+
+hashlib.pbkdf2_hmac releases the GIL, so threads hash in parallel and
+no process pool is needed. ``PASSWORD_HASHING_WORKERS`` threads run
+jobs; at most ``PASSWORD_HASHING_QUEUE_SIZE`` more may wait. Beyond
+that ``run_in_pool`` raises PoolBusy right away, and a job that does
+not finish within ``PASSWORD_HASHING_TIMEOUT`` seconds raises
+PoolTimeout, so callers can answer 503 instead of piling up.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections
+
+_executor = None
+_slots = None
+_pool_lock = threading.Lock()
+
+
+class PoolBusy(Exception):
+    """
+    Raised when the pool and its queue are full.
+    """
+
+
+class PoolTimeout(Exception):
+    """
+    Raised when a job does not finish within the timeout.
+    """
+
+
+async def run_in_pool(func, *args, **kwargs):
+    """
+    Run ``func(*args, **kwargs)`` in the hashing pool and await the result.
+
+    Jobs may query the database (e.g. authenticate()); each worker
+    closes obsolete connections after a job, as a request would.
+
+    Args:
+        func (callable): Blocking function to run.
+        *args: Positional arguments for func.
+        **kwargs: Keyword arguments for func.
+
+    Returns:
+        Whatever func returns.
+
+    Raises:
+        PoolBusy: All workers and queue slots are taken.
+        PoolTimeout: The job took longer than PASSWORD_HASHING_TIMEOUT.
+    """
+    executor, slots = _get_pool()
+    if not slots.acquire(blocking=False):
+        raise PoolBusy()
+    try:
+        future = executor.submit(_call, func, args, kwargs)
+    except BaseException:
+        slots.release()
+        raise
+    future.add_done_callback(lambda _: slots.release())
+    try:
+        # On timeout wait_for cancels the future, which drops a job that
+        # is still queued; a running job finishes and frees its slot then.
+        return await asyncio.wait_for(
+            asyncio.wrap_future(future), settings.PASSWORD_HASHING_TIMEOUT
+        )
+    except asyncio.TimeoutError:
+        raise PoolTimeout()
+
+
+def _call(func, args, kwargs):
+    try:
+        return func(*args, **kwargs)
+    finally:
+        close_old_connections()
+
+
+def _get_pool():
+    global _executor, _slots
+    with _pool_lock:
+        if _executor is None:
+            workers = settings.PASSWORD_HASHING_WORKERS
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='password-hashing')
+            _slots = threading.BoundedSemaphore(workers + settings.PASSWORD_HASHING_QUEUE_SIZE)
+    return _executor, _slots
@@ -0,0 +1,105 @@
+"""
+Management command that benchmarks per-request connection overhead with and without reuse.
+"""
+
+import statistics
+import time
+
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.backends.signals import connection_created
+from django.test import RequestFactory, override_settings
+
+# name: (CONN_MAX_AGE, CONN_HEALTH_CHECKS)
+PROFILES = {
+    'no reuse': (0, False),
+    'reuse': (60, False),
+    'reuse + health checks': (60, True),
+}
+
+
+class Command(BaseCommand):
+    """
+    Send GET requests through Django's WSGI handler, once per connection profile.
+
+    Unlike the test client, the WSGI handler sends request_started and
+    request_finished with close_old_connections connected, so the
+    database connection is opened and closed exactly as under a real
+    server. Connections opened during a run are counted with
+    connection_created. Runs against the configured database
+    (DATABASE_URL) and only reads.
+    """
+
+    help = 'Benchmark per-request database connection overhead with CONN_MAX_AGE 0 and > 0.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=2000, help='Requests per profile.')
+        parser.add_argument('--path', default='/api/base-info/', help='Path to request.')
+
+    def handle(self, *args, **options):
+        """
+        Run every profile and print latency per request and connections opened.
+        """
+        self.stdout.write(
+            f"{connection.vendor}: {options['requests']} x GET {options['path']} per profile"
+        )
+        settings_dict = connection.settings_dict
+        saved = settings_dict['CONN_MAX_AGE'], settings_dict['CONN_HEALTH_CHECKS']
+        handler = WSGIHandler()
+        environ = RequestFactory().get(options['path']).environ
+        try:
+            with override_settings(ALLOWED_HOSTS=['testserver']):
+                self._request(handler, environ)
+                for name, (max_age, health_checks) in PROFILES.items():
+                    # Read by the connection when it is opened
+                    connection.close()
+                    settings_dict['CONN_MAX_AGE'] = max_age
+                    settings_dict['CONN_HEALTH_CHECKS'] = health_checks
+                    self._report(name, *self._run(handler, environ, options['requests']))
+        finally:
+            connection.close()
+            settings_dict['CONN_MAX_AGE'], settings_dict['CONN_HEALTH_CHECKS'] = saved
+
+    def _request(self, handler, environ):
+        """
+        Run one request through the handler and consume the response.
+        """
+        statuses = []
+        response = handler(dict(environ), lambda status, headers: statuses.append(status))
+        try:
+            b''.join(response)
+        finally:
+            # Sends request_finished
+            response.close()
+        if not statuses[0].startswith('200'):
+            raise RuntimeError(f"GET {environ['PATH_INFO']} returned {statuses[0]}")
+
+    def _run(self, handler, environ, requests):
+        """
+        Time ``requests`` requests and count the connections they opened.
+        """
+        opened = []
+
+        def count(sender, connection, **kwargs):
+            opened.append(connection.alias)
+
+        latencies = []
+        connection_created.connect(count)
+        try:
+            for _ in range(requests):
+                start = time.perf_counter()
+                self._request(handler, environ)
+                latencies.append(time.perf_counter() - start)
+        finally:
+            connection_created.disconnect(count)
+        return latencies, len(opened)
+
+    def _report(self, name, latencies, opened):
+        latency_ms = sorted(t * 1000 for t in latencies)
+        p95 = latency_ms[max(int(len(latency_ms) * 0.95) - 1, 0)]
+        self.stdout.write(
+            f'  {name:21}: mean {statistics.fmean(latency_ms):6.3f} ms, p50 '
+            f'{statistics.median(latency_ms):6.3f} ms, p95 {p95:6.3f} ms | '
+            f'connections opened {opened}'
+        )
@@ -0,0 +1,172 @@
+"""
+Management command that benchmarks concurrent SQLite reads and writes per pragma profile.
+"""
+
+import os
+import random
+import shutil
+import sqlite3
+import statistics
+import tempfile
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.sqlite import apply_pragmas
+
+# Django opens SQLite with the sqlite3 module defaults: a 5 second lock
+# timeout and no pragmas
+DEFAULT_TIMEOUT = 5.0
+
+
+class Command(BaseCommand):
+    """
+    Run readers and writers against a scratch database, once per profile.
+
+    ``default`` is what Django gets without core.sqlite (rollback
+    journal, synchronous=FULL); ``tuned`` applies settings.SQLITE_PRAGMAS.
+    Readers page through one business user's orders the way the order
+    list does; writers insert an order and update another in one
+    transaction. Each thread has its own connection. The project
+    database is never touched.
+    """
+
+    help = 'Benchmark concurrent SQLite reads/writes with default and tuned pragmas.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--duration', type=float, default=5.0, help='Seconds per profile.')
+        parser.add_argument('--readers', type=int, default=8, help='Reader threads.')
+        parser.add_argument('--writers', type=int, default=2, help='Writer threads.')
+        parser.add_argument('--rows', type=int, default=20000, help='Seeded rows.')
+        parser.add_argument(
+            '--dir', help='Directory for the scratch database (default: a temporary directory).'
+        )
+
+    def handle(self, *args, **options):
+        """
+        Run every profile and print throughput, latency and lock errors.
+        """
+        profiles = {'default': {}, 'tuned': settings.SQLITE_PRAGMAS}
+        directory = tempfile.mkdtemp(dir=options['dir'])
+        try:
+            self.stdout.write(
+                f"{options['readers']} readers, {options['writers']} writers, "
+                f"{options['duration']:.0f} s per profile, {options['rows']} rows"
+            )
+            for name, pragmas in profiles.items():
+                path = os.path.join(directory, f'{name}.sqlite3')
+                self._seed(path, pragmas, options['rows'])
+                self._report(name, self._run(path, pragmas, options))
+        finally:
+            shutil.rmtree(directory)
+
+    def _connect(self, path, pragmas):
+        connection = sqlite3.connect(
+            path, timeout=DEFAULT_TIMEOUT, isolation_level=None, check_same_thread=False
+        )
+        apply_pragmas(connection, pragmas)
+        return connection
+
+    def _seed(self, path, pragmas, rows):
+        """
+        Create the scratch table with its list index and ``rows`` orders.
+        """
+        connection = self._connect(path, pragmas)
+        connection.executescript(
+            'CREATE TABLE bench_order ('
+            ' id INTEGER PRIMARY KEY, business_user_id INTEGER NOT NULL,'
+            ' status TEXT NOT NULL, title TEXT NOT NULL, created_at REAL NOT NULL);'
+            'CREATE INDEX bench_order_business_idx ON bench_order (business_user_id, created_at);'
+        )
+        connection.execute('BEGIN')
+        connection.executemany(
+            'INSERT INTO bench_order (business_user_id, status, title, created_at) VALUES (?, ?, ?, ?)',
+            ((i % 100, 'pending', f'Order {i}', float(i)) for i in range(rows))
+        )
+        connection.execute('COMMIT')
+        connection.close()
+
+    def _run(self, path, pragmas, options):
+        """
+        Run all threads for ``duration`` seconds and collect their results.
+        """
+        stop = threading.Event()
+        lock = threading.Lock()
+        results = {'read': [], 'write': [], 'errors': 0}
+
+        def reader():
+            connection = self._connect(path, pragmas)
+            own, errors = [], 0
+            while not stop.is_set():
+                start = time.perf_counter()
+                try:
+                    connection.execute(
+                        'SELECT id, title, status FROM bench_order WHERE business_user_id = ? '
+                        'ORDER BY created_at DESC LIMIT 20', (random.randrange(100),)
+                    ).fetchall()
+                except sqlite3.OperationalError:
+                    errors += 1
+                    continue
+                own.append(time.perf_counter() - start)
+            connection.close()
+            with lock:
+                results['read'].extend(own)
+                results['errors'] += errors
+
+        def writer():
+            connection = self._connect(path, pragmas)
+            own, errors = [], 0
+            while not stop.is_set():
+                start = time.perf_counter()
+                try:
+                    connection.execute('BEGIN')
+                    connection.execute(
+                        'INSERT INTO bench_order (business_user_id, status, title, created_at) '
+                        'VALUES (?, ?, ?, ?)',
+                        (random.randrange(100), 'pending', 'Benchmark', time.time())
+                    )
+                    connection.execute(
+                        "UPDATE bench_order SET status = 'in_progress' WHERE id = ?",
+                        (random.randrange(1, options['rows']),)
+                    )
+                    connection.execute('COMMIT')
+                except sqlite3.OperationalError:
+                    errors += 1
+                    if connection.in_transaction:
+                        connection.execute('ROLLBACK')
+                    continue
+                own.append(time.perf_counter() - start)
+            connection.close()
+            with lock:
+                results['write'].extend(own)
+                results['errors'] += errors
+
+        threads = [threading.Thread(target=reader) for _ in range(options['readers'])]
+        threads += [threading.Thread(target=writer) for _ in range(options['writers'])]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        time.sleep(options['duration'])
+        stop.set()
+        for thread in threads:
+            thread.join()
+        results['elapsed'] = time.perf_counter() - start
+        return results
+
+    def _report(self, name, results):
+        elapsed = results['elapsed']
+        self.stdout.write(f'  {name}:')
+        for kind in ('read', 'write'):
+            latency_ms = sorted(t * 1000 for t in results[kind])
+            if not latency_ms:
+                self.stdout.write(f'    {kind}s: none completed')
+                continue
+            p95 = latency_ms[max(int(len(latency_ms) * 0.95) - 1, 0)]
+            self.stdout.write(
+                f'    {kind + "s":6} {len(latency_ms) / elapsed:9.0f}/s | latency p50 '
+                f'{statistics.median(latency_ms):7.2f} ms, p95 {p95:7.2f} ms, '
+                f'max {latency_ms[-1]:8.2f} ms'
+            )
+        self.stdout.write(f"    lock errors: {results['errors']}")
@@ -0,0 +1,117 @@
+"""
+Management command that benchmarks concurrent API writes with and without the write queue.
+"""
+
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, connection, connections
+from django.test import override_settings
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from core.write_queue import write_queue
+
+User = get_user_model()
+
+OFFER = {
+    'title': 'Benchmark offer',
+    'description': 'Benchmark',
+    'details': [
+        {'title': 'Basic', 'revisions': 1, 'delivery_time_in_days': 5,
+         'price': '100.00', 'features': ['A'], 'offer_type': 'basic'},
+        {'title': 'Premium', 'revisions': 3, 'delivery_time_in_days': 2,
+         'price': '300.00', 'features': ['A', 'B'], 'offer_type': 'premium'},
+    ],
+}
+
+
+class Command(BaseCommand):
+    """
+    POST offers from many threads, once writing directly and once through the queue.
+
+    Every thread has its own business user, token and database
+    connection and posts through the full DRF stack, so the writes
+    contend for SQLite's write lock exactly as under a threaded server.
+    Seeded users and their offers are deleted at the end.
+    """
+
+    help = 'Benchmark tail latency of concurrent offer creation with the SQLite write queue.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=32, help='Concurrent writers.')
+        parser.add_argument('--offers', type=int, default=20, help='Offers per writer and run.')
+
+    def handle(self, *args, **options):
+        """
+        Seed business users, then run without and with the write queue.
+        """
+        if connection.vendor != 'sqlite':
+            raise CommandError('The write queue only applies to SQLite.')
+        users = User.objects.bulk_create([
+            User(username=f'benchmark-writes-{i}', type='business')
+            for i in range(options['threads'])
+        ])
+        try:
+            self.tokens = [Token.objects.create(user=user).key for user in users]
+            self.stdout.write(
+                f"{options['threads']} writers x {options['offers']} offers per run"
+            )
+            for queued in (False, True):
+                with override_settings(ALLOWED_HOSTS=['testserver'], SQLITE_WRITE_QUEUE=queued):
+                    result = self._run(options['threads'], options['offers'])
+                    write_queue.stop()
+                self._report('write queue' if queued else 'direct', *result)
+        finally:
+            User.objects.filter(pk__in=[user.pk for user in users]).delete()
+
+    def _run(self, threads, offers):
+        """
+        Let every thread post ``offers`` offers and time each request.
+        """
+        latencies, errors = [], []
+        lock = threading.Lock()
+        barrier = threading.Barrier(threads)
+
+        def worker(index):
+            client = APIClient()
+            client.credentials(HTTP_AUTHORIZATION=f'Token {self.tokens[index]}')
+            own, failed = [], 0
+            try:
+                barrier.wait()
+                for _ in range(offers):
+                    start = time.perf_counter()
+                    try:
+                        response = client.post('/api/offers/', OFFER, format='json')
+                        ok = response.status_code == 201
+                    except DatabaseError:
+                        ok = False
+                    own.append(time.perf_counter() - start)
+                    failed += not ok
+            finally:
+                connections.close_all()
+            with lock:
+                latencies.extend(own)
+                errors.append(failed)
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            for future in [executor.submit(worker, i) for i in range(threads)]:
+                future.result()
+        return time.perf_counter() - start, latencies, sum(errors)
+
+    def _report(self, name, elapsed, latencies, errors):
+        latency_ms = sorted(t * 1000 for t in latencies)
+
+        def percentile(p):
+            return latency_ms[max(int(len(latency_ms) * p) - 1, 0)]
+
+        self.stdout.write(
+            f'  {name:11}: {len(latency_ms) / elapsed:6.0f} offers/s | latency p50 '
+            f'{statistics.median(latency_ms):7.1f} ms, p95 {percentile(0.95):7.1f} ms, '
+            f'p99 {percentile(0.99):7.1f} ms, max {latency_ms[-1]:7.1f} ms | errors {errors}'
+        )
@@ -0,0 +1,269 @@
+"""
+Shared pagination classes for the API.
+"""
+
+import json
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, Cursor
+
+
+class KeysetCursorPagination(CursorPagination):
+    """
+    Cursor pagination over a composite, unique sort key.
+
+    DRF's CursorPagination only stores the first ordering field in the
+    cursor and resolves ties with an OFFSET. This class stores every
+    ordering field instead and filters with a lexicographic
+    ``(a < x) OR (a = x AND b > y)`` condition, so each page is a plain
+    index range scan: no COUNT(*) and no OFFSET, however deep the page.
+
+    The ordering always ends with ``id`` to make the key unique. NULLs in
+    nullable ordering fields sort as the largest value in both directions.
+    """
+
+    ordering = ('-created_at', 'id')
+    page_size = settings.API_PAGE_SIZE
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+    def get_ordering(self, request, queryset, view):
+        """
+        Return the configured ordering with ``id`` as the final tiebreaker.
+        """
+        ordering = super().get_ordering(request, queryset, view)
+        if not any(field.lstrip('-') in ('id', 'pk') for field in ordering):
+            ordering = ordering + ('id',)
+        return ordering
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Return one page of results starting after the cursor position.
+
+        Args:
+            queryset (QuerySet): Unordered or default-ordered queryset.
+            request (Request): Incoming request carrying the cursor.
+            view (APIView): The calling view.
+
+        Returns:
+            list: Model instances for the requested page.
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+
+        if self.cursor is None:
+            reverse, position = False, None
+        else:
+            reverse, position = self.cursor.reverse, self.cursor.position
+
+        ordering = _reverse_ordering(self.ordering) if reverse else self.ordering
+        values = None if position is None else self._decode_position(queryset, position)
+
+        results = self.fetch_page(queryset, ordering, values, view)
+        has_following = len(results) > self.page_size
+        self.page = results[:self.page_size]
+
+        if reverse:
+            self.page.reverse()
+            self.has_next = position is not None
+            self.has_previous = has_following
+        else:
+            self.has_next = has_following
+            self.has_previous = position is not None
+
+        return self.page
+
+    def fetch_page(self, queryset, ordering, values, view):
+        """
+        Fetch up to page_size + 1 rows following the sort key ``values``.
+
+        Args:
+            queryset (QuerySet): Filtered queryset of the view.
+            ordering (tuple): Ordering in fetch direction.
+            values (list): Decoded cursor position, or None for the first page.
+            view (APIView): The calling view.
+
+        Returns:
+            list: Rows in ``ordering`` order.
+        """
+        return list(_page_queryset(queryset, ordering, values)[:self.page_size + 1])
+
+    def get_next_link(self):
+        """
+        Return the URL of the page after the current one, if any.
+        """
+        if not self.has_next or not self.page:
+            return None
+        position = self._get_position_from_instance(self.page[-1], self.ordering)
+        return self.encode_cursor(Cursor(offset=0, reverse=False, position=position))
+
+    def get_previous_link(self):
+        """
+        Return the URL of the page before the current one, if any.
+        """
+        if not self.has_previous or not self.page:
+            return None
+        position = self._get_position_from_instance(self.page[0], self.ordering)
+        return self.encode_cursor(Cursor(offset=0, reverse=True, position=position))
+
+    def _get_position_from_instance(self, instance, ordering):
+        """
+        Serialize the full sort key of an instance into an opaque string.
+        """
+        values = []
+        for field in ordering:
+            name = field.lstrip('-')
+            if isinstance(instance, dict):
+                value = instance[name]
+            else:
+                value = getattr(instance, name)
+            values.append(None if value is None else str(value))
+        return json.dumps(values)
+
+    def _decode_position(self, queryset, position):
+        """
+        Parse a cursor position back into typed values for each ordering field.
+
+        Raises:
+            NotFound: If the position is malformed.
+        """
+        try:
+            raw_values = json.loads(position)
+            if len(raw_values) != len(self.ordering):
+                raise ValueError
+            values = []
+            for field, raw in zip(self.ordering, raw_values):
+                name = field.lstrip('-')
+                values.append(None if raw is None else _get_field(queryset, name).to_python(raw))
+        except Exception:
+            raise NotFound(self.invalid_cursor_message)
+        return values
+
+
+class UnionKeysetCursorPagination(KeysetCursorPagination):
+    """
+    Keyset pagination over the UNION of several querysets of one model.
+
+    ``a OR b`` on two indexed columns, sorted, usually cannot use either
+    index for the sort. The view instead returns one branch per index
+    from ``get_union_branches(queryset)``; every branch gets the keyset
+    condition, its own ORDER BY and LIMIT, so each is an index-ordered
+    scan that stops after one page. The UNION of those short lists is
+    sorted and cut to the page size.
+    """
+
+    def fetch_page(self, queryset, ordering, values, view):
+        """
+        Fetch one page as a UNION of the view's index-ordered branches.
+        """
+        limit = self.page_size + 1
+        branches = [
+            _page_queryset(branch, ordering, values)[:limit]
+            for branch in view.get_union_branches(queryset)
+        ]
+        compiled = [branch.query.get_compiler(queryset.db).as_sql() for branch in branches]
+        connection = connections[queryset.db]
+        qn = connection.ops.quote_name
+        meta = queryset.model._meta
+        order_by = ', '.join(
+            f'{qn(_get_field(queryset, field.lstrip("-")).column)} '
+            f'{"DESC" if field.startswith("-") else "ASC"}'
+            for field in ordering
+        )
+        # LIMIT inside a compound SELECT needs a derived table on SQLite
+        sql = ' UNION '.join(
+            f'SELECT * FROM ({branch_sql}) AS {qn(f"branch_{i}")}'
+            for i, (branch_sql, _) in enumerate(compiled)
+        )
+        sql = f'{sql} ORDER BY {order_by} LIMIT {int(limit)}'
+        params = [param for _, branch_params in compiled for param in branch_params]
+        return list(meta.model.objects.db_manager(queryset.db).raw(sql, params))
+
+
+def _page_queryset(queryset, ordering, values):
+    """
+    Order a queryset by ``ordering`` and keep the rows after ``values``.
+    """
+    queryset = queryset.order_by(*_order_by(queryset, ordering))
+    if values is not None:
+        queryset = queryset.filter(_keyset_filter(queryset, ordering, values))
+    return queryset
+
+
+def _get_field(queryset, name):
+    """
+    Return the model field or annotation output field for an ordering name.
+    """
+    if name in queryset.query.annotations:
+        return queryset.query.annotations[name].output_field
+    meta = queryset.model._meta
+    return meta.pk if name == 'pk' else meta.get_field(name)
+
+
+def _order_by(queryset, ordering):
+    """
+    Turn an ordering tuple into order_by() arguments.
+
+    Nullable fields get explicit NULLS LAST (ascending) or NULLS FIRST
+    (descending) so every backend agrees with _keyset_filter; non-null
+    fields stay plain strings so their indexes remain usable.
+    """
+    expressions = []
+    for field in ordering:
+        name = field.lstrip('-')
+        if not _get_field(queryset, name).null:
+            expressions.append(field)
+        elif field.startswith('-'):
+            expressions.append(F(name).desc(nulls_first=True))
+        else:
+            expressions.append(F(name).asc(nulls_last=True))
+    return expressions
+
+
+def _reverse_ordering(ordering):
+    """
+    Flip the direction of every field in an ordering tuple.
+    """
+    return tuple(
+        field[1:] if field.startswith('-') else '-' + field
+        for field in ordering
+    )
+
+
+def _keyset_filter(queryset, ordering, values):
+    """
+    Build the lexicographic "strictly after" condition for a sort key.
+
+    For ``('-created_at', 'id')`` and values ``(c, i)`` this produces
+    ``created_at < c OR (created_at = c AND id > i)``.
+    """
+    condition = Q(pk__in=[])
+    equal = Q()
+    for field, value in zip(ordering, values):
+        name = field.lstrip('-')
+        descending = field.startswith('-')
+        nullable = _get_field(queryset, name).null
+
+        if value is None:
+            # NULL is the largest value: nothing follows it ascending,
+            # every non-NULL value follows it descending.
+            after = Q(**{f'{name}__isnull': False}) if descending else Q(pk__in=[])
+            same = Q(**{f'{name}__isnull': True})
+        else:
+            after = Q(**{f'{name}__{"lt" if descending else "gt"}': value})
+            if nullable and not descending:
+                after |= Q(**{f'{name}__isnull': True})
+            same = Q(**{name: value})
+
+        condition |= equal & after
+        equal &= same
+    return condition
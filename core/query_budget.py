@@ -0,0 +1,124 @@
+"""
+Per-endpoint query budgets.
+
+A view declares the maximum number of SQL queries each HTTP method may
+run through the ``query_budget`` attribute. ``QueryBudgetMixin`` counts
+the queries of every request and reports overruns; ``QueryBudgetTestMixin``
+gives tests an assertion that reads the same attribute, so the budget
+lives in exactly one place.
+"""
+
+import logging
+
+from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(Exception):
+    """
+    Raised in strict mode when a request runs more queries than allowed.
+    """
+
+
+class QueryCounter:
+    """
+    Database execute wrapper that counts executed statements.
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def get_query_budget(view_class, method):
+    """
+    Return the budget a view declares for an HTTP method.
+
+    Args:
+        view_class (type): The view class.
+        method (str): HTTP method name, e.g. 'GET'.
+
+    Returns:
+        int | None: Maximum query count, or None if no budget is declared.
+    """
+    budget = getattr(view_class, 'query_budget', None)
+    if isinstance(budget, dict):
+        return budget.get(method.upper())
+    return budget
+
+
+class QueryBudgetMixin:
+    """
+    View mixin that enforces ``query_budget`` on every request.
+
+    ``query_budget`` is either an int applied to all methods or a dict
+    mapping HTTP method to its maximum query count. Overruns are logged;
+    with ``QUERY_BUDGET_STRICT = True`` they raise QueryBudgetExceeded.
+    """
+
+    query_budget = None
+
+    def dispatch(self, request, *args, **kwargs):
+        """
+        Run the request while counting its queries.
+        """
+        budget = get_query_budget(type(self), request.method)
+        if budget is None:
+            return super().dispatch(request, *args, **kwargs)
+
+        counter = QueryCounter()
+        with connection.execute_wrapper(counter):
+            response = super().dispatch(request, *args, **kwargs)
+
+        if counter.count > budget:
+            message = (
+                f"{type(self).__name__} {request.method} ran {counter.count} "
+                f"queries (budget {budget})"
+            )
+            if getattr(settings, 'QUERY_BUDGET_STRICT', False):
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
+        return response
+
+
+class QueryBudgetTestMixin:
+    """
+    TestCase mixin with an assertion against the view's declared budget.
+    """
+
+    def assertWithinQueryBudget(self, method, url, data=None, **extra):
+        """
+        Issue a request and fail if it runs more queries than the view allows.
+
+        Args:
+            method (str): HTTP method, e.g. 'get' or 'patch'.
+            url (str): Request path.
+            data (dict): Optional request body.
+            **extra: Passed through to the test client.
+
+        Returns:
+            Response: The response, for further assertions.
+        """
+        view_class = resolve(url.split('?')[0]).func.view_class
+        budget = get_query_budget(view_class, method)
+        self.assertIsNotNone(
+            budget, f"{view_class.__name__} declares no query budget for {method.upper()}"
+        )
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = getattr(self.client, method.lower())(url, data, **extra)
+
+        self.assertLessEqual(
+            len(ctx.captured_queries), budget,
+            f"{view_class.__name__} {method.upper()} ran {len(ctx.captured_queries)} "
+            f"queries (budget {budget}):\n"
+            + "\n".join(q['sql'] for q in ctx.captured_queries)
+        )
+        return response
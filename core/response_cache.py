@@ -0,0 +1,156 @@
+"""
+Versioned server-side response cache for public read endpoints.
+
+Cached responses live under a namespace whose version number is part of
+every cache key. Writes bump the version instead of deleting keys, so a
+single ``incr`` invalidates every cached page at once and stale entries
+simply age out. Works with any Django cache backend that supports
+``add``/``incr`` (local-memory, file-based, Redis, Memcached).
+
+The version and the hit/miss counters live in the cache, so they are
+shared between worker processes only if the backend is. With the
+per-process local-memory backend a write in one worker would not
+invalidate the other workers' pages; settings.RESPONSE_CACHE_ENABLED
+is therefore off by default for it.
+"""
+
+import hashlib
+import time
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from rest_framework.response import Response
+
+
+def _cache():
+    return caches[getattr(settings, 'RESPONSE_CACHE_ALIAS', 'default')]
+
+
+def _version_key(namespace):
+    return f'respcache:{namespace}:version'
+
+
+def _stat_key(namespace, name):
+    return f'respcache:{namespace}:{name}'
+
+
+def _incr(key):
+    """
+    Increment a counter, creating it if it is missing or was evicted.
+    """
+    cache = _cache()
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.add(key, 0, timeout=None)
+        return cache.incr(key)
+
+
+def get_version(namespace):
+    """
+    Return the current version of a namespace.
+
+    A missing version (first use, or evicted by the backend) starts at
+    the current time in milliseconds, so it can never fall back to a
+    number that older cached entries were stored under.
+    """
+    cache = _cache()
+    version = cache.get(_version_key(namespace))
+    if version is None:
+        cache.add(_version_key(namespace), int(time.time() * 1000), timeout=None)
+        version = cache.get(_version_key(namespace))
+    return version
+
+
+def bump_version(namespace):
+    """
+    Invalidate every cached response of a namespace.
+
+    Bumps now and again after the surrounding transaction commits, so a
+    reader cannot cache pre-commit data under the new version.
+    """
+    def bump():
+        get_version(namespace)
+        _incr(_version_key(namespace))
+
+    bump()
+    transaction.on_commit(bump)
+
+
+def get_stats(namespace):
+    """
+    Return hit/miss counters of a namespace.
+
+    Returns:
+        dict: ``hits``, ``misses`` and ``hit_rate`` (0.0 - 1.0).
+    """
+    cache = _cache()
+    hits = cache.get(_stat_key(namespace, 'hits'), 0)
+    misses = cache.get(_stat_key(namespace, 'misses'), 0)
+    total = hits + misses
+    return {'hits': hits, 'misses': misses, 'hit_rate': hits / total if total else 0.0}
+
+
+def reset_stats(namespace):
+    """
+    Reset hit/miss counters of a namespace.
+    """
+    _cache().delete_many([_stat_key(namespace, 'hits'), _stat_key(namespace, 'misses')])
+
+
+def build_cache_key(namespace, request):
+    """
+    Build a key from the namespace version, host, path and sorted query string.
+
+    Parameter order and repeated empty values do not create separate entries.
+    """
+    params = sorted(
+        (key, value)
+        for key, values in request.query_params.lists()
+        for value in values
+        if value != ''
+    )
+    raw = f'{request.get_host()}{request.path}?{urlencode(params)}'
+    digest = hashlib.sha1(raw.encode('utf-8')).hexdigest()
+    return f'respcache:{namespace}:{get_version(namespace)}:{digest}'
+
+
+class VersionedResponseCacheMixin:
+    """
+    View mixin that caches anonymous GET responses per namespace version.
+
+    Set ``cache_namespace`` on the view and call ``bump_version`` with the
+    same namespace whenever the underlying data changes. Authenticated
+    requests always bypass the cache.
+    """
+
+    cache_namespace = None
+
+    def get(self, request, *args, **kwargs):
+        """
+        Serve from cache on a hit, otherwise render and store the response.
+        """
+        if not self._cache_enabled(request):
+            return super().get(request, *args, **kwargs)
+
+        cache = _cache()
+        key = build_cache_key(self.cache_namespace, request)
+        data = cache.get(key)
+        if data is not None:
+            _incr(_stat_key(self.cache_namespace, 'hits'))
+            return Response(data)
+
+        _incr(_stat_key(self.cache_namespace, 'misses'))
+        response = super().get(request, *args, **kwargs)
+        if response.status_code == 200 and isinstance(response, Response):
+            cache.set(key, response.data, settings.RESPONSE_CACHE_TIMEOUT)
+        return response
+
+    def _cache_enabled(self, request):
+        return (
+            settings.RESPONSE_CACHE_ENABLED
+            and self.cache_namespace is not None
+            and not request.user.is_authenticated
+        )
@@ -0,0 +1,185 @@
+"""
+Sparse fieldsets for read requests: ``?fields=`` and ``?omit=``.
+
+``?fields=id,title,details.price`` keeps only the listed fields (a
+dotted name selects inside a nested serializer); ``?omit=description``
+drops fields. Both are ignored on write requests, so validation always
+sees the full serializer.
+
+SparseFieldsetMixin prunes the serializer fields; sparse_queryset then
+restricts the queryset to the columns those fields read with only(),
+and drops select_related/prefetch_related lookups for relations that
+are not rendered, so unused columns and tables are never queried.
+"""
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+FIELDS_PARAM = 'fields'
+OMIT_PARAM = 'omit'
+
+
+def parse_fieldset(value):
+    """
+    Parse a comma-separated field list into {name: [nested paths]}.
+
+    ``'id,details.price,details.title'`` -> ``{'id': [], 'details': ['price', 'title']}``.
+    An empty list means the whole field.
+
+    Args:
+        value (str): Raw query parameter value, or None.
+
+    Returns:
+        dict: Parsed selection, or None if the parameter is absent.
+    """
+    if value is None:
+        return None
+    parsed = {}
+    for path in value.split(','):
+        path = path.strip()
+        if not path:
+            continue
+        name, _, rest = path.partition('.')
+        nested = parsed.setdefault(name, [])
+        if rest:
+            nested.append(rest)
+    return parsed
+
+
+class SparseFieldsetMixin:
+    """
+    Serializer mixin that keeps only the fields selected by ?fields= / ?omit=.
+
+    The top-level serializer reads the request from its context; nested
+    serializers that also use this mixin receive their part of a dotted
+    selection from their parent.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        selected, omitted = self._get_fieldset()
+        if selected is None and not omitted:
+            return fields
+
+        unknown = set(selected or ()) | set(omitted)
+        unknown -= set(fields)
+        if unknown:
+            raise serializers.ValidationError(
+                {FIELDS_PARAM: f"Unknown field(s): {', '.join(sorted(unknown))}."}
+            )
+
+        for name in list(fields):
+            keep = selected is None or name in selected
+            if not keep or omitted.get(name) == []:
+                del fields[name]
+                continue
+            child = getattr(fields[name], 'child', fields[name])
+            if isinstance(child, SparseFieldsetMixin):
+                nested_selected = selected.get(name) if selected else None
+                child._fieldset = (
+                    _as_fieldset(nested_selected),
+                    _as_fieldset(omitted.get(name)) or {},
+                )
+        return fields
+
+    def _get_fieldset(self):
+        """
+        Return (selected, omitted) for this serializer.
+        """
+        if hasattr(self, '_fieldset'):
+            return self._fieldset
+        if not self._is_root():
+            return None, {}
+        request = self.context.get('request')
+        if request is None or request.method not in SAFE_METHODS:
+            return None, {}
+        params = request.query_params
+        return (
+            parse_fieldset(params.get(FIELDS_PARAM)),
+            parse_fieldset(params.get(OMIT_PARAM)) or {},
+        )
+
+    def _is_root(self):
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        return parent is None
+
+
+def _as_fieldset(paths):
+    """
+    Turn a parent's nested path list into a fieldset for the child.
+
+    ``[]`` (the whole nested field) and None mean no restriction.
+    """
+    if not paths:
+        return None
+    return parse_fieldset(','.join(paths))
+
+
+def sparse_queryset(queryset, serializer, always=('id',)):
+    """
+    Restrict a queryset to what a (pruned) serializer renders.
+
+    Concrete fields read by the serializer are loaded with only(); a
+    field with ``source='*'`` can list the columns it needs in a
+    ``sources`` attribute. select_related and prefetch_related lookups
+    for relations that are no longer rendered are dropped.
+
+    Args:
+        queryset (QuerySet): Base queryset of the view.
+        serializer (Serializer): Serializer instance, already pruned.
+        always (iterable): Columns to load regardless, e.g. ordering keys.
+
+    Returns:
+        QuerySet: Projected queryset.
+    """
+    meta = queryset.model._meta
+    sources = set()
+    for field in serializer.fields.values():
+        if field.source == '*':
+            sources.update(getattr(field, 'sources', ()))
+        else:
+            sources.add(field.source.split('.')[0])
+
+    columns = set(always)
+    relations = set()
+    for name in sources:
+        try:
+            model_field = meta.get_field(name)
+        except FieldDoesNotExist:
+            continue
+        if model_field.concrete:
+            columns.add(name)
+        if model_field.is_relation:
+            relations.add(name)
+
+    select_related = queryset.query.select_related
+    if isinstance(select_related, dict):
+        kept = [name for name in select_related if name in relations]
+        queryset = queryset.select_related(None)
+        if kept:
+            queryset = queryset.select_related(*kept)
+    prefetches = [
+        lookup for lookup in queryset._prefetch_related_lookups
+        if getattr(lookup, 'prefetch_through', lookup).split('__')[0] in relations
+    ]
+    return queryset.prefetch_related(None).prefetch_related(*prefetches).only(*columns)
+
+
+class SparseFieldsetViewMixin:
+    """
+    View mixin that applies sparse_queryset to read requests.
+
+    ``sparse_always`` lists columns every row needs even when not
+    rendered, such as the pagination ordering keys.
+    """
+
+    sparse_always = ('id',)
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.request.method in SAFE_METHODS:
+            queryset = sparse_queryset(queryset, self.get_serializer(), self.sparse_always)
+        return queryset
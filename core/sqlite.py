@@ -0,0 +1,66 @@
+"""
+SQLite connection tuning.
+
+Django opens SQLite with the library defaults: a rollback journal,
+where a writer locks readers out while it commits, and a 5 second
+lock timeout. ``configure_sqlite`` runs on ``connection_created`` and
+applies ``settings.SQLITE_PRAGMAS`` to every new SQLite connection:
+
+- ``journal_mode=WAL``: readers no longer block writers or the other
+  way round; only writers wait for each other. The mode is stored in
+  the database file.
+- ``synchronous=NORMAL``: in WAL mode, fsync on checkpoints instead of
+  on every commit. A power loss can drop the last commits but never
+  corrupts the database.
+- ``busy_timeout``: milliseconds a writer waits for the lock before
+  raising "database is locked".
+- ``mmap_size``: bytes of the file read through a memory map shared
+  with other processes instead of copied into each page cache.
+- ``cache_size``: page cache per connection. Negative values are KiB.
+- ``temp_store=MEMORY``: temporary sort and index B-trees stay in RAM.
+
+The statements run on the DB-API connection, so they do not count
+against query budgets or show up in captured queries.
+"""
+
+import re
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+# Pragmas configure_sqlite may set, in the order they are applied
+PRAGMAS = ('busy_timeout', 'journal_mode', 'synchronous', 'mmap_size', 'cache_size', 'temp_store')
+VALUE_RE = re.compile(r'^-?\w+$')
+
+
+def apply_pragmas(dbapi_connection, pragmas):
+    """
+    Set pragmas on an open sqlite3 connection.
+
+    Args:
+        dbapi_connection (sqlite3.Connection): Raw connection.
+        pragmas (dict): {name: value} for names in PRAGMAS; None or ''
+            keeps SQLite's default for that pragma.
+
+    Raises:
+        ImproperlyConfigured: Unknown pragma or malformed value.
+    """
+    unknown = set(pragmas) - set(PRAGMAS)
+    if unknown:
+        raise ImproperlyConfigured(f"Unknown SQLite pragma(s): {', '.join(sorted(unknown))}.")
+    for name in PRAGMAS:
+        value = pragmas.get(name)
+        if value is None or value == '':
+            continue
+        if not VALUE_RE.match(str(value)):
+            raise ImproperlyConfigured(f'Invalid value for SQLite pragma {name}: {value!r}.')
+        dbapi_connection.execute(f'PRAGMA {name} = {value}').fetchall()
+
+
+def configure_sqlite(sender, connection, **kwargs):
+    """
+    connection_created receiver: apply SQLITE_PRAGMAS to SQLite connections.
+    """
+    if connection.vendor != 'sqlite' or not settings.SQLITE_PRAGMAS_ENABLED:
+        return
+    apply_pragmas(connection.connection, settings.SQLITE_PRAGMAS)
@@ -0,0 +1,105 @@
+"""
+Streaming JSON output for large list endpoints.
+
+A normal DRF list builds ``serializer.data`` for every row and renders
+the whole list at once, so memory grows with the result size. The
+streaming mode here reads the queryset with ``iterator(chunk_size=...)``
+(prefetches run per chunk), serializes one chunk at a time and writes
+the JSON array incrementally through a ``StreamingHttpResponse``. Peak
+memory is bounded by the chunk size, not by the number of rows.
+"""
+
+from django.http import StreamingHttpResponse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+from rest_framework.utils import encoders
+
+
+def stream_json_array(items, chunk_size, serialize):
+    """
+    Yield the bytes of a JSON array built chunk by chunk.
+
+    Args:
+        items (iterable): Objects to serialize, typically ``queryset.iterator()``.
+        chunk_size (int): Objects serialized per chunk.
+        serialize (callable): Turns a list of objects into a list of dicts.
+
+    Yields:
+        bytes: The opening bracket, one piece per chunk, the closing bracket.
+    """
+    encoder = encoders.JSONEncoder(
+        ensure_ascii=JSONRenderer.ensure_ascii,
+        allow_nan=not api_settings.STRICT_JSON,
+        separators=(',', ':') if api_settings.COMPACT_JSON else (', ', ': '),
+    )
+    yield b'['
+    prefix = ''
+    for chunk in _chunks(items, chunk_size):
+        yield (prefix + ','.join(encoder.encode(row) for row in serialize(chunk))).encode('utf-8')
+        prefix = ','
+    yield b']'
+
+
+def _chunks(items, size):
+    """
+    Group an iterable into lists of at most ``size`` items.
+    """
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class StreamingListMixin:
+    """
+    List view mixin that streams the full, unpaginated result on ``?stream=1``.
+
+    Filters, search and ordering still apply; pagination does not. The
+    response is a plain JSON array of the same items a page would contain.
+    """
+
+    stream_param = 'stream'
+    stream_chunk_size = 1000
+
+    def list(self, request, *args, **kwargs):
+        """
+        Return a streaming response if requested, otherwise the normal list.
+        """
+        if not self.wants_stream(request):
+            return super().list(request, *args, **kwargs)
+
+        return self.stream_response(
+            self.filter_queryset(self.get_queryset()),
+            lambda chunk: self.get_serializer(chunk, many=True).data,
+        )
+
+    def wants_stream(self, request):
+        """
+        Return True if the request asked for the streaming mode.
+        """
+        return request.query_params.get(self.stream_param) in ('1', 'true')
+
+    def stream_response(self, queryset, serialize):
+        """
+        Stream a queryset as one JSON array.
+
+        Args:
+            queryset (QuerySet): Filtered queryset (models or values() rows).
+            serialize (callable): Turns a list of rows into a list of dicts.
+
+        Returns:
+            StreamingHttpResponse: application/json response.
+        """
+        if not queryset.ordered:
+            queryset = queryset.order_by('pk')
+
+        content = stream_json_array(
+            queryset.iterator(chunk_size=self.stream_chunk_size),
+            self.stream_chunk_size,
+            serialize,
+        )
+        return StreamingHttpResponse(content, content_type='application/json')
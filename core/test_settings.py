@@ -0,0 +1,25 @@
+"""
+Settings for the test suite.
+
+Select it explicitly when running the tests::
+
+    python manage.py test --settings=core.test_settings
+
+Other runners (e.g. pytest-django) take
+``DJANGO_SETTINGS_MODULE=core.test_settings``. CI runs the suite this
+way (.github/workflows/tests.yml).
+"""
+
+from core.settings import *  # noqa: F401,F403
+
+# Cached responses would leak between test cases; the cache tests
+# enable it with override_settings
+RESPONSE_CACHE_ENABLED = False
+
+# Generate image derivatives inline, so no background work outlives a test
+OFFER_IMAGE_ASYNC = False
+
+# Threads outside the request cycle (the password hashing pool) keep
+# their own connections until CONN_MAX_AGE runs out; close them after
+# every job so the test database can be dropped at the end of the run
+DATABASES['default']['CONN_MAX_AGE'] = 0  # noqa: F405
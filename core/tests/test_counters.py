@@ -0,0 +1,82 @@
+"""
+Tests for the shared counter helpers (core.counters).
+"""
+
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from core.counters import saved_values, upsert_increments
+from offers.models import Offer
+from reviews.models import BusinessRating
+
+User = get_user_model()
+
+
+class UpsertIncrementsTest(TestCase):
+    """
+    Tests the upsert and the UPDATE/INSERT fallback for other backends.
+    """
+
+    def setUp(self):
+        self.first = User.objects.create_user(username='first', password='x', type='business')
+        self.second = User.objects.create_user(username='second', password='x', type='business')
+        BusinessRating.objects.create(business_user=self.first, review_count=2, rating_sum=7)
+
+    def test_increments_and_creates(self):
+        """
+        Test that existing rows are incremented and missing rows created, on both paths.
+        """
+        for vendors in (('sqlite', 'postgresql'), ()):
+            with self.subTest(vendors=vendors), mock.patch('core.counters.UPSERT_VENDORS', vendors):
+                BusinessRating.objects.filter(business_user=self.second).delete()
+                BusinessRating.objects.filter(business_user=self.first).update(
+                    review_count=2, rating_sum=7
+                )
+                upsert_increments(
+                    BusinessRating, ('business_user_id',), ('review_count', 'rating_sum'),
+                    [(self.first.pk, 1, 5), (self.second.pk, 1, 4)],
+                )
+                rows = BusinessRating.objects.values_list(
+                    'business_user_id', 'review_count', 'rating_sum'
+                ).order_by('business_user_id')
+                self.assertEqual(list(rows), [(self.first.pk, 3, 12), (self.second.pk, 1, 4)])
+
+    def test_no_rows(self):
+        """
+        Test that an empty batch runs no query.
+        """
+        with self.assertNumQueries(0):
+            upsert_increments(BusinessRating, ('business_user_id',), ('review_count',), [])
+
+
+class RememberStoredValuesTest(TestCase):
+    """
+    Tests the stored values kept on instances and the values written by a save.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='biz', password='x', type='business')
+
+    def test_deferred_fields_looked_up_before_save(self):
+        """
+        Test that values deferred at load time are read from the database before an update.
+        """
+        user = User.objects.only('id', 'username').get(pk=self.user.pk)
+        self.assertIsNone(user._stats_type)
+
+        user.username = 'renamed'
+        user.save(update_fields=['username'])
+
+        self.assertEqual(user._stats_type, ('business',))
+
+    def test_saved_values(self):
+        """
+        Test that fields which were not loaded keep their stored value.
+        """
+        offer = Offer(user=self.user, title='Logo')
+        del offer.__dict__['description']
+
+        self.assertEqual(saved_values(offer, ('title', 'description'), ('Old', 'Text')), ('Logo', 'Text'))
+        self.assertIsNone(saved_values(offer, ('description',), ('Text',)))
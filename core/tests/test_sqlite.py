@@ -0,0 +1,96 @@
+"""
+Tests for the SQLite pragma profile (core.sqlite).
+"""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+from unittest import skipUnless
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from core.sqlite import apply_pragmas, configure_sqlite
+
+PRAGMAS = {
+    'journal_mode': 'wal',
+    'synchronous': 'normal',
+    'busy_timeout': '2500',
+    'mmap_size': '1048576',
+    'cache_size': '-4000',
+    'temp_store': 'memory',
+}
+
+
+class ApplyPragmasTest(SimpleTestCase):
+    """
+    Tests apply_pragmas on a scratch database file.
+    """
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.connection = sqlite3.connect(os.path.join(directory, 'test.sqlite3'))
+        self.addCleanup(self.connection.close)
+
+    def _pragma(self, name):
+        return self.connection.execute(f'PRAGMA {name}').fetchone()[0]
+
+    def test_applies_profile(self):
+        """
+        Test that every configured pragma is set.
+        """
+        apply_pragmas(self.connection, PRAGMAS)
+
+        self.assertEqual(self._pragma('journal_mode'), 'wal')
+        self.assertEqual(self._pragma('synchronous'), 1)
+        self.assertEqual(self._pragma('busy_timeout'), 2500)
+        self.assertEqual(self._pragma('mmap_size'), 1048576)
+        self.assertEqual(self._pragma('cache_size'), -4000)
+        self.assertEqual(self._pragma('temp_store'), 2)
+
+    def test_empty_value_keeps_default(self):
+        """
+        Test that an empty value leaves the pragma alone.
+        """
+        apply_pragmas(self.connection, {**PRAGMAS, 'journal_mode': ''})
+
+        self.assertEqual(self._pragma('journal_mode'), 'delete')
+
+    def test_rejects_bad_configuration(self):
+        """
+        Test that unknown pragmas and non-scalar values are refused.
+        """
+        for pragmas in ({'foreign_keys': 'on'}, {'cache_size': '1; DROP TABLE x'}):
+            with self.assertRaises(ImproperlyConfigured):
+                apply_pragmas(self.connection, pragmas)
+
+
+@skipUnless(connection.vendor == 'sqlite', 'Needs an SQLite test database.')
+class ConfigureSqliteTest(TestCase):
+    """
+    Tests the connection_created hook.
+    """
+
+    def test_django_connection_configured(self):
+        """
+        Test that Django's connection got the settings profile.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA busy_timeout')
+            self.assertEqual(cursor.fetchone()[0], 5000)
+            cursor.execute('PRAGMA temp_store')
+            self.assertEqual(cursor.fetchone()[0], 2)
+
+    @override_settings(SQLITE_PRAGMAS_ENABLED=False, SQLITE_PRAGMAS={'busy_timeout': '1'})
+    def test_disabled(self):
+        """
+        Test that SQLITE_PRAGMAS_ENABLED=False applies nothing.
+        """
+        configure_sqlite(sender=None, connection=connection)
+
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA busy_timeout')
+            self.assertEqual(cursor.fetchone()[0], 5000)
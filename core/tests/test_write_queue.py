@@ -0,0 +1,178 @@
+"""
+Tests for the single-writer queue (core.write_queue).
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import skipUnless
+
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, connection, connections, transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from core.write_queue import WriteQueueTimeout, run_write, write_queue
+from offers.models import Offer
+from orders.models import Order
+
+User = get_user_model()
+
+
+def create_user(username):
+    """
+    Write function: insert a user and return its id.
+    """
+    return User.objects.create(username=username, type='customer').id
+
+
+def outer_atomic_id():
+    """
+    Write function: identify the transaction it runs in.
+    """
+    return id(transaction.get_connection().atomic_blocks[0])
+
+
+@skipUnless(connection.vendor == 'sqlite', 'The write queue only applies to SQLite.')
+@override_settings(SQLITE_WRITE_QUEUE=True, SQLITE_WRITE_QUEUE_TIMEOUT=5)
+class WriteQueueTest(TransactionTestCase):
+    """
+    Tests batching, error isolation and timeouts of the writer thread.
+    """
+
+    def tearDown(self):
+        write_queue.stop()
+        connections.close_all()
+
+    def _block_writer(self):
+        """
+        Occupy the writer thread until the returned event is set.
+        """
+        started, release = threading.Event(), threading.Event()
+
+        def wait():
+            started.set()
+            release.wait(5)
+
+        blocker = write_queue.submit(wait)
+        started.wait(5)
+        return release, blocker
+
+    def _submit_from_threads(self, funcs):
+        """
+        Call run_write for each function from its own thread; return the futures.
+        """
+        def call(func):
+            try:
+                return run_write(func)
+            finally:
+                connections.close_all()
+
+        executor = ThreadPoolExecutor(max_workers=len(funcs))
+        self.addCleanup(executor.shutdown)
+        return [executor.submit(call, func) for func in funcs]
+
+    def _wait_queued(self, count):
+        while write_queue._queue.qsize() < count:
+            threading.Event().wait(0.01)
+
+    def test_runs_on_writer_thread(self):
+        """
+        Test that a write runs on the writer thread and is committed.
+        """
+        user_id = run_write(create_user, 'queued')
+
+        self.assertTrue(User.objects.filter(pk=user_id).exists())
+        self.assertIsNotNone(write_queue._thread)
+
+    def test_group_commit(self):
+        """
+        Test that writes queued behind a running batch commit together.
+        """
+        release, blocker = self._block_writer()
+        futures = self._submit_from_threads([outer_atomic_id] * 5)
+        self._wait_queued(5)
+        release.set()
+
+        blocker.result(5)
+        self.assertEqual(len({future.result(5) for future in futures}), 1)
+
+    def test_failure_isolated(self):
+        """
+        Test that a failing write rolls back alone and raises in its caller.
+        """
+        User.objects.create(username='taken', type='customer')
+        release, _ = self._block_writer()
+        futures = self._submit_from_threads([
+            lambda: create_user('first'),
+            lambda: create_user('taken'),
+            lambda: create_user('second'),
+        ])
+        self._wait_queued(3)
+        release.set()
+
+        with self.assertRaises(IntegrityError):
+            futures[1].result(5)
+        futures[0].result(5)
+        futures[2].result(5)
+        self.assertEqual(
+            set(User.objects.values_list('username', flat=True)), {'taken', 'first', 'second'}
+        )
+
+    @override_settings(SQLITE_WRITE_QUEUE_TIMEOUT=0.05)
+    def test_timeout_drops_queued_write(self):
+        """
+        Test that a write still queued after the timeout is never applied.
+        """
+        release, blocker = self._block_writer()
+
+        with self.assertRaises(WriteQueueTimeout):
+            run_write(create_user, 'late')
+        release.set()
+        blocker.result(5)
+
+        self.assertFalse(User.objects.filter(username='late').exists())
+
+    def test_api_writes(self):
+        """
+        Test registration, offer and order creation through the queue.
+        """
+        client = APIClient()
+        response = client.post('/api/registration/', {
+            'username': 'biz', 'email': 'biz@example.com', 'password': 'TestPass123!',
+            'repeated_password': 'TestPass123!', 'type': 'business'
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        client.force_authenticate(User.objects.get(username='biz'))
+        response = client.post('/api/offers/', {
+            'title': 'Logo', 'description': 'Test', 'details': [{
+                'title': 'Basic', 'revisions': 1, 'delivery_time_in_days': 3,
+                'price': '10.00', 'features': ['A'], 'offer_type': 'basic'
+            }]
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        customer = User.objects.create_user(username='cust', type='customer')
+        client.force_authenticate(customer)
+        detail_id = Offer.objects.get().details.get().id
+        response = client.post('/api/orders/', {'offer_detail_id': detail_id}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Order.objects.get().id, response.data['id'])
+
+
+@override_settings(SQLITE_WRITE_QUEUE=True)
+class WriteQueueInlineTest(TestCase):
+    """
+    Tests that writes inside a transaction bypass the queue.
+    """
+
+    def test_inline_in_transaction(self):
+        """
+        Test that a caller's open transaction keeps the write on its connection.
+        """
+        caller = threading.current_thread()
+
+        ran_on = run_write(threading.current_thread)
+
+        self.assertIs(ran_on, caller)
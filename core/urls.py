@@ -21,4 +21,7 @@ urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/', include('accounts.api.urls')),
     path('api/', include('offers.api.urls')), 
+    path('api/', include('orders.api.urls')),
+    path('api/', include('reviews.api.urls')),
+    path('api/', include('stats.api.urls')),
 ]
@@ -0,0 +1,212 @@
+"""
+Single-writer queue that group-commits small write transactions (opt-in).
+
+SQLite has one write lock per database. With a threaded WSGI/ASGI
+server, concurrent writers wait for it in SQLite's busy handler, which
+polls with growing sleeps, so a burst of writes shows up as long tail
+latencies or "database is locked" once ``busy_timeout`` runs out.
+
+With ``SQLITE_WRITE_QUEUE=True`` writes passed to ``run_write`` go to
+one writer thread instead. It takes up to
+``SQLITE_WRITE_QUEUE_MAX_BATCH`` queued writes (waiting at most
+``SQLITE_WRITE_QUEUE_MAX_WAIT`` seconds for more after the first) and
+runs them in one transaction, each in its own savepoint, so a failing
+write rolls back alone. One COMMIT then covers the whole batch. The
+callers wait on a future and get each write's result or exception
+after that commit.
+
+Writes run inline instead when the queue is off, the database is not
+SQLite, the caller is already inside a transaction (the write must be
+part of it) or the caller is the writer thread itself.
+
+Keep queued functions short and free of slow work such as password
+hashing: everything in a batch holds the write lock. A write that is
+still queued after ``SQLITE_WRITE_QUEUE_TIMEOUT`` seconds is
+cancelled and raises WriteQueueTimeout (503); once it has started, the
+caller waits for it to finish.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, close_old_connections, connections, transaction
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+logger = logging.getLogger(__name__)
+
+
+class WriteQueueTimeout(APIException):
+    """
+    Raised when a write waited too long in the queue; it was not applied.
+    """
+
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = 'The server is busy, please retry.'
+    default_code = 'write_queue_timeout'
+
+
+class _Write:
+    __slots__ = ('func', 'args', 'kwargs', 'future')
+
+    def __init__(self, func, args, kwargs):
+        self.func, self.args, self.kwargs = func, args, kwargs
+        self.future = Future()
+
+
+class WriteQueue:
+    """
+    Queue of write functions executed in batches by one writer thread.
+
+    The thread starts with the first submitted write.
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def submit(self, func, *args, **kwargs):
+        """
+        Queue ``func(*args, **kwargs)`` and return its Future.
+        """
+        write = _Write(func, args, kwargs)
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name='sqlite-writer', daemon=True
+                )
+                self._thread.start()
+        self._queue.put(write)
+        return write.future
+
+    def is_writer_thread(self):
+        """
+        Return whether the current thread is the writer thread.
+        """
+        return threading.current_thread() is self._thread
+
+    def stop(self):
+        """
+        Let the writer finish the queued writes and exit.
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                break
+            try:
+                self._run_batch(batch)
+            except BaseException:
+                # Never lose the writer thread; the futures already carry
+                # the error
+                logger.exception('Write queue batch of %d failed', len(batch))
+            finally:
+                close_old_connections()
+        connections.close_all()
+
+    def _next_batch(self):
+        """
+        Block for the first write, then collect more for up to MAX_WAIT seconds.
+
+        Returns:
+            list: Writes to run, or None to stop.
+        """
+        first = self._queue.get()
+        if first is None:
+            return None
+        batch = [first]
+        max_batch = settings.SQLITE_WRITE_QUEUE_MAX_BATCH
+        max_wait = settings.SQLITE_WRITE_QUEUE_MAX_WAIT
+        while len(batch) < max_batch:
+            try:
+                write = self._queue.get(timeout=max_wait) if max_wait else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if write is None:
+                # Finish this batch first, then stop
+                self._queue.put(None)
+                break
+            batch.append(write)
+        return batch
+
+    def _run_batch(self, batch):
+        """
+        Run a batch in one transaction and resolve the futures after commit.
+        """
+        outcomes = []
+        try:
+            with transaction.atomic():
+                for write in batch:
+                    if not write.future.set_running_or_notify_cancel():
+                        continue
+                    try:
+                        with transaction.atomic():
+                            outcomes.append((write.future, write.func(*write.args, **write.kwargs), None))
+                    except Exception as exc:
+                        outcomes.append((write.future, None, exc))
+        except BaseException as exc:
+            # COMMIT failed: nothing in the batch was applied
+            for write in batch:
+                if not write.future.done():
+                    write.future.set_exception(exc)
+            raise
+        for future, result, exc in outcomes:
+            if exc is None:
+                future.set_result(result)
+            else:
+                future.set_exception(exc)
+
+
+write_queue = WriteQueue()
+atexit.register(write_queue.stop)
+
+
+def run_write(func, *args, **kwargs):
+    """
+    Run a short write function through the writer thread, or inline.
+
+    ``func`` runs in a transaction (the batch) on the writer thread's
+    connection, so pass it model instances or ids, not querysets bound
+    to the caller's transaction.
+
+    Args:
+        func (callable): Function performing the writes.
+        *args: Positional arguments for func.
+        **kwargs: Keyword arguments for func.
+
+    Returns:
+        Whatever func returns.
+
+    Raises:
+        WriteQueueTimeout: The write was still queued after
+            SQLITE_WRITE_QUEUE_TIMEOUT seconds and was dropped.
+        Exception: Whatever func raised.
+    """
+    connection = connections[DEFAULT_DB_ALIAS]
+    if (
+        not settings.SQLITE_WRITE_QUEUE
+        or connection.vendor != 'sqlite'
+        or connection.in_atomic_block
+        or write_queue.is_writer_thread()
+    ):
+        return func(*args, **kwargs)
+
+    future = write_queue.submit(func, *args, **kwargs)
+    try:
+        return future.result(timeout=settings.SQLITE_WRITE_QUEUE_TIMEOUT)
+    except FutureTimeoutError:
+        if future.cancel():
+            raise WriteQueueTimeout()
+        # Already running: it will commit or fail shortly
+        return future.result()
@@ -3,7 +3,10 @@ Admin configuration for offers app.
 """
 
 from django.contrib import admin
+from django.db.models import Q
+
 from .models import Offer, OfferDetail
+from .search import is_supported, search_offers
 
 
 class OfferDetailInline(admin.TabularInline):
@@ -19,12 +22,31 @@ class OfferAdmin(admin.ModelAdmin):
     """
     Admin configuration for Offer model.
     """
-    list_display = ['title', 'user', 'created_at', 'updated_at']
+    list_display = ['title', 'user', 'min_price', 'min_delivery_time', 'created_at', 'updated_at']
     list_filter = ['created_at', 'user']
     search_fields = ['title', 'description', 'user__username']
-    readonly_fields = ['created_at', 'updated_at']
+    readonly_fields = ['min_price', 'min_delivery_time', 'created_at', 'updated_at']
     inlines = [OfferDetailInline]
 
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Use the full-text index for title/description instead of a LIKE scan.
+        """
+        if not search_term or not is_supported(queryset.db):
+            return super().get_search_results(request, queryset, search_term)
+        matches = search_offers(Offer.objects.all(), search_term).values('id')
+        queryset = queryset.filter(
+            Q(id__in=matches) | Q(user__username__icontains=search_term)
+        )
+        return queryset, False
+
+    def save_related(self, request, form, formsets, change):
+        """
+        Refresh the denormalized price/delivery summary after inline details are saved.
+        """
+        super().save_related(request, form, formsets, change)
+        form.instance.refresh_detail_summary()
+
 
 @admin.register(OfferDetail)
 class OfferDetailAdmin(admin.ModelAdmin):
@@ -33,4 +55,28 @@ class OfferDetailAdmin(admin.ModelAdmin):
     """
     list_display = ['offer', 'offer_type', 'price', 'delivery_time_in_days']
     list_filter = ['offer_type']
-    search_fields = ['offer__title']
\ No newline at end of file
+    search_fields = ['offer__title']
+
+    def save_model(self, request, obj, form, change):
+        """
+        Save the detail and refresh its offer's price/delivery summary.
+        """
+        super().save_model(request, obj, form, change)
+        obj.offer.refresh_detail_summary()
+
+    def delete_model(self, request, obj):
+        """
+        Delete the detail and refresh its offer's price/delivery summary.
+        """
+        offer = obj.offer
+        super().delete_model(request, obj)
+        offer.refresh_detail_summary()
+
+    def delete_queryset(self, request, queryset):
+        """
+        Bulk-delete details and refresh every affected offer.
+        """
+        offers = list(Offer.objects.filter(details__in=queryset).distinct())
+        super().delete_queryset(request, queryset)
+        for offer in offers:
+            offer.refresh_detail_summary()
\ No newline at end of file
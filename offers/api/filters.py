@@ -0,0 +1,66 @@
+"""
+Query parameter filters for offer endpoints.
+"""
+
+import django_filters
+from rest_framework.filters import BaseFilterBackend, OrderingFilter
+
+from offers.models import Offer
+from offers.search import search_offers
+
+
+class OfferFilter(django_filters.FilterSet):
+    """
+    Filters for GET /api/offers/.
+
+    ?min_price=<decimal>        - cheapest package costs at least this much
+    ?max_delivery_time=<int>    - fastest package is delivered within this many days
+    """
+
+    min_price = django_filters.NumberFilter(field_name='min_price', lookup_expr='gte')
+    max_delivery_time = django_filters.NumberFilter(
+        field_name='min_delivery_time',
+        lookup_expr='lte'
+    )
+
+    class Meta:
+        model = Offer
+        fields = ['min_price', 'max_delivery_time']
+
+
+class OfferSearchFilter(BaseFilterBackend):
+    """
+    ?search=<text> - full-text search over title and description.
+
+    Uses the FTS5 index on SQLite and annotates ``search_rank`` for
+    RelevanceOrderingFilter.
+    """
+
+    search_param = 'search'
+
+    def get_search_text(self, request):
+        """Return the stripped ?search= value, or ''."""
+        return request.query_params.get(self.search_param, '').strip()
+
+    def filter_queryset(self, request, queryset, view):
+        text = self.get_search_text(request)
+        if not text:
+            return queryset
+        return search_offers(queryset, text)
+
+
+class RelevanceOrderingFilter(OrderingFilter):
+    """
+    OrderingFilter that sorts search results by relevance by default.
+
+    An explicit ?ordering= still wins; without ?search= the view's
+    default ordering applies.
+    """
+
+    def get_ordering(self, request, queryset, view):
+        if (
+            self.ordering_param not in request.query_params
+            and OfferSearchFilter().get_search_text(request)
+        ):
+            return ['search_rank']
+        return super().get_ordering(request, queryset, view)
@@ -0,0 +1,201 @@
+"""
+Read-only fast path for offer lists.
+
+OfferSerializer builds a model instance per row and runs DRF's
+per-field machinery (get_attribute, to_representation, OrderedDict)
+for the offer and every nested detail. OfferReader produces the same
+JSON from ``values()`` rows instead: the column list and one converter
+per output field are computed once, and each row is turned into a dict
+by a flat loop. Decimal and datetime formatters reproduce DRF's default
+output, so the rendered JSON is byte-identical to OfferSerializer
+(covered by offers/tests/test_read_path.py). Writes keep using
+OfferSerializer.
+"""
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.utils.encoding import force_str
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+from offers.images import match_derivative
+from offers.models import Offer, OfferDetail
+from .serializers import ImageDerivativeField, OfferSerializer
+
+User = get_user_model()
+
+# Columns every row carries: cursor pagination reads its ordering keys from the rows
+KEY_COLUMNS = ['id', 'created_at', 'updated_at', 'min_price', 'min_delivery_time']
+
+# Columns read by output fields that are not a plain column of the same name
+FIELD_COLUMNS = {
+    'user': ['user__username', 'user__type'],
+    'details': [],
+}
+
+# DRF fields whose to_representation is the identity for database values
+PASSTHROUGH_FIELDS = (
+    serializers.CharField, serializers.IntegerField,
+    serializers.ChoiceField, serializers.JSONField,
+)
+
+
+class OfferReader:
+    """
+    Compiled, read-only equivalent of ``OfferSerializer(many=True).data``.
+
+    Usage::
+
+        reader = OfferReader(view.get_serializer_context())
+        rows = reader.project(queryset)       # values() queryset, still lazy
+        data = reader.serialize(list(rows))   # one extra query for details
+    """
+
+    def __init__(self, context=None):
+        self.context = context or {}
+        self.request = self.context.get('request')
+        self.storage = Offer._meta.get_field('image').storage
+        # str(user) is "<username> (<type label>)", see accounts.models.User
+        self.user_types = {
+            value: force_str(label)
+            for value, label in User._meta.get_field('type').flatchoices
+        }
+
+        offer_fields = OfferSerializer(context=self.context).fields
+        self.offer_converters = [
+            (name, self._offer_converter(name, field)) for name, field in offer_fields.items()
+        ]
+        self.columns = list(KEY_COLUMNS)
+        for name, field in offer_fields.items():
+            for column in FIELD_COLUMNS.get(name, getattr(field, 'sources', [name])):
+                if column not in self.columns:
+                    self.columns.append(column)
+
+        # Honours ?fields=details.price and ?omit=details(.features)
+        self.with_details = 'details' in offer_fields
+        if self.with_details:
+            detail_fields = offer_fields['details'].child.fields
+            self.detail_converters = [
+                (name, _value_converter(name, field, OfferDetail))
+                for name, field in detail_fields.items()
+            ]
+            self.detail_columns = ['offer_id', *detail_fields]
+
+    def project(self, queryset):
+        """
+        Turn an Offer queryset into a values() queryset with the needed columns.
+
+        Only columns of the rendered fields (plus the ordering keys) are
+        selected. Annotations such as ``search_rank`` are kept so
+        ordering and cursor pagination keep working on the rows.
+        """
+        return queryset.select_related(None).prefetch_related(None).values(
+            *self.columns, *queryset.query.annotations
+        )
+
+    def serialize(self, rows):
+        """
+        Serialize offer rows and their details.
+
+        Args:
+            rows (list): Dicts from project().
+
+        Returns:
+            list: One dict per offer, equal to OfferSerializer output.
+        """
+        if self.with_details:
+            details = {row['id']: [] for row in rows}
+            if details:
+                detail_rows = (
+                    OfferDetail.objects.filter(offer_id__in=list(details))
+                    .order_by('offer_id', 'offer_type').values(*self.detail_columns)
+                )
+                converters = self.detail_converters
+                for detail in detail_rows:
+                    details[detail['offer_id']].append(
+                        {name: convert(detail) for name, convert in converters}
+                    )
+            for row in rows:
+                row['details'] = details[row['id']]
+
+        converters = self.offer_converters
+        return [{name: convert(row) for name, convert in converters} for row in rows]
+
+    def _offer_converter(self, name, field):
+        """
+        Return a function row -> output value for one OfferSerializer field.
+        """
+        if name == 'user':
+            types = self.user_types
+            return lambda row: (
+                f"{row['user__username']} ({types.get(row['user__type'], row['user__type'])})"
+            )
+        if name == 'image':
+            return lambda row: self._url(row['image'])
+        if name == 'details':
+            return lambda row: row['details']
+        if isinstance(field, ImageDerivativeField):
+            size, fallback = field.size, field.fallback
+
+            def derivative(row):
+                derived = match_derivative(row['image'], row['image_derivatives'], size)
+                if derived:
+                    return self._url(derived)
+                return self._url(row['image']) if fallback else None
+            return derivative
+        return _value_converter(name, field, Offer)
+
+    def _url(self, name):
+        """
+        Build the same URL DRF's ImageField returns for a stored file name.
+        """
+        if not name:
+            return None
+        url = self.storage.url(name)
+        return self.request.build_absolute_uri(url) if self.request is not None else url
+
+
+def _value_converter(name, field, model):
+    """
+    Return a function row -> value for a plain model field.
+
+    Strings, integers, choices and JSON come out of the database already
+    in their output form and are passed through. Decimals and aware
+    datetimes get a precomputed formatter that matches DRF's default
+    output; any other configuration uses the DRF field's own
+    to_representation, which DRF also skips for None.
+    """
+    if isinstance(field, PASSTHROUGH_FIELDS):
+        return lambda row: row[name]
+
+    if isinstance(field, serializers.DecimalField) and _plain_decimal(field, model, name):
+        # Django already quantizes database decimals to decimal_places
+        return lambda row: None if row[name] is None else '{:f}'.format(row[name])
+
+    if isinstance(field, serializers.DateTimeField) and _iso_datetime(field):
+        tz = field.timezone if hasattr(field, 'timezone') else field.default_timezone()
+
+        def convert(row):
+            value = row[name]
+            if value is None:
+                return None
+            value = value.astimezone(tz).isoformat()
+            return value[:-6] + 'Z' if value.endswith('+00:00') else value
+        return convert
+
+    to_representation = field.to_representation
+    return lambda row: None if row[name] is None else to_representation(row[name])
+
+
+def _plain_decimal(field, model, name):
+    coerce_to_string = getattr(field, 'coerce_to_string', api_settings.COERCE_DECIMAL_TO_STRING)
+    model_field = model._meta.get_field(name)
+    return (
+        coerce_to_string and not field.localize
+        and field.decimal_places == model_field.decimal_places
+    )
+
+
+def _iso_datetime(field):
+    output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+    return settings.USE_TZ and output_format is not None and output_format.lower() == ISO_8601
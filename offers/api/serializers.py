@@ -2,13 +2,24 @@
 Serializers for offer management.
 """
 
+from django.core.files.storage import default_storage
+from django.db import router, transaction
+from django.db.models.deletion import Collector
 from rest_framework import serializers
+from core.sparse_fields import SparseFieldsetMixin
+from core.write_queue import run_write
+from offers.images import get_derivative_name
 from offers.models import Offer, OfferDetail
 
+# Fields a new detail tier must provide (others have model defaults)
+REQUIRED_DETAIL_FIELDS = ['title', 'delivery_time_in_days', 'price', 'offer_type']
 
-class OfferDetailSerializer(serializers.ModelSerializer):
+
+class OfferDetailSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for a single OfferDetail (package tier).
+
+    Supports ?fields= / ?omit= on reads (core.sparse_fields).
     """
 
     class Meta:
@@ -24,15 +35,50 @@ class OfferDetailSerializer(serializers.ModelSerializer):
         ]
 
 
-class OfferSerializer(serializers.ModelSerializer):
+class ImageDerivativeField(serializers.Field):
+    """
+    Read-only URL of one resized copy of Offer.image.
+
+    Falls back to the original image URL while the derivative is not
+    ready yet (or to None if ``fallback`` is False).
+    """
+
+    # Columns read from the offer (see core.sparse_fields.sparse_queryset)
+    sources = ('image', 'image_derivatives')
+
+    def __init__(self, size, fallback=True, **kwargs):
+        kwargs['source'] = '*'
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+        self.size = size
+        self.fallback = fallback
+
+    def to_representation(self, offer):
+        name = get_derivative_name(offer, self.size)
+        if name:
+            url = default_storage.url(name)
+        elif self.fallback and offer.image:
+            url = offer.image.url
+        else:
+            return None
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request is not None else url
+
+
+class OfferSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for Offer including nested OfferDetail list.
 
-    On create/update, nested details are handled manually.
+    On create/update, nested details are handled manually. Reads support
+    ?fields= / ?omit=, including dotted names such as details.price.
     """
 
     details = OfferDetailSerializer(many=True, required=False)
     user = serializers.StringRelatedField(read_only=True)
+    image_thumbnail = ImageDerivativeField('thumbnail')
+    image_detail = ImageDerivativeField('detail')
+    image_thumbnail_webp = ImageDerivativeField('thumbnail_webp', fallback=False)
+    image_detail_webp = ImageDerivativeField('detail_webp', fallback=False)
 
     class Meta:
         model = Offer
@@ -41,34 +87,87 @@ class OfferSerializer(serializers.ModelSerializer):
             'user',
             'title',
             'image',
+            'image_thumbnail',
+            'image_detail',
+            'image_thumbnail_webp',
+            'image_detail_webp',
             'description',
             'details',
+            'min_price',
+            'min_delivery_time',
             'created_at',
             'updated_at'
         ]
-        read_only_fields = ['id', 'user', 'created_at', 'updated_at']
+        read_only_fields = [
+            'id', 'user', 'min_price', 'min_delivery_time', 'created_at', 'updated_at'
+        ]
+
+    def validate_details(self, value):
+        """
+        Require an offer_type on every detail and reject duplicates.
+        """
+        offer_types = [detail.get('offer_type') for detail in value]
+        if None in offer_types:
+            raise serializers.ValidationError("Each detail needs an offer_type.")
+        if len(offer_types) != len(set(offer_types)):
+            raise serializers.ValidationError("Each offer_type may only appear once.")
+        return value
 
     def create(self, validated_data):
         """
         Create an offer with nested detail packages.
 
+        The offer and all details are written in one transaction, with the
+        details inserted by a single bulk_create, through the write queue
+        (core.write_queue) when it is enabled.
+
         Args:
             validated_data (dict): Validated data including nested details.
 
         Returns:
             Offer: Newly created offer with all details.
         """
-        details_data = validated_data.pop('details', [])
-        offer = Offer.objects.create(**validated_data)
+        offer, details = self.build_instances(validated_data)
+        run_write(self._insert, offer, details)
+        return offer
 
-        for detail_data in details_data:
-            OfferDetail.objects.create(offer=offer, **detail_data)
+    @staticmethod
+    def _insert(offer, details):
+        with transaction.atomic():
+            offer.save()
+            OfferDetail.objects.bulk_create(details)
 
-        return offer
+    def build_instances(self, validated_data):
+        """
+        Build an unsaved offer and its unsaved details from validated data.
+
+        Shared by create() and the import_offers command, which saves
+        many offers at once with bulk_create.
+
+        Args:
+            validated_data (dict): Validated data including nested details.
+                Extra keys such as ``user`` are passed to Offer.
+
+        Returns:
+            tuple: (Offer, list of OfferDetail).
+        """
+        validated_data = dict(validated_data)
+        details_data = validated_data.pop('details', [])
+        offer = Offer(**validated_data)
+        offer.apply_detail_summary(details_data)
+        details = [OfferDetail(offer=offer, **detail_data) for detail_data in details_data]
+        return offer, details
 
     def update(self, instance, validated_data):
         """
-        Update an offer and replace its nested details.
+        Update an offer and sync its nested details by offer_type.
+
+        Details whose offer_type is in the payload are updated in place
+        (keeping their primary key and any orders pointing at them), new
+        offer_types are bulk-created, and offer_types missing from the
+        payload are deleted. Everything runs in one transaction with a
+        constant number of statements, through the write queue
+        (core.write_queue) when it is enabled.
 
         Args:
             instance (Offer): Existing offer instance.
@@ -82,11 +181,48 @@ class OfferSerializer(serializers.ModelSerializer):
         instance.title = validated_data.get('title', instance.title)
         instance.image = validated_data.get('image', instance.image)
         instance.description = validated_data.get('description', instance.description)
-        instance.save()
 
-        if details_data is not None:
-            instance.details.all().delete()
-            for detail_data in details_data:
-                OfferDetail.objects.create(offer=instance, **detail_data)
+        if details_data is None:
+            run_write(instance.save)
+            return instance
 
-        return instance
\ No newline at end of file
+        run_write(self._sync_details, instance, details_data)
+        return instance
+
+    def _sync_details(self, instance, details_data):
+        """
+        Save the offer and apply the detail changes in one transaction.
+        """
+        with transaction.atomic():
+            existing = {detail.offer_type: detail for detail in instance.details.all()}
+            to_update, to_create, update_fields = [], [], set()
+
+            for detail_data in details_data:
+                detail = existing.pop(detail_data['offer_type'], None)
+                if detail is None:
+                    missing = [f for f in REQUIRED_DETAIL_FIELDS if f not in detail_data]
+                    if missing:
+                        raise serializers.ValidationError(
+                            {'details': f"New offer_type '{detail_data['offer_type']}' "
+                                        f"is missing: {', '.join(missing)}."}
+                        )
+                    to_create.append(OfferDetail(offer=instance, **detail_data))
+                    continue
+                for field, value in detail_data.items():
+                    setattr(detail, field, value)
+                update_fields.update(detail_data.keys())
+                to_update.append(detail)
+
+            instance.apply_detail_summary(to_update + to_create)
+            instance.save()
+
+            if existing:
+                # Collect the loaded instances: a queryset delete() would
+                # SELECT them again before nulling Order.offer_detail
+                collector = Collector(using=router.db_for_write(OfferDetail))
+                collector.collect(list(existing.values()))
+                collector.delete()
+            if to_update and update_fields - {'offer_type'}:
+                OfferDetail.objects.bulk_update(to_update, sorted(update_fields - {'offer_type'}))
+            if to_create:
+                OfferDetail.objects.bulk_create(to_create)
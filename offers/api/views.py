@@ -2,25 +2,69 @@
 Views for offer management.
 """
 
+from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import generics, status
 from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
 from rest_framework.response import Response
 
+from core.pagination import KeysetCursorPagination
+from core.query_budget import QueryBudgetMixin
+from core.response_cache import VersionedResponseCacheMixin
+from core.sparse_fields import SparseFieldsetViewMixin
+from core.streaming import StreamingListMixin
 from offers.models import Offer, OfferDetail
+from offers.signals import OFFERS_CACHE_NAMESPACE
+from .filters import OfferFilter, OfferSearchFilter, RelevanceOrderingFilter
+from .readers import OfferReader
 from .serializers import OfferSerializer, OfferDetailSerializer
 
 
-class OfferListCreateView(generics.ListCreateAPIView):
+class OfferListCreateView(
+    QueryBudgetMixin, VersionedResponseCacheMixin, StreamingListMixin,
+    generics.ListCreateAPIView
+):
     """
     List all offers or create a new one.
 
-    GET  /api/offers/  - public list
+    GET  /api/offers/  - public list, cursor-paginated (?cursor=, ?page_size=),
+                         cached for anonymous requests
+                         filters: ?min_price=, ?max_delivery_time=
+                         search: ?search= (full-text, ranked by relevance)
+                         ordering: ?ordering=min_price (also min_delivery_time,
+                         created_at, updated_at; prefix '-' to reverse)
+                         ?stream=1 streams every match as one JSON array
+                         ?fields= / ?omit= select the returned fields
     POST /api/offers/  - requires auth, only business users
     """
 
-    queryset = Offer.objects.all()
+    queryset = Offer.objects.select_related('user').prefetch_related('details')
     serializer_class = OfferSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    pagination_class = KeysetCursorPagination
+    filter_backends = [DjangoFilterBackend, OfferSearchFilter, RelevanceOrderingFilter]
+    filterset_class = OfferFilter
+    ordering_fields = ['min_price', 'min_delivery_time', 'created_at', 'updated_at']
+    ordering = ['-created_at']
+    query_budget = {'GET': 3, 'POST': 7}
+    cache_namespace = OFFERS_CACHE_NAMESPACE
+
+    def list(self, request, *args, **kwargs):
+        """
+        List offers through the OfferReader read path.
+
+        Produces the same JSON as OfferSerializer from values() rows,
+        for both paginated and ?stream=1 responses.
+        """
+        reader = OfferReader(self.get_serializer_context())
+        queryset = reader.project(self.filter_queryset(self.get_queryset()))
+
+        if self.wants_stream(request):
+            return self.stream_response(queryset, reader.serialize)
+
+        page = self.paginate_queryset(queryset)
+        if page is None:
+            return Response(reader.serialize(list(queryset)))
+        return self.get_paginated_response(reader.serialize(page))
 
     def perform_create(self, serializer):
         """
@@ -32,18 +76,44 @@ class OfferListCreateView(generics.ListCreateAPIView):
         serializer.save(user=self.request.user)
 
 
-class OfferDetailView(generics.RetrieveUpdateDestroyAPIView):
+class OfferDetailView(
+    QueryBudgetMixin, VersionedResponseCacheMixin, SparseFieldsetViewMixin,
+    generics.RetrieveUpdateDestroyAPIView
+):
     """
     Retrieve, update, or delete a single offer.
 
-    GET    /api/offers/<id>/  - public
+    GET    /api/offers/<id>/  - public, cached for anonymous requests,
+                                ?fields= / ?omit= select the returned fields
     PATCH  /api/offers/<id>/  - only owner
     DELETE /api/offers/<id>/  - only owner
     """
 
-    queryset = Offer.objects.all()
+    queryset = Offer.objects.select_related('user').prefetch_related('details')
     serializer_class = OfferSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    query_budget = {'GET': 3, 'PUT': 10, 'PATCH': 10, 'DELETE': 10}
+    cache_namespace = OFFERS_CACHE_NAMESPACE
+
+    def get_queryset(self):
+        """
+        Skip prefetching the details for DELETE; the deletion loads them itself.
+        """
+        queryset = super().get_queryset()
+        if self.request.method == 'DELETE':
+            return queryset.prefetch_related(None)
+        return queryset
+
+    def get_object(self):
+        """
+        Load the offer once per request.
+
+        update() and destroy() check ownership before the generic
+        implementations call get_object() again.
+        """
+        if not hasattr(self, '_offer'):
+            self._offer = super().get_object()
+        return self._offer
 
     def update(self, request, *args, **kwargs):
         """
@@ -76,13 +146,14 @@ class OfferDetailView(generics.RetrieveUpdateDestroyAPIView):
         return super().destroy(request, *args, **kwargs)
 
 
-class OfferDetailItemView(generics.RetrieveAPIView):
+class OfferDetailItemView(QueryBudgetMixin, SparseFieldsetViewMixin, generics.RetrieveAPIView):
     """
     Retrieve a single OfferDetail by its ID.
 
-    GET /api/offerdetails/<id>/
+    GET /api/offerdetails/<id>/  (?fields= / ?omit= supported)
     """
 
     queryset = OfferDetail.objects.all()
     serializer_class = OfferDetailSerializer
-    permission_classes = [IsAuthenticatedOrReadOnly]
\ No newline at end of file
+    permission_classes = [IsAuthenticatedOrReadOnly]
+    query_budget = {'GET': 2}
\ No newline at end of file
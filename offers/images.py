@@ -0,0 +1,179 @@
+"""
+Resized derivatives of Offer.image, generated off the request path.
+
+After an offer is saved with a new image, ``schedule_derivatives``
+queues ``generate_derivatives`` on a small thread pool once the
+transaction commits. The worker writes one JPEG (and optionally one
+WebP) per size in ``settings.OFFER_IMAGE_SIZES`` and records their
+storage names in ``Offer.image_derivatives`` together with the source
+image name. Derivatives whose source no longer matches ``Offer.image``
+are stale and ignored, so readers fall back to the original image.
+"""
+
+import io
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connections, transaction
+from PIL import Image, ImageOps
+
+from core.response_cache import bump_version
+
+logger = logging.getLogger(__name__)
+
+DERIVATIVE_DIR = 'offers/derivatives'
+JPEG_OPTIONS = {'format': 'JPEG', 'quality': 85, 'optimize': True, 'progressive': True}
+WEBP_OPTIONS = {'format': 'WEBP', 'quality': 80, 'method': 4}
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_derivative_name(offer, size):
+    """
+    Return the storage name of a ready derivative, or None.
+
+    Args:
+        offer (Offer): Offer whose image is resized.
+        size (str): Size key, e.g. 'thumbnail' or 'thumbnail_webp'.
+
+    Returns:
+        str: Storage name, or None if missing or generated from an older image.
+    """
+    return match_derivative(offer.image.name if offer.image else None, offer.image_derivatives, size)
+
+
+def match_derivative(image_name, derivatives, size):
+    """
+    Same as get_derivative_name, from raw column values.
+
+    Args:
+        image_name (str): Stored Offer.image name, or ''/None.
+        derivatives (dict): Stored Offer.image_derivatives.
+        size (str): Size key.
+
+    Returns:
+        str: Storage name, or None.
+    """
+    derivatives = derivatives or {}
+    if not image_name or derivatives.get('source') != image_name:
+        return None
+    return derivatives.get(size)
+
+
+def needs_derivatives(offer):
+    """
+    Return True if the offer has an image without current derivatives.
+    """
+    return bool(offer.image) and (offer.image_derivatives or {}).get('source') != offer.image.name
+
+
+def schedule_derivatives(offer):
+    """
+    Generate derivatives for an offer after the current transaction commits.
+
+    Runs on the background pool when ``settings.OFFER_IMAGE_ASYNC`` is
+    set, otherwise inline (tests, management commands).
+    """
+    offer_id = offer.pk
+
+    def submit():
+        if settings.OFFER_IMAGE_ASYNC:
+            _get_executor().submit(_run_in_worker, offer_id)
+        else:
+            generate_derivatives(offer_id)
+
+    transaction.on_commit(submit)
+
+
+def generate_derivatives(offer_id):
+    """
+    Resize the current image of an offer and store the derivatives.
+
+    The result is only saved if the offer still has the same image, so
+    a slow job never overwrites derivatives of a newer upload. Files of
+    the previous derivatives are deleted.
+
+    Args:
+        offer_id (int): Primary key of the offer.
+
+    Returns:
+        dict: The stored derivative names, or None if there was nothing to do.
+    """
+    from offers.models import Offer
+    from offers.signals import OFFERS_CACHE_NAMESPACE
+
+    offer = Offer.objects.filter(pk=offer_id).only('image', 'image_derivatives').first()
+    if offer is None or not offer.image:
+        return None
+
+    source = offer.image.name
+    with offer.image.open('rb') as fh:
+        original = Image.open(fh)
+        original.load()
+    original = ImageOps.exif_transpose(original)
+    if original.mode not in ('RGB', 'L'):
+        original = original.convert('RGB')
+
+    stem = os.path.splitext(os.path.basename(source))[0]
+    derivatives = {'source': source}
+    for size, dimensions in settings.OFFER_IMAGE_SIZES.items():
+        resized = original.copy()
+        resized.thumbnail(dimensions, Image.LANCZOS)
+        base = f'{DERIVATIVE_DIR}/{offer_id}/{stem}_{size}'
+        derivatives[size] = _save(resized, f'{base}.jpg', JPEG_OPTIONS)
+        if settings.OFFER_IMAGE_WEBP:
+            derivatives[f'{size}_webp'] = _save(resized, f'{base}.webp', WEBP_OPTIONS)
+
+    updated = Offer.objects.filter(pk=offer_id, image=source).update(image_derivatives=derivatives)
+    if not updated:
+        _delete_files(derivatives)
+        return None
+
+    _delete_files(offer.image_derivatives, keep=derivatives)
+    bump_version(OFFERS_CACHE_NAMESPACE)
+    return derivatives
+
+
+def _save(image, name, options):
+    buffer = io.BytesIO()
+    image.save(buffer, **options)
+    return default_storage.save(name, ContentFile(buffer.getvalue()))
+
+
+def _delete_files(derivatives, keep=None):
+    """
+    Delete derivative files, except those also listed in ``keep``.
+    """
+    keep = set((keep or {}).values())
+    for size, name in (derivatives or {}).items():
+        if size != 'source' and name not in keep:
+            default_storage.delete(name)
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.OFFER_IMAGE_WORKERS,
+                thread_name_prefix='offer-images'
+            )
+    return _executor
+
+
+def _run_in_worker(offer_id):
+    """
+    Pool entry point: log failures and release the thread's DB connection.
+    """
+    try:
+        generate_derivatives(offer_id)
+    except Exception:
+        logger.exception('Generating image derivatives for offer %s failed', offer_id)
+    finally:
+        connections.close_all()
@@ -0,0 +1,121 @@
+"""
+Management command that benchmarks FTS5 search against the LIKE baseline.
+"""
+
+import itertools
+import random
+import statistics
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Q
+
+from offers.models import Offer
+from offers.search import is_supported, search_offers
+
+User = get_user_model()
+
+SYLLABLES = 'ka lo mi nu pe ra si to vu xe ba de fi go hu ja ke li mo ne'.split()
+
+
+class Command(BaseCommand):
+    """
+    Seed synthetic offers, time both search strategies, then roll back.
+
+    Everything runs inside one transaction that is rolled back at the
+    end, so the database is left unchanged.
+    """
+
+    help = 'Benchmark ?search= (FTS5 + BM25) against an icontains LIKE scan.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--offers', type=int, default=100_000, help='Offers to seed.')
+        parser.add_argument('--queries', type=int, default=50, help='Search terms to time.')
+        parser.add_argument('--page-size', type=int, default=20, help='Rows fetched per query.')
+        parser.add_argument('--seed', type=int, default=1, help='Random seed.')
+
+    def handle(self, *args, **options):
+        """
+        Run the benchmark and print a comparison table.
+        """
+        if not is_supported():
+            raise CommandError('The FTS5 benchmark requires SQLite.')
+
+        rng = random.Random(options['seed'])
+        words = self._vocabulary(rng)
+        # Draw query terms from the whole vocabulary: a mix of common and rare words.
+        terms = [rng.choice(words) for _ in range(options['queries'])]
+
+        with transaction.atomic():
+            self._seed(options['offers'], words, rng)
+            base = Offer.objects.order_by()
+            page = options['page_size']
+
+            like = self._time(terms, lambda t: list(
+                base.filter(Q(title__icontains=t) | Q(description__icontains=t))
+                .order_by('-created_at', 'id').values_list('id', flat=True)[:page]
+            ))
+            fts = self._time(terms, lambda t: list(
+                search_offers(base, t).order_by('search_rank', 'id')
+                .values_list('id', flat=True)[:page]
+            ))
+            like_count = self._time(terms, lambda t: base.filter(
+                Q(title__icontains=t) | Q(description__icontains=t)
+            ).count())
+            fts_count = self._time(terms, lambda t: search_offers(base, t).count())
+
+            transaction.set_rollback(True)
+
+        self.stdout.write(f"{options['offers']} offers, {len(terms)} queries (median / p95 ms)")
+        self._report('LIKE first page', like)
+        self._report('FTS  first page', fts)
+        self._report('LIKE total count', like_count)
+        self._report('FTS  total count', fts_count)
+
+    def _vocabulary(self, rng, size=20_000):
+        """
+        Build a list of distinct pseudo-words.
+        """
+        words = set()
+        while len(words) < size:
+            words.add(''.join(rng.choices(SYLLABLES, k=rng.randint(2, 4))))
+        return sorted(words)
+
+    def _seed(self, count, words, rng):
+        """
+        Insert ``count`` offers with Zipf-distributed words, like natural text.
+        """
+        cum_weights = list(itertools.accumulate(1 / rank for rank in range(1, len(words) + 1)))
+        user = User.objects.create(username='benchmark-search', type='business')
+        batch = []
+        for i in range(count):
+            batch.append(Offer(
+                user=user,
+                title=' '.join(rng.choices(words, cum_weights=cum_weights, k=4)),
+                description=' '.join(rng.choices(words, cum_weights=cum_weights, k=60)),
+            ))
+            if len(batch) == 5000:
+                Offer.objects.bulk_create(batch)
+                batch = []
+        Offer.objects.bulk_create(batch)
+
+    def _time(self, terms, run):
+        """
+        Return per-query durations in milliseconds.
+        """
+        durations = []
+        for term in terms:
+            start = time.perf_counter()
+            run(term)
+            durations.append((time.perf_counter() - start) * 1000)
+        return durations
+
+    def _report(self, label, durations):
+        """
+        Print median and p95 for one strategy.
+        """
+        ordered = sorted(durations)
+        p95 = ordered[int(len(ordered) * 0.95) - 1]
+        self.stdout.write(f'  {label}: {statistics.median(ordered):8.2f} / {p95:8.2f}')
@@ -0,0 +1,90 @@
+"""
+Management command that benchmarks OfferReader against OfferSerializer.
+"""
+
+import statistics
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from offers.api.readers import OfferReader
+from offers.api.serializers import OfferSerializer
+from offers.models import Offer, OfferDetail
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """
+    Serialize the same offers both ways and report time per 1,000 offers.
+
+    Each run includes the database queries and JSON rendering, so the
+    numbers are what a list request spends after filtering. Seeded
+    rows are rolled back at the end.
+    """
+
+    help = 'Benchmark the values()-based OfferReader against OfferSerializer.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--offers', type=int, default=1000, help='Offers to seed.')
+        parser.add_argument('--repeat', type=int, default=10, help='Timed runs per path.')
+
+    def handle(self, *args, **options):
+        """
+        Run the benchmark, check the outputs match and print the speedup.
+        """
+        with transaction.atomic():
+            self._seed(options['offers'])
+            queryset = Offer.objects.select_related('user').prefetch_related('details')
+
+            def serializer_path():
+                return JSONRenderer().render(OfferSerializer(queryset, many=True).data)
+
+            def reader_path():
+                reader = OfferReader()
+                return JSONRenderer().render(reader.serialize(list(reader.project(queryset))))
+
+            if serializer_path() != reader_path():
+                raise CommandError('OfferReader output differs from OfferSerializer.')
+
+            per_thousand = 1000 / options['offers']
+            serializer = self._time(serializer_path, options['repeat'], per_thousand)
+            reader = self._time(reader_path, options['repeat'], per_thousand)
+            transaction.set_rollback(True)
+
+        self.stdout.write(f"{options['offers']} offers, 3 details each (median ms per 1,000 offers)")
+        self.stdout.write(f'  OfferSerializer: {serializer:8.1f}')
+        self.stdout.write(f'  OfferReader:     {reader:8.1f}')
+        self.stdout.write(self.style.SUCCESS(f'  Speedup:         {serializer / reader:8.1f}x'))
+
+    def _seed(self, count):
+        """
+        Insert ``count`` offers with three details each.
+        """
+        user = User.objects.create(username='benchmark-serializers', type='business')
+        offers = Offer.objects.bulk_create([
+            Offer(user=user, title=f'Offer {i}', description='Benchmark offer ' * 10,
+                  min_price=10, min_delivery_time=3)
+            for i in range(count)
+        ])
+        OfferDetail.objects.bulk_create([
+            OfferDetail(offer=offer, title=tier.title(), revisions=1,
+                        delivery_time_in_days=3, price=10, features=['A', 'B'],
+                        offer_type=tier)
+            for offer in offers
+            for tier in ('basic', 'standard', 'premium')
+        ])
+
+    def _time(self, run, repeat, scale):
+        """
+        Return the median duration in milliseconds, scaled to 1,000 offers.
+        """
+        durations = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            durations.append((time.perf_counter() - start) * 1000 * scale)
+        return statistics.median(durations)
@@ -0,0 +1,98 @@
+"""
+Management command that benchmarks peak memory of streamed vs. buffered offer lists.
+"""
+
+import time
+import tracemalloc
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from offers.api.serializers import OfferSerializer
+from offers.api.views import OfferListCreateView
+from offers.models import Offer, OfferDetail
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """
+    Seed offers, render them all both ways and compare peak Python memory.
+
+    "buffered" is what a plain DRF list does: serializer.data for every
+    row, then one JSONRenderer call. "streamed" is GET /api/offers/?stream=1.
+    Memory is measured with tracemalloc. Everything runs inside one
+    transaction that is rolled back at the end.
+    """
+
+    help = 'Benchmark peak memory of ?stream=1 against a buffered full list.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--offers', type=int, default=1_000_000, help='Offers to seed.')
+        parser.add_argument(
+            '--skip-buffered', action='store_true',
+            help='Only measure streaming (buffered needs several GB at 1M rows).'
+        )
+
+    def handle(self, *args, **options):
+        """
+        Run the benchmark and print peak memory and duration per mode.
+        """
+        with transaction.atomic():
+            self._seed(options['offers'])
+            self.stdout.write(f"{options['offers']} offers (peak MB / seconds)")
+            self._report('streamed', self._streamed)
+            if not options['skip_buffered']:
+                self._report('buffered', self._buffered)
+            transaction.set_rollback(True)
+
+    def _seed(self, count, batch_size=5000):
+        """
+        Insert ``count`` offers with three details each.
+        """
+        self.user = user = User.objects.create(username='benchmark-stream', type='business')
+        for start in range(0, count, batch_size):
+            offers = Offer.objects.bulk_create([
+                Offer(user=user, title=f'Offer {i}', description='Benchmark offer ' * 10,
+                      min_price=10, min_delivery_time=3)
+                for i in range(start, min(start + batch_size, count))
+            ])
+            OfferDetail.objects.bulk_create([
+                OfferDetail(offer=offer, title=tier.title(), revisions=1,
+                            delivery_time_in_days=3, price=10, features=['A', 'B'],
+                            offer_type=tier)
+                for offer in offers
+                for tier in ('basic', 'standard', 'premium')
+            ])
+
+    def _streamed(self):
+        request = APIRequestFactory().get('/api/offers/', {'stream': '1'})
+        # Authenticated, so the anonymous response cache is bypassed
+        force_authenticate(request, user=self.user)
+        response = OfferListCreateView.as_view()(request)
+        size = 0
+        for piece in response.streaming_content:
+            size += len(piece)
+        return size
+
+    def _buffered(self):
+        queryset = Offer.objects.select_related('user').prefetch_related('details')
+        data = OfferSerializer(queryset, many=True).data
+        return len(JSONRenderer().render(data))
+
+    def _report(self, label, run):
+        """
+        Run one mode under tracemalloc and print its peak and duration.
+        """
+        tracemalloc.start()
+        start = time.perf_counter()
+        size = run()
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self.stdout.write(
+            f'  {label}: {peak / 2**20:10.1f} MB / {elapsed:8.1f} s  ({size / 2**20:.0f} MB JSON)'
+        )
@@ -0,0 +1,241 @@
+"""
+Management command that bulk-imports offers from NDJSON or CSV.
+"""
+
+import csv
+import json
+import os
+import sys
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, transaction
+
+from core.response_cache import bump_version
+from offers.api.serializers import OfferSerializer
+from offers.models import Offer, OfferDetail
+from offers.signals import OFFERS_CACHE_NAMESPACE
+from stats.counters import apply_stats_deltas
+
+User = get_user_model()
+
+TIERS = ['basic', 'standard', 'premium']
+TIER_FIELDS = ['title', 'revisions', 'delivery_time_in_days', 'price', 'features']
+
+
+class Command(BaseCommand):
+    """
+    Stream offers with their detail tiers from a file into the database.
+
+    NDJSON: one offer per line, in the same shape as the POST /api/offers/
+    body, plus an optional ``user`` (username)::
+
+        {"user": "anna", "title": "Logo", "description": "...", "details": [...]}
+
+    CSV: one offer per row with ``user``, ``title``, ``description`` and,
+    per tier, ``<tier>_title``, ``<tier>_revisions``,
+    ``<tier>_delivery_time_in_days``, ``<tier>_price`` and
+    ``<tier>_features`` (``|``-separated). Tiers with an empty title are
+    skipped.
+
+    Every record is validated with OfferSerializer. Valid offers are
+    written in batches, one transaction per batch, using bulk_create.
+    After each committed batch the record number is saved to a
+    checkpoint file, so ``--resume`` continues after the last
+    checkpointed batch. A batch the database rejects is rolled back and
+    imported again on resume. The checkpoint is written after the
+    commit, so if the process dies between the two, the last committed
+    batch is imported a second time on resume.
+    """
+
+    help = 'Import offers and their detail tiers from an NDJSON or CSV file.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="Input file, or '-' for stdin.")
+        parser.add_argument(
+            '--format', choices=['ndjson', 'csv'],
+            help='Input format. Defaults to the file extension.'
+        )
+        parser.add_argument('--user', help='Username used for records without a user.')
+        parser.add_argument('--batch-size', type=int, default=500, help='Offers per transaction.')
+        parser.add_argument(
+            '--checkpoint',
+            help='Checkpoint file. Defaults to <path>.checkpoint.'
+        )
+        parser.add_argument(
+            '--resume', action='store_true',
+            help='Skip records up to the last checkpointed batch.'
+        )
+        parser.add_argument('--rejects', help='Write rejected records as NDJSON to this file.')
+
+    def handle(self, *args, **options):
+        """
+        Run the import and report throughput and rejected records.
+        """
+        path = options['path']
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be at least 1.')
+        fmt = options['format'] or ('csv' if path.lower().endswith('.csv') else 'ndjson')
+        checkpoint = options['checkpoint'] or (None if path == '-' else f'{path}.checkpoint')
+        if options['resume'] and not checkpoint:
+            raise CommandError('--resume needs --checkpoint when reading from stdin.')
+
+        self.users = {}
+        self.default_user = self._get_user(options['user']) if options['user'] else None
+        if options['user'] and self.default_user is None:
+            raise CommandError(f"No business user named '{options['user']}'.")
+
+        skip = self._read_checkpoint(checkpoint) if options['resume'] else 0
+        self.imported = self.details = self.rejected = 0
+        rejects = open(options['rejects'], 'a', encoding='utf-8') if options['rejects'] else None
+        stream = sys.stdin if path == '-' else open(path, encoding='utf-8', newline='')
+        start = time.perf_counter()
+
+        try:
+            records = self._read_csv(stream) if fmt == 'csv' else self._read_ndjson(stream)
+            batch, position = [], skip
+            for number, record in records:
+                if number <= skip:
+                    continue
+                position = number
+                instances = self._validate(number, record, rejects)
+                if instances is not None:
+                    batch.append(instances)
+                if len(batch) >= options['batch_size']:
+                    self._write_batch(batch, position, checkpoint)
+                    batch = []
+            self._write_batch(batch, position, checkpoint)
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+            if rejects:
+                rejects.close()
+
+        elapsed = time.perf_counter() - start
+        rate = self.imported / elapsed if elapsed else 0.0
+        self.stdout.write(self.style.SUCCESS(
+            f'Imported {self.imported} offers ({self.details} details) in {elapsed:.1f}s '
+            f'({rate:.0f} offers/s). Rejected {self.rejected} records.'
+        ))
+
+    def _read_ndjson(self, stream):
+        """
+        Yield (record number, dict) per non-empty line.
+        """
+        for number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield number, json.loads(line)
+            except json.JSONDecodeError as exc:
+                yield number, {'_error': f'Invalid JSON: {exc.msg}'}
+
+    def _read_csv(self, stream):
+        """
+        Yield (record number, dict) per CSV row, nesting the tier columns.
+        """
+        for number, row in enumerate(csv.DictReader(stream), start=1):
+            details = []
+            for tier in TIERS:
+                if not (row.get(f'{tier}_title') or '').strip():
+                    continue
+                detail = {'offer_type': tier}
+                for field in TIER_FIELDS:
+                    value = row.get(f'{tier}_{field}')
+                    if value not in (None, ''):
+                        detail[field] = value
+                if 'features' in detail:
+                    detail['features'] = [f.strip() for f in detail['features'].split('|') if f.strip()]
+                details.append(detail)
+            record = {key: row[key] for key in ('user', 'title', 'description') if row.get(key)}
+            record['details'] = details
+            yield number, record
+
+    def _validate(self, number, record, rejects):
+        """
+        Validate one record and build its unsaved instances.
+
+        Returns:
+            tuple: (Offer, list of OfferDetail), or None if rejected.
+        """
+        if not isinstance(record, dict) or '_error' in record:
+            errors = record.get('_error') if isinstance(record, dict) else 'Expected an object.'
+            return self._reject(number, errors, rejects)
+
+        username = record.get('user')
+        user = self._get_user(username) if username else self.default_user
+        if user is None:
+            errors = f"No business user named '{username}'." if username else 'No user given.'
+            return self._reject(number, {'user': [errors]}, rejects)
+
+        serializer = OfferSerializer(data=record)
+        if not serializer.is_valid():
+            return self._reject(number, serializer.errors, rejects)
+        return serializer.build_instances({**serializer.validated_data, 'user': user})
+
+    def _reject(self, number, errors, rejects):
+        self.rejected += 1
+        if rejects:
+            rejects.write(json.dumps({'record': number, 'errors': errors}) + '\n')
+        return None
+
+    def _get_user(self, username):
+        """
+        Return the business user for a username, caching lookups.
+        """
+        if username not in self.users:
+            self.users[username] = User.objects.filter(
+                username=username, type='business'
+            ).first()
+        return self.users[username]
+
+    def _write_batch(self, batch, position, checkpoint):
+        """
+        Insert a batch of offers and details in one transaction, then checkpoint.
+
+        The checkpoint file is not part of the transaction: a crash after
+        the commit and before the checkpoint leaves the batch imported but
+        not recorded.
+
+        Raises:
+            CommandError: If the database rejects the batch; nothing of it is kept.
+        """
+        if batch:
+            offers = [offer for offer, _ in batch]
+            details = [detail for _, offer_details in batch for detail in offer_details]
+            try:
+                with transaction.atomic():
+                    Offer.objects.bulk_create(offers)
+                    OfferDetail.objects.bulk_create(details)
+                    # bulk_create skips the signals that count offers
+                    apply_stats_deltas(offer_count=len(offers))
+            except DatabaseError as exc:
+                raise CommandError(
+                    f'Batch ending at record {position} failed: {exc}. '
+                    f'Fix the input and rerun with --resume.'
+                )
+            bump_version(OFFERS_CACHE_NAMESPACE)
+            self.imported += len(offers)
+            self.details += len(details)
+        self._write_checkpoint(checkpoint, position)
+
+    def _read_checkpoint(self, checkpoint):
+        """
+        Return the last committed record number, or 0 without a checkpoint.
+        """
+        if not checkpoint or not os.path.exists(checkpoint):
+            return 0
+        with open(checkpoint, encoding='utf-8') as fh:
+            return json.load(fh)['record']
+
+    def _write_checkpoint(self, checkpoint, position):
+        """
+        Atomically replace the checkpoint with the last committed record number.
+        """
+        if not checkpoint:
+            return
+        tmp = f'{checkpoint}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as fh:
+            json.dump({'record': position}, fh)
+        os.replace(tmp, checkpoint)
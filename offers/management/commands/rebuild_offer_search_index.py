@@ -0,0 +1,31 @@
+"""
+Management command to rebuild the offer full-text search index.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from offers.search import is_supported, rebuild_search_index
+
+
+class Command(BaseCommand):
+    """
+    Rebuild the FTS5 index from offers_offer.
+
+    Use after restoring a database dump or if search results look stale.
+    The table and its sync triggers are created by the migrations.
+    """
+
+    help = 'Rebuild the SQLite FTS5 index used by ?search= on /api/offers/.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default='default', help='Database alias.')
+
+    def handle(self, *args, **options):
+        """
+        Execute the rebuild.
+        """
+        using = options['database']
+        if not is_supported(using):
+            raise CommandError('The full-text index is only available on SQLite.')
+        rebuild_search_index(using)
+        self.stdout.write(self.style.SUCCESS('Offer search index rebuilt.'))
@@ -0,0 +1,37 @@
+"""
+Management command to rebuild Offer.min_price and Offer.min_delivery_time.
+"""
+
+from django.core.management.base import BaseCommand
+from django.db.models import Min, OuterRef, Subquery
+
+from core.response_cache import bump_version
+from offers.models import Offer, OfferDetail
+from offers.signals import OFFERS_CACHE_NAMESPACE
+
+
+class Command(BaseCommand):
+    """
+    Recompute the denormalized detail summary of every offer.
+
+    Runs a single correlated UPDATE, so it is safe to use after bulk
+    imports or raw SQL edits that bypassed the serializer and admin.
+    The UPDATE sends no signals, so it bumps the offers response cache
+    itself.
+    """
+
+    help = 'Rebuild min_price and min_delivery_time on all offers from their details.'
+
+    def handle(self, *args, **options):
+        """
+        Execute the rebuild and report the number of offers touched.
+        """
+        details = OfferDetail.objects.filter(offer=OuterRef('pk')).order_by().values('offer')
+        updated = Offer.objects.update(
+            min_price=Subquery(details.annotate(m=Min('price')).values('m')),
+            min_delivery_time=Subquery(
+                details.annotate(m=Min('delivery_time_in_days')).values('m')
+            ),
+        )
+        bump_version(OFFERS_CACHE_NAMESPACE)
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt detail summary for {updated} offers.'))
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-17 07:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='offer',
+            index=models.Index(fields=['created_at', 'id'], name='offer_created_at_id_idx'),
+        ),
+    ]
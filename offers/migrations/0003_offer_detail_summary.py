@@ -0,0 +1,35 @@
+# Generated by Django 4.2.7 on 2026-10-17 07:20
+
+from django.db import migrations, models
+from django.db.models import Min, OuterRef, Subquery
+
+
+def backfill_detail_summary(apps, schema_editor):
+    Offer = apps.get_model('offers', 'Offer')
+    OfferDetail = apps.get_model('offers', 'OfferDetail')
+    details = OfferDetail.objects.filter(offer=OuterRef('pk')).order_by().values('offer')
+    Offer.objects.update(
+        min_price=Subquery(details.annotate(m=Min('price')).values('m')),
+        min_delivery_time=Subquery(details.annotate(m=Min('delivery_time_in_days')).values('m')),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers', '0002_offer_offer_created_at_id_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='offer',
+            name='min_delivery_time',
+            field=models.IntegerField(blank=True, db_index=True, editable=False, help_text='Shortest delivery time in days across all detail packages', null=True),
+        ),
+        migrations.AddField(
+            model_name='offer',
+            name='min_price',
+            field=models.DecimalField(blank=True, db_index=True, decimal_places=2, editable=False, help_text='Lowest price across all detail packages', max_digits=10, null=True),
+        ),
+        migrations.RunPython(backfill_detail_summary, migrations.RunPython.noop),
+    ]
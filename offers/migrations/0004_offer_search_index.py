@@ -0,0 +1,29 @@
+# Generated by Django 4.2.7 on 2026-10-17 07:23
+
+from django.db import migrations, models
+import django.db.models.deletion
+import offers.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers', '0003_offer_detail_summary'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OfferSearchIndex',
+            fields=[
+                ('offer', models.OneToOneField(db_column='rowid', db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='search_index', serialize=False, to='offers.offer')),
+                ('title', models.TextField()),
+                ('description', models.TextField()),
+                ('document', offers.models.FullTextDocumentField(db_column='offers_offer_fts')),
+                ('rank', models.FloatField()),
+            ],
+            options={
+                'db_table': 'offers_offer_fts',
+                'managed': False,
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-17 10:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers', '0006_offer_search_fts'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='offer',
+            name='offer_created_at_id_idx',
+        ),
+        migrations.AddIndex(
+            model_name='offer',
+            index=models.Index(fields=['-created_at', 'id'], name='offer_created_at_id_idx'),
+        ),
+    ]
@@ -3,8 +3,11 @@ Models for freelancer offers.
 """
 
 from django.db import models
+from django.db.models import Min
 from django.conf import settings
 
+from core.response_cache import bump_version
+
 
 class Offer(models.Model):
     """
@@ -17,7 +20,10 @@ class Offer(models.Model):
         user (ForeignKey): The business user who created this offer.
         title (str): Title of the offer.
         image (ImageField): Main image for the offer.
+        image_derivatives (dict): Resized copies of image (see offers.images).
         description (str): Detailed description.
+        min_price (Decimal): Cheapest detail price, denormalized for filtering.
+        min_delivery_time (int): Fastest detail delivery time, denormalized.
         created_at (datetime): Creation timestamp.
         updated_at (datetime): Last update timestamp.
     """
@@ -38,9 +44,31 @@ class Offer(models.Model):
         null=True,
         help_text="Main image for the offer"
     )
+    image_derivatives = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        help_text="Storage names of resized copies of image, keyed by size"
+    )
     description = models.TextField(
         help_text="Detailed description of the service"
     )
+    min_price = models.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=True,
+        help_text="Lowest price across all detail packages"
+    )
+    min_delivery_time = models.IntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=True,
+        help_text="Shortest delivery time in days across all detail packages"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -48,11 +76,112 @@ class Offer(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Offer'
         verbose_name_plural = 'Offers'
+        indexes = [
+            models.Index(fields=['-created_at', 'id'], name='offer_created_at_id_idx'),
+        ]
 
     def __str__(self):
         """String representation of Offer."""
         return f"{self.title} by {self.user.username}"
 
+    def apply_detail_summary(self, details):
+        """
+        Set min_price and min_delivery_time from in-memory detail data.
+
+        Used when the full set of details is already known (serializer
+        create/update), so no extra query is needed. Does not save.
+
+        Args:
+            details (list): Dicts or OfferDetail instances.
+        """
+        prices = [_detail_value(d, 'price') for d in details]
+        times = [_detail_value(d, 'delivery_time_in_days') for d in details]
+        self.min_price = min(prices) if prices else None
+        self.min_delivery_time = min(times) if times else None
+
+    def refresh_detail_summary(self):
+        """
+        Recompute min_price and min_delivery_time from the database.
+
+        Used after details changed outside the serializer (admin inline,
+        OfferDetail admin). Runs one aggregate and one UPDATE, and bumps
+        the offers response cache because update() sends no post_save.
+        """
+        # offers.signals imports this module
+        from offers.signals import OFFERS_CACHE_NAMESPACE
+
+        summary = self.details.aggregate(
+            min_price=Min('price'),
+            min_delivery_time=Min('delivery_time_in_days')
+        )
+        self.min_price = summary['min_price']
+        self.min_delivery_time = summary['min_delivery_time']
+        Offer.objects.filter(pk=self.pk).update(**summary)
+        bump_version(OFFERS_CACHE_NAMESPACE)
+
+
+class FullTextMatch(models.Lookup):
+    """
+    SQLite FTS5 ``MATCH`` lookup, e.g. ``search_index__document__match='logo'``.
+    """
+
+    lookup_name = 'match'
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs} MATCH {rhs}", lhs_params + rhs_params
+
+
+class FullTextDocumentField(models.TextField):
+    """
+    The hidden FTS5 column named after the table; the left side of MATCH.
+    """
+
+
+FullTextDocumentField.register_lookup(FullTextMatch)
+
+
+class OfferSearchIndex(models.Model):
+    """
+    Read-only view of the SQLite FTS5 table that mirrors Offer text.
+
+    The virtual table and its sync triggers are created by migration
+    offers 0006 with raw SQL; Django never manages the table. Only
+    exists on SQLite.
+
+    Attributes:
+        offer (OneToOneField): The indexed offer, joined on the FTS rowid.
+        title (str): Indexed copy of Offer.title.
+        description (str): Indexed copy of Offer.description.
+        document (str): Hidden table-named column used with ``__match``.
+        rank (float): BM25 score of the current MATCH (lower is better).
+    """
+
+    offer = models.OneToOneField(
+        Offer,
+        primary_key=True,
+        db_column='rowid',
+        db_constraint=False,
+        on_delete=models.DO_NOTHING,
+        related_name='search_index'
+    )
+    title = models.TextField()
+    description = models.TextField()
+    document = FullTextDocumentField(db_column='offers_offer_fts')
+    rank = models.FloatField()
+
+    class Meta:
+        managed = False
+        db_table = 'offers_offer_fts'
+
+
+def _detail_value(detail, name):
+    """Read a field from a detail dict or instance."""
+    if isinstance(detail, dict):
+        return detail[name]
+    return getattr(detail, name)
+
 
 class OfferDetail(models.Model):
     """
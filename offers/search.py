@@ -0,0 +1,90 @@
+"""
+Full-text search over Offer.title and Offer.description.
+
+On SQLite an FTS5 external-content table (``offers_offer_fts``) mirrors
+the offers table through triggers, so it stays in sync on every insert,
+update and delete, including bulk and raw SQL writes. The table and the
+triggers are created by migration offers 0006. Results are ranked with
+BM25, weighting title matches above description matches. Other
+database backends fall back to an ``icontains`` scan.
+"""
+
+import re
+
+from django.db import connections
+from django.db.models import F, FloatField, Q, Value
+
+FTS_TABLE = 'offers_offer_fts'
+
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def is_supported(using='default'):
+    """
+    Return True if the database behind ``using`` has the FTS5 index.
+    """
+    return connections[using].vendor == 'sqlite'
+
+
+def rebuild_search_index(using='default'):
+    """
+    Rebuild the FTS5 index from offers_offer and optimize it.
+
+    Only repopulates the index; the table and its triggers come from
+    the migrations.
+
+    Args:
+        using (str): Database alias.
+    """
+    if not is_supported(using):
+        return
+    with connections[using].cursor() as cursor:
+        cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+        cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('optimize')")
+
+
+def build_match_query(text):
+    """
+    Turn free user input into a safe FTS5 query.
+
+    Every word becomes a quoted prefix term and all terms must match,
+    so "logo desi" finds "Logo Design". Returns '' if there are no words.
+
+    Args:
+        text (str): Raw ?search= value.
+
+    Returns:
+        str: FTS5 MATCH expression.
+    """
+    return ' '.join(f'"{token}"*' for token in _TOKEN_RE.findall(text))
+
+
+def search_offers(queryset, text):
+    """
+    Restrict an Offer queryset to matches and annotate ``search_rank``.
+
+    ``search_rank`` is the BM25 score on SQLite (lower is more relevant)
+    and 0.0 on the icontains fallback.
+
+    Args:
+        queryset (QuerySet): Offer queryset.
+        text (str): Raw search text.
+
+    Returns:
+        QuerySet: Filtered and annotated queryset.
+    """
+    match = build_match_query(text)
+    if not match:
+        return queryset.none().annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+    if is_supported(queryset.db):
+        return queryset.filter(search_index__document__match=match).annotate(
+            search_rank=F('search_index__rank')
+        )
+
+    condition = Q()
+    for token in _TOKEN_RE.findall(text):
+        condition &= Q(title__icontains=token) | Q(description__icontains=token)
+    return queryset.filter(condition).annotate(
+        search_rank=Value(0.0, output_field=FloatField())
+    )
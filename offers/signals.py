@@ -0,0 +1,40 @@
+"""
+Signal handlers for the offers app.
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.response_cache import bump_version
+from offers.images import needs_derivatives, schedule_derivatives
+from offers.models import Offer, OfferDetail
+
+# Response cache namespace for public offer reads (see offers.api.views)
+OFFERS_CACHE_NAMESPACE = 'offers'
+
+
+@receiver(post_save, sender=Offer)
+@receiver(post_delete, sender=Offer)
+@receiver(post_save, sender=OfferDetail)
+@receiver(post_delete, sender=OfferDetail)
+def invalidate_offer_cache(sender, **kwargs):
+    """
+    Invalidate cached offer responses on any Offer or OfferDetail write.
+
+    Covers the API, the admin and serializer update(). Queryset
+    update()/bulk_create() bypass signals; callers using them must call
+    bump_version(OFFERS_CACHE_NAMESPACE) themselves.
+    """
+    bump_version(OFFERS_CACHE_NAMESPACE)
+
+
+@receiver(post_save, sender=Offer)
+def generate_image_derivatives(sender, instance, **kwargs):
+    """
+    Queue thumbnail generation when an offer is saved with a new image.
+
+    The work runs after commit on a background pool, so the request
+    that uploaded the image does not wait for it.
+    """
+    if needs_derivatives(instance):
+        schedule_derivatives(instance)
@@ -54,7 +54,7 @@ class OfferListCreateAPITest(APITestCase):
         """
         response = self.client.get('/api/offers/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 0)
+        self.assertEqual(len(response.data['results']), 0)
 
     def test_create_offer_success(self):
         """
@@ -0,0 +1,202 @@
+"""
+Tests for the denormalized min_price / min_delivery_time on Offer
+and the filters and ordering built on them.
+"""
+
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+
+from offers.models import Offer, OfferDetail
+
+User = get_user_model()
+
+
+def detail_payload(offer_type, price, days):
+    """
+    Build one nested detail for a POST/PATCH body.
+    """
+    return {
+        'title': offer_type.title(),
+        'revisions': 1,
+        'delivery_time_in_days': days,
+        'price': price,
+        'features': [],
+        'offer_type': offer_type
+    }
+
+
+class OfferDetailSummaryTest(APITestCase):
+    """
+    Tests that the summary columns follow detail changes.
+    """
+
+    def setUp(self):
+        """
+        Create an authenticated business user.
+        """
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='bizuser',
+            email='biz@example.com',
+            password='TestPass123!',
+            type='business'
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+
+    def _create_offer(self, title, details):
+        """
+        POST an offer and return the created instance.
+        """
+        data = {'title': title, 'description': 'Test', 'details': details}
+        response = self.client.post('/api/offers/', data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return Offer.objects.get(id=response.data['id'])
+
+    def test_create_sets_summary(self):
+        """
+        Test that creating an offer stores the cheapest price and fastest delivery.
+        """
+        offer = self._create_offer('A', [
+            detail_payload('basic', '100.00', 9),
+            detail_payload('standard', '50.00', 12),
+            detail_payload('premium', '300.00', 3),
+        ])
+
+        self.assertEqual(offer.min_price, Decimal('50.00'))
+        self.assertEqual(offer.min_delivery_time, 3)
+
+    def test_update_details_refreshes_summary(self):
+        """
+        Test that replacing details through PATCH updates the summary.
+        """
+        offer = self._create_offer('A', [detail_payload('basic', '100.00', 9)])
+
+        response = self.client.patch(
+            f'/api/offers/{offer.id}/',
+            {'details': [detail_payload('basic', '20.00', 4)]},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['min_price'], '20.00')
+        self.assertEqual(response.data['min_delivery_time'], 4)
+
+    def test_patch_without_details_keeps_summary(self):
+        """
+        Test that a title-only PATCH leaves the summary untouched.
+        """
+        offer = self._create_offer('A', [detail_payload('basic', '100.00', 9)])
+
+        self.client.patch(f'/api/offers/{offer.id}/', {'title': 'B'}, format='json')
+        offer.refresh_from_db()
+
+        self.assertEqual(offer.min_price, Decimal('100.00'))
+
+    def test_refresh_detail_summary(self):
+        """
+        Test recomputing the summary after a detail is edited directly.
+        """
+        offer = self._create_offer('A', [detail_payload('basic', '100.00', 9)])
+        OfferDetail.objects.filter(offer=offer).update(price=5, delivery_time_in_days=1)
+
+        offer.refresh_detail_summary()
+        offer.refresh_from_db()
+
+        self.assertEqual(offer.min_price, Decimal('5.00'))
+        self.assertEqual(offer.min_delivery_time, 1)
+
+    def test_rebuild_command(self):
+        """
+        Test that the rebuild command repairs drifted and empty summaries.
+        """
+        offer = self._create_offer('A', [detail_payload('basic', '100.00', 9)])
+        Offer.objects.filter(id=offer.id).update(min_price=999, min_delivery_time=999)
+        empty = Offer.objects.create(user=self.user, title='Empty', description='Test')
+
+        call_command('rebuild_offer_summaries', stdout=StringIO())
+        offer.refresh_from_db()
+        empty.refresh_from_db()
+
+        self.assertEqual(offer.min_price, Decimal('100.00'))
+        self.assertEqual(offer.min_delivery_time, 9)
+        self.assertIsNone(empty.min_price)
+
+
+class OfferFilterOrderingAPITest(APITestCase):
+    """
+    Tests for ?min_price=, ?max_delivery_time= and ?ordering= on GET /api/offers/.
+    """
+
+    def setUp(self):
+        """
+        Create offers with known summaries, plus one without details.
+        """
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='bizuser',
+            email='biz@example.com',
+            password='TestPass123!',
+            type='business'
+        )
+        for title, price, days in [('Cheap', 10, 14), ('Mid', 60, 7), ('Pricey', 200, 2)]:
+            Offer.objects.create(
+                user=self.user, title=title, description='Test',
+                min_price=price, min_delivery_time=days
+            )
+        Offer.objects.create(user=self.user, title='Empty', description='Test')
+
+    def _titles(self, query):
+        """
+        Return offer titles of all pages for a query string.
+        """
+        titles = []
+        url = f'/api/offers/?page_size=1&{query}'
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            titles.extend(item['title'] for item in response.data['results'])
+            url = response.data['next']
+        return titles
+
+    def test_list_exposes_summary(self):
+        """
+        Test that list items include min_price and min_delivery_time.
+        """
+        response = self.client.get('/api/offers/?ordering=min_price')
+        first = response.data['results'][0]
+
+        self.assertEqual(first['min_price'], '10.00')
+        self.assertEqual(first['min_delivery_time'], 14)
+
+    def test_filter_min_price(self):
+        """
+        Test that ?min_price= keeps offers whose cheapest package costs at least that.
+        """
+        self.assertEqual(sorted(self._titles('min_price=50')), ['Mid', 'Pricey'])
+
+    def test_filter_max_delivery_time(self):
+        """
+        Test that ?max_delivery_time= keeps offers deliverable within that many days.
+        """
+        self.assertEqual(sorted(self._titles('max_delivery_time=7')), ['Mid', 'Pricey'])
+
+    def test_ordering_min_price_across_pages(self):
+        """
+        Test ascending and descending price order, with offers lacking details last/first.
+        """
+        self.assertEqual(self._titles('ordering=min_price'), ['Cheap', 'Mid', 'Pricey', 'Empty'])
+        self.assertEqual(self._titles('ordering=-min_price'), ['Empty', 'Pricey', 'Mid', 'Cheap'])
+
+    def test_invalid_filter_value(self):
+        """
+        Test that a non-numeric filter value returns 400.
+        """
+        response = self.client.get('/api/offers/?min_price=abc')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,151 @@
+"""
+Tests for background image derivatives of Offer.image.
+"""
+
+import io
+import shutil
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.test import override_settings
+from PIL import Image
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+
+from offers.images import generate_derivatives
+from offers.models import Offer
+
+User = get_user_model()
+
+
+def upload(name='photo.png', size=(2000, 1500)):
+    """
+    Build an in-memory PNG upload.
+    """
+    buffer = io.BytesIO()
+    Image.new('RGB', size, 'red').save(buffer, format='PNG')
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type='image/png')
+
+
+class OfferImageDerivativeTest(APITestCase):
+    """
+    Tests for thumbnail generation, fallback URLs and the backfill command.
+    """
+
+    def setUp(self):
+        """
+        Use a temporary MEDIA_ROOT and create an offer owned by a business user.
+        """
+        media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media)
+        media_settings = override_settings(MEDIA_ROOT=media)
+        media_settings.enable()
+        self.addCleanup(media_settings.disable)
+
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='bizuser',
+            email='biz@example.com',
+            password='TestPass123!',
+            type='business'
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+        self.offer = Offer.objects.create(user=self.user, title='Offer', description='Test')
+
+    def _upload(self, **kwargs):
+        """
+        PATCH a new image and return the response and the queued callbacks.
+        """
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.patch(
+                f'/api/offers/{self.offer.id}/', {'image': upload(**kwargs)}, format='multipart'
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, callbacks
+
+    def test_falls_back_to_original_until_ready(self):
+        """
+        Test that the upload response serves the original image as thumbnail.
+        """
+        response, _ = self._upload()
+
+        self.assertEqual(response.data['image_thumbnail'], response.data['image'])
+        self.assertIsNone(response.data['image_thumbnail_webp'])
+
+    def test_derivatives_generated_after_commit(self):
+        """
+        Test that running the queued job stores resized JPEGs and exposes their URLs.
+        """
+        _, callbacks = self._upload()
+        for callback in callbacks:
+            callback()
+
+        response = self.client.get(f'/api/offers/{self.offer.id}/')
+        self.offer.refresh_from_db()
+        thumbnail = self.offer.image_derivatives['thumbnail']
+
+        self.assertTrue(response.data['image_thumbnail'].endswith(thumbnail))
+        self.assertNotEqual(response.data['image_detail'], response.data['image'])
+        with default_storage.open(thumbnail) as fh:
+            image = Image.open(fh)
+            self.assertEqual(image.format, 'JPEG')
+            self.assertEqual(image.size, (400, 300))
+
+    @override_settings(OFFER_IMAGE_ASYNC=True)
+    def test_request_does_not_run_job(self):
+        """
+        Test that in async mode the job is submitted to the pool, not run inline.
+        """
+        with mock.patch('offers.images._get_executor') as executor:
+            _, callbacks = self._upload()
+            for callback in callbacks:
+                callback()
+
+        executor.return_value.submit.assert_called_once()
+        self.offer.refresh_from_db()
+        self.assertEqual(self.offer.image_derivatives, {})
+
+    @override_settings(OFFER_IMAGE_WEBP=True)
+    def test_webp_derivatives(self):
+        """
+        Test that WebP copies are generated and exposed when enabled.
+        """
+        self._upload()
+
+        derivatives = generate_derivatives(self.offer.id)
+        response = self.client.get(f'/api/offers/{self.offer.id}/')
+
+        self.assertTrue(derivatives['thumbnail_webp'].endswith('.webp'))
+        self.assertTrue(response.data['image_thumbnail_webp'].endswith('.webp'))
+
+    def test_stale_derivatives_ignored(self):
+        """
+        Test that derivatives of a replaced image are not served.
+        """
+        self._upload(name='first.png')
+        generate_derivatives(self.offer.id)
+
+        response, _ = self._upload(name='second.png')
+
+        self.assertEqual(response.data['image_thumbnail'], response.data['image'])
+
+    def test_backfill_command(self):
+        """
+        Test that the backfill command generates missing derivatives only once.
+        """
+        self._upload()
+
+        first = StringIO()
+        call_command('generate_offer_images', stdout=first)
+        second = StringIO()
+        call_command('generate_offer_images', stdout=second)
+
+        self.assertIn('Generated derivatives for 1 offers', first.getvalue())
+        self.assertIn('Generated derivatives for 0 offers', second.getvalue())
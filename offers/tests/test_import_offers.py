@@ -0,0 +1,167 @@
+"""
+Tests for the import_offers management command.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import DatabaseError
+from django.test import TestCase
+
+from offers.models import Offer, OfferDetail
+from stats.counters import get_platform_stats
+
+User = get_user_model()
+
+
+def offer_record(title, price='50.00', user=None):
+    """
+    Build one NDJSON record with a single basic tier.
+    """
+    record = {
+        'title': title,
+        'description': 'Imported',
+        'details': [{
+            'title': 'Basic',
+            'revisions': 1,
+            'delivery_time_in_days': 5,
+            'price': price,
+            'features': ['A'],
+            'offer_type': 'basic'
+        }]
+    }
+    if user:
+        record['user'] = user
+    return record
+
+
+class ImportOffersCommandTest(TestCase):
+    """
+    Tests for streaming NDJSON/CSV imports, rejects and checkpoints.
+    """
+
+    def setUp(self):
+        """
+        Create a business user and a temporary directory.
+        """
+        self.user = User.objects.create_user(
+            username='bizuser',
+            email='biz@example.com',
+            password='TestPass123!',
+            type='business'
+        )
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+
+    def _write(self, name, content):
+        path = os.path.join(self.dir, name)
+        with open(path, 'w', encoding='utf-8') as fh:
+            fh.write(content)
+        return path
+
+    def _ndjson(self, records):
+        return self._write('offers.ndjson', ''.join(json.dumps(r) + '\n' for r in records))
+
+    def _run(self, path, **options):
+        out = StringIO()
+        call_command('import_offers', path, stdout=out, **options)
+        return out.getvalue()
+
+    def test_ndjson_import(self):
+        """
+        Test that NDJSON records become offers with details and a summary.
+        """
+        path = self._ndjson([offer_record(f'Offer {i}') for i in range(5)])
+
+        output = self._run(path, user='bizuser', batch_size=2)
+
+        self.assertIn('Imported 5 offers (5 details)', output)
+        self.assertEqual(Offer.objects.filter(user=self.user).count(), 5)
+        self.assertEqual(OfferDetail.objects.count(), 5)
+        self.assertEqual(Offer.objects.first().min_price, Decimal('50.00'))
+        self.assertEqual(get_platform_stats().offer_count, 5)
+
+    def test_csv_import(self):
+        """
+        Test that tier columns in a CSV row become nested details.
+        """
+        path = self._write('offers.csv', (
+            'user,title,description,basic_title,basic_delivery_time_in_days,basic_price,'
+            'basic_features,premium_title,premium_delivery_time_in_days,premium_price\n'
+            'bizuser,Logo,Design,Basic,7,100,Logo|Source file,Premium,2,300\n'
+        ))
+
+        self._run(path)
+        offer = Offer.objects.get()
+
+        self.assertEqual(offer.min_price, Decimal('100.00'))
+        self.assertEqual(offer.min_delivery_time, 2)
+        basic = offer.details.get(offer_type='basic')
+        self.assertEqual(basic.features, ['Logo', 'Source file'])
+
+    def test_invalid_records_rejected(self):
+        """
+        Test that invalid records are counted and written to the rejects file.
+        """
+        path = self._write('offers.ndjson', '\n'.join([
+            json.dumps(offer_record('Good', user='bizuser')),
+            json.dumps(offer_record('Bad price', price='abc', user='bizuser')),
+            json.dumps(offer_record('Unknown user', user='nobody')),
+            '{not json',
+        ]) + '\n')
+        rejects = os.path.join(self.dir, 'rejects.ndjson')
+
+        output = self._run(path, rejects=rejects)
+        with open(rejects, encoding='utf-8') as fh:
+            rejected = [json.loads(line)['record'] for line in fh]
+
+        self.assertIn('Rejected 3 records', output)
+        self.assertEqual(rejected, [2, 3, 4])
+        self.assertEqual(list(Offer.objects.values_list('title', flat=True)), ['Good'])
+
+    def test_resume_after_failed_batch(self):
+        """
+        Test that a failed batch is rolled back and --resume continues after the checkpoint.
+        """
+        path = self._ndjson([offer_record(f'Offer {i}') for i in range(4)])
+        original = OfferDetail.objects.bulk_create
+        calls = []
+
+        def fail_second_batch(objs, *args, **kwargs):
+            calls.append(1)
+            if len(calls) == 2:
+                raise DatabaseError('disk full')
+            return original(objs, *args, **kwargs)
+
+        with mock.patch.object(OfferDetail.objects, 'bulk_create', side_effect=fail_second_batch):
+            with self.assertRaises(CommandError):
+                self._run(path, user='bizuser', batch_size=2)
+
+        self.assertEqual(Offer.objects.count(), 2)
+        with open(f'{path}.checkpoint', encoding='utf-8') as fh:
+            self.assertEqual(json.load(fh), {'record': 2})
+
+        output = self._run(path, user='bizuser', batch_size=2, resume=True)
+
+        self.assertIn('Imported 2 offers', output)
+        self.assertEqual(
+            sorted(Offer.objects.values_list('title', flat=True)),
+            ['Offer 0', 'Offer 1', 'Offer 2', 'Offer 3']
+        )
+
+    def test_unknown_default_user(self):
+        """
+        Test that --user must name an existing business user.
+        """
+        path = self._ndjson([offer_record('Offer')])
+
+        with self.assertRaises(CommandError):
+            self._run(path, user='nobody')
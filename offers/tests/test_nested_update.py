@@ -0,0 +1,168 @@
+"""
+Tests for diff-based nested detail writes in OfferSerializer.
+"""
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+
+from core.query_budget import QueryBudgetTestMixin
+from offers.models import Offer, OfferDetail
+
+User = get_user_model()
+
+TIERS = ['basic', 'standard', 'premium']
+
+
+def tier(offer_type, price='10.00', days=3):
+    """
+    Build one complete nested detail payload.
+    """
+    return {
+        'title': offer_type.title(),
+        'revisions': 1,
+        'delivery_time_in_days': days,
+        'price': price,
+        'features': ['A'],
+        'offer_type': offer_type
+    }
+
+
+class OfferNestedDetailWriteTest(QueryBudgetTestMixin, APITestCase):
+    """
+    Tests that details are matched by offer_type instead of delete-and-recreate.
+    """
+
+    def setUp(self):
+        """
+        Create an authenticated business user.
+        """
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='bizuser',
+            email='biz@example.com',
+            password='TestPass123!',
+            type='business'
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+
+    def _create(self, tiers):
+        """
+        POST an offer with the given tiers and return it.
+        """
+        data = {'title': 'Offer', 'description': 'Test', 'details': [tier(t) for t in tiers]}
+        response = self.client.post('/api/offers/', data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return Offer.objects.get(id=response.data['id'])
+
+    def _patch_queries(self, offer, details):
+        """
+        PATCH details and return (response, number of statements).
+        """
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.patch(
+                f'/api/offers/{offer.id}/', {'details': details}, format='json'
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, len(ctx.captured_queries)
+
+    def _detail_ids(self, offer):
+        return dict(offer.details.values_list('offer_type', 'id'))
+
+    def test_create_uses_single_insert_for_details(self):
+        """
+        Test that three tiers are inserted with one INSERT statement.
+        """
+        with CaptureQueriesContext(connection) as ctx:
+            self._create(TIERS)
+
+        inserts = [q for q in ctx.captured_queries
+                   if q['sql'].startswith('INSERT INTO "offers_offerdetail"')]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(OfferDetail.objects.count(), 3)
+
+    def test_update_keeps_primary_keys(self):
+        """
+        Test that updating existing tiers keeps their ids.
+        """
+        offer = self._create(TIERS)
+        before = self._detail_ids(offer)
+
+        response, _ = self._patch_queries(offer, [tier(t, price='99.00') for t in TIERS])
+
+        self.assertEqual(self._detail_ids(offer), before)
+        self.assertTrue(all(d['price'] == '99.00' for d in response.data['details']))
+
+    def test_three_tier_update_is_constant(self):
+        """
+        Test that updating 1 or 3 tiers runs the same number of statements.
+        """
+        one = self._create(['basic'])
+        three = self._create(TIERS)
+
+        _, one_queries = self._patch_queries(one, [tier('basic', price='20.00')])
+        _, three_queries = self._patch_queries(three, [tier(t, price='20.00') for t in TIERS])
+
+        self.assertEqual(one_queries, three_queries)
+
+    def test_partial_tier_fields(self):
+        """
+        Test that a tier can be patched with only some of its fields.
+        """
+        offer = self._create(['basic'])
+
+        self._patch_queries(offer, [{'offer_type': 'basic', 'price': '55.00'}])
+        detail = offer.details.get()
+
+        self.assertEqual(str(detail.price), '55.00')
+        self.assertEqual(detail.delivery_time_in_days, 3)
+        offer.refresh_from_db()
+        self.assertEqual(str(offer.min_price), '55.00')
+
+    def test_added_and_removed_tiers(self):
+        """
+        Test that new offer_types are created and missing ones deleted within budget.
+        """
+        offer = self._create(['basic', 'standard'])
+        basic_id = self._detail_ids(offer)['basic']
+
+        response = self.assertWithinQueryBudget(
+            'patch', f'/api/offers/{offer.id}/',
+            {'details': [tier('basic'), tier('premium')]}, format='json'
+        )
+        ids = self._detail_ids(offer)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(ids), {'basic', 'premium'})
+        self.assertEqual(ids['basic'], basic_id)
+
+    def test_duplicate_offer_type_rejected(self):
+        """
+        Test that the same offer_type twice returns 400.
+        """
+        data = {'title': 'Offer', 'description': 'Test', 'details': [tier('basic'), tier('basic')]}
+        response = self.client.post('/api/offers/', data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Offer.objects.count(), 0)
+
+    def test_incomplete_new_tier_rejected(self):
+        """
+        Test that a new tier missing required fields returns 400 and changes nothing.
+        """
+        offer = self._create(['basic'])
+
+        response = self.client.patch(
+            f'/api/offers/{offer.id}/',
+            {'title': 'Changed', 'details': [{'offer_type': 'premium', 'price': '5.00'}]},
+            format='json'
+        )
+        offer.refresh_from_db()
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(offer.title, 'Offer')
+        self.assertEqual(set(self._detail_ids(offer)), {'basic'})
@@ -0,0 +1,178 @@
+"""
+Tests for keyset cursor pagination on GET /api/offers/.
+"""
+
+from datetime import timedelta
+from unittest import skipUnless
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+
+from offers.models import Offer
+
+User = get_user_model()
+
+
+class OfferPaginationAPITest(APITestCase):
+    """
+    Tests for cursor-based paging ordered on (-created_at, id).
+    """
+
+    def setUp(self):
+        """
+        Create one business user and seven offers, three sharing a timestamp.
+        """
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='bizuser',
+            email='biz@example.com',
+            password='TestPass123!',
+            type='business'
+        )
+        for i in range(7):
+            Offer.objects.create(user=self.user, title=f'Offer {i}', description='Test')
+
+        base = timezone.now()
+        offers = list(Offer.objects.order_by('id'))
+        for i, offer in enumerate(offers):
+            # Offers 4, 5 and 6 share the newest timestamp to exercise the id tiebreaker.
+            offer.created_at = base + timedelta(minutes=min(i, 4))
+        Offer.objects.bulk_update(offers, ['created_at'])
+
+        self.expected_ids = list(
+            Offer.objects.order_by('-created_at', 'id').values_list('id', flat=True)
+        )
+
+    def _collect_forward(self, page_size):
+        """
+        Walk all pages via 'next' links and return ids and responses.
+        """
+        ids, pages = [], []
+        url = f'/api/offers/?page_size={page_size}'
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            pages.append(response.data)
+            ids.extend(item['id'] for item in response.data['results'])
+            url = response.data['next']
+        return ids, pages
+
+    def test_first_page_shape(self):
+        """
+        Test that the response contains next, previous and results.
+        """
+        response = self.client.get('/api/offers/?page_size=3')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.data.keys()), {'next', 'previous', 'results'})
+        self.assertEqual(len(response.data['results']), 3)
+        self.assertIsNotNone(response.data['next'])
+        self.assertIsNone(response.data['previous'])
+
+    def test_walk_forward_visits_every_offer_once(self):
+        """
+        Test that following next links yields all offers in key order.
+        """
+        ids, pages = self._collect_forward(page_size=2)
+
+        self.assertEqual(ids, self.expected_ids)
+        self.assertEqual(len(pages), 4)
+        self.assertIsNone(pages[-1]['next'])
+
+    def test_walk_backward_returns_previous_pages(self):
+        """
+        Test that previous links return the same pages in reverse.
+        """
+        _, pages = self._collect_forward(page_size=2)
+
+        response = self.client.get(pages[-1]['previous'])
+        self.assertEqual(response.data['results'], pages[-2]['results'])
+
+        response = self.client.get(response.data['previous'])
+        self.assertEqual(response.data['results'], pages[-3]['results'])
+
+    def test_page_size_is_capped(self):
+        """
+        Test that page_size above max_page_size is clamped.
+        """
+        response = self.client.get('/api/offers/?page_size=100000')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 7)
+
+    def test_invalid_cursor_returns_404(self):
+        """
+        Test that a tampered cursor is rejected.
+        """
+        response = self.client.get('/api/offers/?cursor=cD1nYXJiYWdl')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_no_count_or_offset_on_deep_page(self):
+        """
+        Test that a deep page uses a keyset WHERE clause, not COUNT or OFFSET.
+        """
+        _, pages = self._collect_forward(page_size=2)
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(pages[-2]['next'])
+
+        offer_sql = [
+            q['sql'] for q in ctx.captured_queries
+            if 'FROM "offers_offer"' in q['sql']
+        ]
+        self.assertTrue(offer_sql)
+        for sql in offer_sql:
+            self.assertNotIn('COUNT(', sql.upper())
+            self.assertNotIn('OFFSET', sql.upper())
+
+
+@skipUnless(connection.vendor == 'sqlite', 'Checks SQLite query plans.')
+class OfferPaginationQueryPlanTest(APITestCase):
+    """
+    Tests that SQLite reads offer pages in index order without sorting.
+    """
+
+    def setUp(self):
+        """
+        Create a business user with a few offers.
+        """
+        self.user = User.objects.create_user(username='bizuser', type='business')
+        for i in range(3):
+            Offer.objects.create(user=self.user, title=f'Offer {i}', description='Test')
+
+    def _plan(self, url):
+        """
+        Return the EXPLAIN QUERY PLAN details of the page query for a URL.
+        """
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        sql = next(q['sql'] for q in ctx.captured_queries if 'FROM "offers_offer"' in q['sql'])
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+            return [row[-1] for row in cursor.fetchall()], response
+
+    def _assert_index_ordered(self, plan):
+        self.assertTrue(any('offer_created_at_id_idx' in step for step in plan), plan)
+        self.assertFalse(any('TEMP B-TREE' in step for step in plan), plan)
+
+    def test_first_page_plan(self):
+        """
+        Test that the first page walks the (-created_at, id) index.
+        """
+        plan, _ = self._plan('/api/offers/?page_size=1')
+
+        self._assert_index_ordered(plan)
+
+    def test_cursor_page_plan(self):
+        """
+        Test that a page after a cursor walks the index from the cursor.
+        """
+        _, response = self._plan('/api/offers/?page_size=1')
+        plan, _ = self._plan(response.data['next'])
+
+        self._assert_index_ordered(plan)
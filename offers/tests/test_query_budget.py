@@ -0,0 +1,166 @@
+"""
+Query budget tests for offer endpoints.
+Every view in offers/api/views.py must stay within its declared query_budget,
+and list/detail reads must not grow with the number of rows.
+"""
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+
+from core.query_budget import QueryBudgetExceeded, QueryBudgetTestMixin
+from offers.api.views import OfferListCreateView
+from offers.models import Offer, OfferDetail
+from orders.counters import get_order_count
+from orders.models import Order
+
+User = get_user_model()
+
+
+def make_offer(user, title='Offer'):
+    """
+    Create an offer with basic, standard and premium details.
+    """
+    offer = Offer.objects.create(user=user, title=title, description='Test')
+    for i, offer_type in enumerate(['basic', 'standard', 'premium'], start=1):
+        OfferDetail.objects.create(
+            offer=offer,
+            title=offer_type.title(),
+            revisions=i,
+            delivery_time_in_days=i * 2,
+            price=50 * i,
+            features=['Feature'] * i,
+            offer_type=offer_type
+        )
+    return offer
+
+
+class OfferQueryBudgetTest(QueryBudgetTestMixin, APITestCase):
+    """
+    Tests that offer endpoints respect their query budgets.
+    """
+
+    def setUp(self):
+        """
+        Create a business user with a token and one offer.
+        """
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='bizuser',
+            email='biz@example.com',
+            password='TestPass123!',
+            type='business'
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.offer = make_offer(self.user)
+
+    def _count_list_queries(self):
+        """
+        Return the number of queries run by GET /api/offers/.
+        """
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/offers/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(ctx.captured_queries)
+
+    def test_list_query_count_is_constant(self):
+        """
+        Test that listing 1 or 15 offers runs the same number of queries.
+        """
+        single = self._count_list_queries()
+        for i in range(14):
+            make_offer(self.user, title=f'Offer {i}')
+        many = self._count_list_queries()
+
+        self.assertEqual(single, many)
+
+    def test_list_within_budget(self):
+        """
+        Test GET /api/offers/ with several offers.
+        """
+        for i in range(5):
+            make_offer(self.user, title=f'Offer {i}')
+        self.assertWithinQueryBudget('get', '/api/offers/')
+
+    def test_retrieve_within_budget(self):
+        """
+        Test GET /api/offers/<id>/.
+        """
+        self.assertWithinQueryBudget('get', f'/api/offers/{self.offer.id}/')
+
+    def test_create_within_budget(self):
+        """
+        Test POST /api/offers/ with three tiers.
+        """
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+        data = {
+            'title': 'New',
+            'description': 'New offer',
+            'details': [
+                {
+                    'title': offer_type,
+                    'revisions': 1,
+                    'delivery_time_in_days': 3,
+                    'price': '10.00',
+                    'features': [],
+                    'offer_type': offer_type
+                }
+                for offer_type in ['basic', 'standard', 'premium']
+            ]
+        }
+        response = self.assertWithinQueryBudget('post', '/api/offers/', data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_update_within_budget(self):
+        """
+        Test PATCH /api/offers/<id>/.
+        """
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+        response = self.assertWithinQueryBudget(
+            'patch', f'/api/offers/{self.offer.id}/', {'title': 'Renamed'}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_delete_within_budget(self):
+        """
+        Test DELETE /api/offers/<id>/ of an offer whose orders cascade.
+        """
+        customer = User.objects.create_user(username='customer', type='customer')
+        detail = self.offer.details.first()
+        for order_status in ['pending', 'pending', 'in_progress', 'completed', 'cancelled']:
+            Order.objects.create(
+                customer_user=customer, business_user=self.user, offer=self.offer,
+                offer_detail=detail, title='Order', status=order_status
+            )
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+
+        response = self.assertWithinQueryBudget('delete', f'/api/offers/{self.offer.id}/')
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Order.objects.exists())
+        for order_status in ['pending', 'in_progress', 'completed', 'cancelled']:
+            self.assertEqual(get_order_count(self.user.id, order_status), 0)
+
+    def test_offerdetail_item_within_budget(self):
+        """
+        Test GET /api/offerdetails/<id>/.
+        """
+        detail = self.offer.details.first()
+        self.assertWithinQueryBudget('get', f'/api/offerdetails/{detail.id}/')
+
+    @override_settings(QUERY_BUDGET_STRICT=True)
+    def test_strict_mode_raises_on_overrun(self):
+        """
+        Test that exceeding the budget raises in strict mode.
+        """
+        original = OfferListCreateView.query_budget
+        OfferListCreateView.query_budget = {'GET': 0}
+        try:
+            with self.assertRaises(QueryBudgetExceeded):
+                self.client.get('/api/offers/')
+        finally:
+            OfferListCreateView.query_budget = original
@@ -0,0 +1,113 @@
+"""
+Tests that OfferReader output is byte-identical to OfferSerializer.
+"""
+
+import json
+
+from django.contrib.auth import get_user_model
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APITestCase, APIClient, APIRequestFactory
+
+from offers.api.readers import OfferReader
+from offers.api.serializers import OfferSerializer
+from offers.models import Offer, OfferDetail
+
+User = get_user_model()
+
+
+class OfferReaderTest(APITestCase):
+    """
+    Tests the values()-based read path against the ModelSerializer.
+    """
+
+    def setUp(self):
+        """
+        Create offers covering images, derivatives, empty summaries and unicode.
+        """
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='bizuser',
+            email='biz@example.com',
+            password='TestPass123!',
+            type='business'
+        )
+        with_image = Offer.objects.create(
+            user=self.user, title='Logo Design', description='Vektor',
+            image='offers/logo.png',
+            image_derivatives={
+                'source': 'offers/logo.png',
+                'thumbnail': 'offers/derivatives/1/logo_thumbnail.jpg',
+                'detail': 'offers/derivatives/1/logo_detail.jpg',
+            },
+            min_price='1234.50', min_delivery_time=2
+        )
+        for offer_type, price in [('premium', '9999.99'), ('basic', '1234.50'), ('standard', '2000')]:
+            OfferDetail.objects.create(
+                offer=with_image, title=offer_type.title(), revisions=-1,
+                delivery_time_in_days=2, price=price,
+                features=['Logo', 'Quelldatei ✓'], offer_type=offer_type
+            )
+        Offer.objects.create(
+            user=self.user, title='Übersetzung „Deutsch“', description='Ä ö ü',
+            image='offers/stale.png', image_derivatives={'source': 'offers/old.png'}
+        )
+        Offer.objects.create(user=self.user, title='No details', description='')
+
+    def _render_both(self, queryset, request=None):
+        context = {'request': Request(request)} if request is not None else {}
+        expected = JSONRenderer().render(OfferSerializer(queryset, many=True, context=context).data)
+        reader = OfferReader(context)
+        actual = JSONRenderer().render(reader.serialize(list(reader.project(queryset))))
+        return expected, actual
+
+    def test_byte_identical_without_request(self):
+        """
+        Test identical output with relative media URLs.
+        """
+        queryset = Offer.objects.select_related('user').prefetch_related('details')
+
+        expected, actual = self._render_both(queryset)
+
+        self.assertEqual(actual, expected)
+
+    def test_byte_identical_with_request(self):
+        """
+        Test identical output with absolute media URLs built from the request.
+        """
+        queryset = Offer.objects.select_related('user').prefetch_related('details')
+        request = APIRequestFactory().get('/api/offers/')
+
+        expected, actual = self._render_both(queryset, request)
+
+        self.assertEqual(actual, expected)
+        self.assertIn(b'http://testserver/media/offers/derivatives/1/logo_thumbnail.jpg', actual)
+
+    def test_list_endpoint_matches_serializer(self):
+        """
+        Test that GET /api/offers/ renders the same items as OfferSerializer.
+        """
+        response = self.client.get('/api/offers/')
+        queryset = Offer.objects.select_related('user').prefetch_related('details').order_by(
+            '-created_at', 'id'
+        )
+        request = Request(APIRequestFactory().get('/api/offers/'))
+        expected = OfferSerializer(queryset, many=True, context={'request': request}).data
+
+        self.assertEqual(
+            json.loads(response.content)['results'],
+            json.loads(JSONRenderer().render(expected))
+        )
+
+    def test_search_and_pagination_on_rows(self):
+        """
+        Test that relevance ordering and cursors work on values() rows.
+        """
+        titles = []
+        url = '/api/offers/?search=logo&page_size=1'
+        while url:
+            response = self.client.get(url)
+            titles.extend(item['title'] for item in response.data['results'])
+            url = response.data['next']
+
+        self.assertEqual(titles, ['Logo Design'])
@@ -0,0 +1,163 @@
+"""
+Tests for the versioned response cache on public offer reads.
+"""
+
+import tempfile
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+
+from core.response_cache import get_stats
+from offers.models import Offer, OfferDetail
+from offers.signals import OFFERS_CACHE_NAMESPACE
+
+User = get_user_model()
+
+
+@override_settings(RESPONSE_CACHE_ENABLED=True)
+class OfferResponseCacheTest(APITestCase):
+    """
+    Tests cache hits, invalidation and counters for GET /api/offers/.
+    """
+
+    def setUp(self):
+        """
+        Clear the cache and create an owner with one offer.
+        """
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='bizuser',
+            email='biz@example.com',
+            password='TestPass123!',
+            type='business'
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.offer = Offer.objects.create(user=self.user, title='Logo', description='Test')
+        self.detail = OfferDetail.objects.create(
+            offer=self.offer, title='Basic', revisions=1, delivery_time_in_days=3,
+            price=10, features=[], offer_type='basic'
+        )
+
+    def _get(self, url):
+        """
+        Return (response, query count) for an anonymous GET.
+        """
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, len(ctx.captured_queries)
+
+    def test_second_request_is_served_from_cache(self):
+        """
+        Test that a repeated anonymous GET runs no queries.
+        """
+        first, first_queries = self._get('/api/offers/')
+        second, second_queries = self._get('/api/offers/')
+
+        self.assertGreater(first_queries, 0)
+        self.assertEqual(second_queries, 0)
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(get_stats(OFFERS_CACHE_NAMESPACE)['hits'], 1)
+        self.assertEqual(get_stats(OFFERS_CACHE_NAMESPACE)['misses'], 1)
+
+    def test_query_string_is_normalized(self):
+        """
+        Test that parameter order does not create a second entry.
+        """
+        self._get('/api/offers/?ordering=min_price&page_size=5')
+        _, queries = self._get('/api/offers/?page_size=5&ordering=min_price')
+
+        self.assertEqual(queries, 0)
+
+    def test_detail_is_cached(self):
+        """
+        Test that GET /api/offers/<id>/ is cached too.
+        """
+        self._get(f'/api/offers/{self.offer.id}/')
+        _, queries = self._get(f'/api/offers/{self.offer.id}/')
+
+        self.assertEqual(queries, 0)
+
+    def test_api_update_invalidates(self):
+        """
+        Test that a PATCH through the serializer invalidates cached reads.
+        """
+        self._get(f'/api/offers/{self.offer.id}/')
+
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+        self.client.patch(f'/api/offers/{self.offer.id}/', {'title': 'New'}, format='json')
+        self.client.credentials()
+
+        response, queries = self._get(f'/api/offers/{self.offer.id}/')
+        self.assertGreater(queries, 0)
+        self.assertEqual(response.data['title'], 'New')
+
+    def test_detail_write_invalidates(self):
+        """
+        Test that saving an OfferDetail directly (as the admin does) invalidates.
+        """
+        self._get('/api/offers/')
+        self.detail.price = 99
+        self.detail.save()
+
+        response, _ = self._get('/api/offers/')
+        self.assertEqual(response.data['results'][0]['details'][0]['price'], '99.00')
+
+    def test_summary_updates_invalidate(self):
+        """
+        Test that summary rebuilds, which bypass post_save, invalidate cached reads.
+        """
+        self._get(f'/api/offers/{self.offer.id}/')
+        OfferDetail.objects.filter(pk=self.detail.pk).update(price=7)
+
+        self.offer.refresh_detail_summary()
+        refreshed, _ = self._get(f'/api/offers/{self.offer.id}/')
+        OfferDetail.objects.filter(pk=self.detail.pk).update(price=5)
+        call_command('rebuild_offer_summaries', stdout=StringIO())
+        rebuilt, _ = self._get(f'/api/offers/{self.offer.id}/')
+
+        self.assertEqual(refreshed.data['min_price'], '7.00')
+        self.assertEqual(rebuilt.data['min_price'], '5.00')
+
+    def test_authenticated_requests_bypass_cache(self):
+        """
+        Test that authenticated GETs are neither served from nor stored in cache.
+        """
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+        self.client.get('/api/offers/')
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get('/api/offers/')
+
+        self.assertGreater(len(ctx.captured_queries), 0)
+        self.assertEqual(get_stats(OFFERS_CACHE_NAMESPACE)['hits'], 0)
+
+    def test_file_based_backend(self):
+        """
+        Test hits and invalidation with the file-based cache backend.
+        """
+        with tempfile.TemporaryDirectory() as location:
+            file_cache = {
+                'default': {
+                    'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+                    'LOCATION': location,
+                }
+            }
+            with override_settings(CACHES=file_cache):
+                self._get('/api/offers/')
+                _, cached_queries = self._get('/api/offers/')
+
+                self.offer.title = 'Changed'
+                self.offer.save()
+                response, _ = self._get('/api/offers/')
+
+        self.assertEqual(cached_queries, 0)
+        self.assertEqual(response.data['results'][0]['title'], 'Changed')
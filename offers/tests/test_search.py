@@ -0,0 +1,191 @@
+"""
+Tests for full-text search on GET /api/offers/?search=.
+"""
+
+from io import StringIO
+from unittest import skipUnless
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TransactionTestCase
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+
+from offers.models import Offer
+from offers.search import FTS_TABLE, build_match_query
+
+User = get_user_model()
+
+
+class OfferSearchAPITest(APITestCase):
+    """
+    Tests that ?search= uses the FTS5 index and that the index stays in sync.
+
+    Ranking, accent folding and the index itself are SQLite-only; other
+    backends run the matching tests against the icontains fallback.
+    """
+
+    def setUp(self):
+        """
+        Create a business user and a few offers.
+        """
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='bizuser',
+            email='biz@example.com',
+            password='TestPass123!',
+            type='business'
+        )
+        self.logo = Offer.objects.create(
+            user=self.user, title='Logo Design', description='Vector artwork for brands'
+        )
+        self.website = Offer.objects.create(
+            user=self.user, title='Website', description='Landing page with your logo'
+        )
+        self.copy = Offer.objects.create(
+            user=self.user, title='Copywriting', description='Texts for newsletters'
+        )
+
+    def _search_ids(self, text):
+        """
+        Return offer ids for a search, in response order.
+        """
+        response = self.client.get('/api/offers/', {'search': text})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [item['id'] for item in response.data['results']]
+
+    def test_search_title_and_description(self):
+        """
+        Test that matches in either column are returned.
+        """
+        self.assertEqual(set(self._search_ids('logo')), {self.logo.id, self.website.id})
+
+    @skipUnless(connection.vendor == 'sqlite', 'Needs the SQLite FTS5 index.')
+    def test_title_match_ranks_first(self):
+        """
+        Test BM25 ranking with title weighted above description.
+        """
+        self.assertEqual(self._search_ids('logo'), [self.logo.id, self.website.id])
+
+    @skipUnless(connection.vendor == 'sqlite', 'Needs the SQLite FTS5 index.')
+    def test_prefix_and_accent_insensitive(self):
+        """
+        Test that partial words and diacritics still match.
+        """
+        self.assertEqual(self._search_ids('copywr'), [self.copy.id])
+        self.assertEqual(self._search_ids('lógo desi'), [self.logo.id])
+
+    def test_index_follows_update_and_delete(self):
+        """
+        Test that triggers keep the index in sync with ORM and raw SQL writes.
+        """
+        self.copy.title = 'Illustration'
+        self.copy.save()
+        with connection.cursor() as cursor:
+            cursor.execute('DELETE FROM offers_offer WHERE id = %s', [self.website.id])
+
+        self.assertEqual(self._search_ids('illustration'), [self.copy.id])
+        self.assertEqual(self._search_ids('copywriting'), [])
+        self.assertEqual(self._search_ids('landing'), [])
+
+    def test_bulk_create_is_indexed(self):
+        """
+        Test that rows written without save() are indexed too.
+        """
+        Offer.objects.bulk_create([
+            Offer(user=self.user, title=f'Podcast {i}', description='Audio') for i in range(3)
+        ])
+        self.assertEqual(len(self._search_ids('podcast')), 3)
+
+    def test_search_is_paginated_by_rank(self):
+        """
+        Test that relevance-ordered results page without gaps or duplicates.
+        """
+        for i in range(5):
+            Offer.objects.create(user=self.user, title=f'Logo {i}', description='logo ' * i)
+
+        ids, url = [], '/api/offers/?search=logo&page_size=2'
+        while url:
+            response = self.client.get(url)
+            ids.extend(item['id'] for item in response.data['results'])
+            url = response.data['next']
+
+        self.assertEqual(len(ids), 7)
+        self.assertEqual(len(set(ids)), 7)
+
+    def test_explicit_ordering_overrides_rank(self):
+        """
+        Test that ?ordering= takes precedence over relevance.
+        """
+        response = self.client.get('/api/offers/', {'search': 'logo', 'ordering': 'created_at'})
+        ids = [item['id'] for item in response.data['results']]
+        self.assertEqual(ids, [self.logo.id, self.website.id])
+
+    def test_query_syntax_is_escaped(self):
+        """
+        Test that FTS operators in user input do not cause errors.
+        """
+        self.assertEqual(build_match_query('logo" OR *'), '"logo"* "OR"*')
+        self.assertEqual(self._search_ids('"logo" NEAR('), [])
+        self.assertEqual(self._search_ids('***'), [])
+
+    @skipUnless(connection.vendor == 'sqlite', 'Needs the SQLite FTS5 index.')
+    def test_rebuild_command(self):
+        """
+        Test that the rebuild command restores a wiped index.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('delete-all')")
+        self.assertEqual(self._search_ids('logo'), [])
+
+        call_command('rebuild_offer_search_index', stdout=StringIO())
+
+        self.assertEqual(set(self._search_ids('logo')), {self.logo.id, self.website.id})
+
+
+@skipUnless(connection.vendor == 'sqlite', 'Needs the SQLite FTS5 index.')
+class OfferSearchMigrationTest(TransactionTestCase):
+    """
+    Tests that the FTS5 table and its triggers belong to migration offers 0006.
+    """
+
+    def _fts_objects(self):
+        """
+        Return the names of the FTS5 table and the triggers on offers_offer.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT name FROM sqlite_master "
+                "WHERE name = %s OR (type = 'trigger' AND tbl_name = 'offers_offer')",
+                [FTS_TABLE]
+            )
+            return sorted(name for name, in cursor.fetchall())
+
+    def _migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.migrate(targets)
+
+    def test_migration_is_reversible(self):
+        """
+        Test that unapplying 0006 drops the index and reapplying indexes existing offers.
+        """
+        latest = MigrationExecutor(connection).loader.graph.leaf_nodes('offers')
+        self.addCleanup(self._migrate, latest)
+
+        self._migrate([('offers', '0005_offer_image_derivatives')])
+        unapplied = self._fts_objects()
+        user = User.objects.create_user(username='bizuser', type='business')
+        offer = Offer.objects.create(user=user, title='Logo Design', description='Vector')
+        self._migrate(latest)
+
+        self.assertEqual(unapplied, [])
+        self.assertEqual(
+            self._fts_objects(),
+            [FTS_TABLE, f'{FTS_TABLE}_ad', f'{FTS_TABLE}_ai', f'{FTS_TABLE}_au']
+        )
+        self.assertEqual(
+            list(Offer.objects.filter(search_index__document__match='logo').values_list('id', flat=True)),
+            [offer.id]
+        )
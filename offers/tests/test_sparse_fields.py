@@ -0,0 +1,151 @@
+"""
+Tests for ?fields= / ?omit= on the offer endpoints.
+"""
+
+import json
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+
+from offers.models import Offer, OfferDetail
+
+User = get_user_model()
+
+
+class OfferSparseFieldsTest(APITestCase):
+    """
+    Tests output trimming, payload size and query shape.
+    """
+
+    def setUp(self):
+        """
+        Create offers with long descriptions and three tiers each.
+        """
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='bizuser',
+            email='biz@example.com',
+            password='TestPass123!',
+            type='business'
+        )
+        for i in range(3):
+            offer = Offer.objects.create(
+                user=self.user, title=f'Offer {i}', description='Long text ' * 200,
+                min_price=10 + i, min_delivery_time=3
+            )
+            for offer_type in ('basic', 'standard', 'premium'):
+                OfferDetail.objects.create(
+                    offer=offer, title=offer_type.title(), revisions=1,
+                    delivery_time_in_days=3, price=10 + i,
+                    features=['Feature'] * 20, offer_type=offer_type
+                )
+        self.offer = offer
+
+    def _get(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, [q['sql'] for q in ctx.captured_queries]
+
+    def test_list_fields(self):
+        """
+        Test that ?fields= returns only the listed fields and skips details.
+        """
+        response, queries = self._get('/api/offers/?fields=id,title,image,min_price')
+        item = response.data['results'][0]
+
+        self.assertEqual(list(item), ['id', 'title', 'image', 'min_price'])
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('"description"', queries[0])
+        self.assertNotIn('offers_offerdetail', queries[0])
+
+    def test_list_payload_smaller(self):
+        """
+        Test that the mobile field set shrinks the payload substantially.
+        """
+        full, _ = self._get('/api/offers/')
+        sparse, _ = self._get('/api/offers/?fields=id,title,image,min_price')
+
+        self.assertLess(len(sparse.content) * 10, len(full.content))
+
+    def test_list_nested_fields(self):
+        """
+        Test that dotted names select inside details and project their columns.
+        """
+        response, queries = self._get('/api/offers/?fields=id,details.offer_type,details.price')
+        item = response.data['results'][0]
+
+        self.assertEqual(list(item), ['id', 'details'])
+        self.assertEqual(list(item['details'][0]), ['price', 'offer_type'])
+        self.assertNotIn('"features"', queries[1])
+
+    def test_list_omit(self):
+        """
+        Test that ?omit= drops top-level and nested fields.
+        """
+        response, queries = self._get('/api/offers/?omit=description,details.features')
+        item = response.data['results'][0]
+
+        self.assertNotIn('description', item)
+        self.assertNotIn('features', item['details'][0])
+        self.assertIn('title', item['details'][0])
+        self.assertNotIn('"description"', queries[0])
+
+    def test_list_cursor_pagination_with_fields(self):
+        """
+        Test that cursors still work when ordering keys are not rendered.
+        """
+        titles = []
+        url = '/api/offers/?fields=title&ordering=-min_price&page_size=2'
+        while url:
+            response, _ = self._get(url)
+            titles.extend(item['title'] for item in response.data['results'])
+            url = response.data['next']
+
+        self.assertEqual(titles, ['Offer 2', 'Offer 1', 'Offer 0'])
+
+    def test_detail_fields_use_only(self):
+        """
+        Test that the detail endpoint defers unused columns and skips the prefetch.
+        """
+        response, queries = self._get(f'/api/offers/{self.offer.id}/?fields=id,title')
+
+        self.assertEqual(json.loads(response.content), {'id': self.offer.id, 'title': 'Offer 2'})
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('"description"', queries[0])
+        self.assertNotIn('accounts_user', queries[0])
+
+    def test_offerdetail_item_fields(self):
+        """
+        Test ?fields= on GET /api/offerdetails/<id>/.
+        """
+        detail = self.offer.details.first()
+
+        response, _ = self._get(f'/api/offerdetails/{detail.id}/?fields=price')
+
+        self.assertEqual(response.data, {'price': '12.00'})
+
+    def test_unknown_field(self):
+        """
+        Test that an unknown field name returns 400.
+        """
+        response = self.client.get('/api/offers/?fields=id,password')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_ignored_on_write(self):
+        """
+        Test that ?fields= does not hide fields from validation on PATCH.
+        """
+        self.client.force_authenticate(self.user)
+
+        response = self.client.patch(
+            f'/api/offers/{self.offer.id}/?fields=id', {'title': 'Renamed'}, format='json'
+        )
+        self.offer.refresh_from_db()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.offer.title, 'Renamed')
@@ -0,0 +1,110 @@
+"""
+Tests for ?stream=1 on GET /api/offers/.
+"""
+
+import json
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.http import StreamingHttpResponse
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase, APIClient
+
+from core.streaming import stream_json_array
+from offers.api.views import OfferListCreateView
+from offers.models import Offer, OfferDetail
+
+User = get_user_model()
+
+
+class StreamJsonArrayTest(APITestCase):
+    """
+    Tests for the chunked JSON array generator.
+    """
+
+    def test_valid_json_for_any_size(self):
+        """
+        Test that empty, partial and exact chunks all produce a valid array.
+        """
+        for count in (0, 1, 3, 4, 7):
+            content = b''.join(stream_json_array(
+                iter(range(count)), 4, lambda chunk: [{'n': n} for n in chunk]
+            ))
+            self.assertEqual(json.loads(content), [{'n': n} for n in range(count)])
+
+    def test_one_piece_per_chunk(self):
+        """
+        Test that output is yielded per chunk, not buffered until the end.
+        """
+        pieces = list(stream_json_array(iter(range(10)), 4, lambda chunk: list(chunk)))
+
+        self.assertEqual(pieces, [b'[', b'0,1,2,3', b',4,5,6,7', b',8,9', b']'])
+
+
+class OfferStreamingAPITest(APITestCase):
+    """
+    Tests that the streamed offer list matches the paginated one.
+    """
+
+    def setUp(self):
+        """
+        Create offers with one detail each.
+        """
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='bizuser',
+            email='biz@example.com',
+            password='TestPass123!',
+            type='business'
+        )
+        for i in range(7):
+            offer = Offer.objects.create(
+                user=self.user, title=f'Offer {i}', description='Test', min_price=i
+            )
+            OfferDetail.objects.create(
+                offer=offer, title='Basic', revisions=1, delivery_time_in_days=3,
+                price=i, features=['A'], offer_type='basic'
+            )
+
+    def _stream(self, query=''):
+        response = self.client.get(f'/api/offers/?stream=1&{query}')
+        self.assertIsInstance(response, StreamingHttpResponse)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        return json.loads(b''.join(response.streaming_content))
+
+    def test_matches_paginated_items(self):
+        """
+        Test that streaming returns every item, identical to the paginated pages.
+        """
+        paged = []
+        url = '/api/offers/?page_size=3'
+        while url:
+            response = self.client.get(url)
+            paged.extend(json.loads(response.content)['results'])
+            url = response.data['next']
+
+        self.assertEqual(self._stream(), paged)
+
+    def test_filters_and_ordering_apply(self):
+        """
+        Test that filters and ?ordering= still apply when streaming.
+        """
+        items = self._stream('min_price=4&ordering=min_price')
+
+        self.assertEqual([item['title'] for item in items], ['Offer 4', 'Offer 5', 'Offer 6'])
+
+    def test_queries_per_chunk(self):
+        """
+        Test that offers are read by one cursor and details prefetched per chunk.
+        """
+        with mock.patch.object(OfferListCreateView, 'stream_chunk_size', 3):
+            response = self.client.get('/api/offers/?stream=1')
+            with CaptureQueriesContext(connection) as ctx:
+                items = json.loads(b''.join(response.streaming_content))
+
+        self.assertEqual(len(items), 7)
+        # One offer SELECT fetched in chunks, plus a detail prefetch for each
+        # of the 3 chunks (3 + 3 + 1 offers)
+        self.assertEqual(len(ctx.captured_queries), 4)
+
@@ -0,0 +1,108 @@
+"""
+Serializers for order management.
+"""
+
+from django.db import transaction
+from rest_framework import serializers
+from rest_framework.exceptions import NotFound
+
+from core.write_queue import run_write
+from offers.models import OfferDetail
+from orders.models import SNAPSHOT_FIELDS, Order
+
+
+class OrderSerializer(serializers.ModelSerializer):
+    """
+    Serializer for Order.
+
+    Creating an order only takes ``offer_detail_id``; offer,
+    business_user and the package terms (title, revisions, delivery
+    time, price, features, offer_type) are copied from that OfferDetail.
+    """
+
+    offer_detail_id = serializers.IntegerField(write_only=True)
+
+    class Meta:
+        model = Order
+        fields = [
+            'id',
+            'customer_user',
+            'business_user',
+            'offer',
+            'offer_detail',
+            'offer_detail_id',
+            'title',
+            'revisions',
+            'delivery_time_in_days',
+            'price',
+            'features',
+            'offer_type',
+            'status',
+            'created_at',
+            'updated_at'
+        ]
+        read_only_fields = [
+            'customer_user', 'business_user', 'offer', 'offer_detail',
+            'title', 'revisions', 'delivery_time_in_days', 'price', 'features',
+            'offer_type', 'status', 'created_at', 'updated_at'
+        ]
+
+    def validate_offer_detail_id(self, value):
+        """
+        Load the OfferDetail and its offer owner in one query.
+
+        Returns:
+            OfferDetail: Detail with ``offer`` joined, holding only the
+                columns the order copies.
+
+        Raises:
+            NotFound: No OfferDetail with this id.
+        """
+        queryset = OfferDetail.objects.select_related('offer').only(
+            'offer_id', 'offer__user_id', *SNAPSHOT_FIELDS
+        )
+        try:
+            return queryset.get(pk=value)
+        except OfferDetail.DoesNotExist:
+            raise NotFound('Offer detail not found.')
+
+    def create(self, validated_data):
+        """
+        Insert the order in a short transaction.
+
+        Expects ``customer_user`` from serializer.save(). The insert goes
+        through the write queue (core.write_queue) when it is enabled.
+        """
+        detail = validated_data['offer_detail_id']
+        order = Order(
+            customer_user=validated_data['customer_user'],
+            business_user_id=detail.offer.user_id,
+            offer_id=detail.offer_id,
+            offer_detail=detail,
+            **{field: getattr(detail, field) for field in SNAPSHOT_FIELDS}
+        )
+        run_write(self._insert, order)
+        return order
+
+    @staticmethod
+    def _insert(order):
+        with transaction.atomic():
+            order.save(force_insert=True)
+
+
+class BulkOrderStatusSerializer(serializers.Serializer):
+    """
+    Input of PATCH /api/orders/bulk-status/.
+
+    ``ids`` is de-duplicated keeping its order.
+    """
+
+    MAX_IDS = 500
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), min_length=1, max_length=MAX_IDS
+    )
+    status = serializers.ChoiceField(choices=Order.STATUS_CHOICES)
+
+    def validate_ids(self, value):
+        return list(dict.fromkeys(value))
@@ -0,0 +1,23 @@
+"""
+URL configuration for orders app.
+"""
+
+from django.urls import path
+from . import views
+
+app_name = 'orders'
+
+urlpatterns = [
+    path('orders/', views.OrderListCreateView.as_view(), name='order-list-create'),
+    path('orders/bulk-status/', views.BulkOrderStatusView.as_view(), name='order-bulk-status'),
+    path(
+        'order-count/<int:business_user_id>/',
+        views.OrderCountView.as_view(),
+        name='order-count'
+    ),
+    path(
+        'completed-order-count/<int:business_user_id>/',
+        views.CompletedOrderCountView.as_view(),
+        name='completed-order-count'
+    ),
+]
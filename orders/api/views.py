@@ -0,0 +1,207 @@
+"""
+Views for order management.
+"""
+
+from collections import Counter
+
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import generics, status
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.pagination import UnionKeysetCursorPagination
+from core.query_budget import QueryBudgetMixin
+from orders.counters import get_order_count, record_deltas
+from orders.models import Order
+from .serializers import BulkOrderStatusSerializer, OrderSerializer
+
+
+class OrderListCreateView(QueryBudgetMixin, generics.ListCreateAPIView):
+    """
+    List the current user's orders or place an order.
+
+    GET  /api/orders/  - orders where the user is customer or business
+                         user, newest first, cursor-paginated;
+                         ?status= filters by status
+    POST /api/orders/  - only customer users; body: {"offer_detail_id": <id>}
+    """
+
+    queryset = Order.objects.all()
+    serializer_class = OrderSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = UnionKeysetCursorPagination
+    # Token, joined detail lookup, and the order insert plus counter
+    # upsert with their BEGIN/COMMIT
+    query_budget = {'GET': 2, 'POST': 6}
+
+    def filter_queryset(self, queryset):
+        """
+        Apply ?status=.
+
+        Raises:
+            ValidationError: Unknown status.
+        """
+        order_status = self.request.query_params.get('status')
+        if order_status is None:
+            return queryset
+        if order_status not in dict(Order.STATUS_CHOICES):
+            raise ValidationError({'status': f'Unknown status: {order_status}.'})
+        return queryset.filter(status=order_status)
+
+    def get_union_branches(self, queryset):
+        """
+        Split "customer_user = me OR business_user = me" into indexed scans.
+
+        The customer branch reads order_customer_created_idx in order.
+        order_business_status_idx is only ordered by created_at within
+        one status, so without ?status= the business side is one branch
+        per status.
+
+        Returns:
+            list: Querysets whose UNION is the user's order list.
+        """
+        user = self.request.user
+        business = queryset.filter(business_user=user)
+        if 'status' in self.request.query_params:
+            business_branches = [business]
+        else:
+            business_branches = [business.filter(status=value) for value, _ in Order.STATUS_CHOICES]
+        return [queryset.filter(customer_user=user), *business_branches]
+
+    def create(self, request, *args, **kwargs):
+        """
+        Only customers can place orders.
+
+        Returns:
+            Response: Created order, or 403 Forbidden.
+        """
+        if request.user.type != 'customer':
+            return Response(
+                {'error': 'Only customers can place orders.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        return super().create(request, *args, **kwargs)
+
+    def perform_create(self, serializer):
+        """
+        Set the current user as the customer.
+
+        Args:
+            serializer: Validated serializer ready to save.
+        """
+        serializer.save(customer_user=self.request.user)
+
+
+class BulkOrderStatusView(QueryBudgetMixin, APIView):
+    """
+    Change the status of many orders of the current business user at once.
+
+    PATCH /api/orders/bulk-status/  - only business users;
+                                      body: {"ids": [<id>, ...], "status": <status>}
+
+    Reads the current status of all orders in one query, checks every
+    change against Order.STATUS_TRANSITIONS and applies the allowed ones
+    with a single UPDATE. Queryset updates bypass the order signals, so
+    the counter deltas are recorded here.
+    """
+
+    permission_classes = [IsAuthenticated]
+    # Token, BEGIN, SELECT, UPDATE, counter decrement and upsert, COMMIT
+    query_budget = {'PATCH': 7}
+
+    def patch(self, request):
+        """
+        Apply the allowed transitions.
+
+        Returns:
+            Response: {"results": [...]} with one entry per requested id in
+                request order: {"id", "updated": true, "status"} or
+                {"id", "updated": false, "error"}; 400 on an invalid body,
+                403 for non-business users.
+        """
+        if request.user.type != 'business':
+            return Response(
+                {'error': 'Only business users can change order status.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        serializer = BulkOrderStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = serializer.validated_data['ids']
+        new_status = serializer.validated_data['status']
+        sources = [old for old, targets in Order.STATUS_TRANSITIONS.items() if new_status in targets]
+
+        with transaction.atomic():
+            current = dict(
+                Order.objects.select_for_update()
+                .filter(id__in=ids, business_user=request.user)
+                .values_list('id', 'status')
+            )
+            allowed = [pk for pk in ids if current.get(pk) in sources]
+            if allowed:
+                # The status condition keeps the UPDATE in line with the
+                # transitions checked above
+                Order.objects.filter(id__in=allowed, status__in=sources).update(
+                    status=new_status, updated_at=timezone.now()
+                )
+                deltas = Counter()
+                for pk in allowed:
+                    deltas[(request.user.id, current[pk])] -= 1
+                    deltas[(request.user.id, new_status)] += 1
+                record_deltas(deltas)
+
+        results = []
+        for pk in ids:
+            if pk not in current:
+                results.append({'id': pk, 'updated': False, 'error': 'Order not found.'})
+            elif current[pk] in sources:
+                results.append({'id': pk, 'updated': True, 'status': new_status})
+            else:
+                results.append({
+                    'id': pk, 'updated': False,
+                    'error': f'Cannot change status from {current[pk]} to {new_status}.'
+                })
+        return Response({'results': results})
+
+
+class OrderCountView(QueryBudgetMixin, APIView):
+    """
+    Number of in-progress orders of a business user.
+
+    GET /api/order-count/<business_user_id>/  - auth required,
+                                                404 if no such business user
+    """
+
+    permission_classes = [IsAuthenticated]
+    query_budget = {'GET': 2}
+    order_status = 'in_progress'
+    response_key = 'order_count'
+
+    def get(self, request, business_user_id):
+        """
+        Read the count from the order counters.
+
+        Returns:
+            Response: {response_key: count}, or 404 Not Found.
+        """
+        count = get_order_count(business_user_id, self.order_status)
+        if count is None:
+            return Response(
+                {'error': 'Business user not found.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        return Response({self.response_key: count})
+
+
+class CompletedOrderCountView(OrderCountView):
+    """
+    Number of completed orders of a business user.
+
+    GET /api/completed-order-count/<business_user_id>/  - auth required,
+                                                          404 if no such business user
+    """
+
+    order_status = 'completed'
+    response_key = 'completed_order_count'
@@ -0,0 +1,279 @@
+"""
+Incrementally maintained order counters (OrderCounter).
+
+Every Order insert, status change and delete turns into +1/-1 deltas
+on the ``(business_user, status)`` counter rows. The signal handlers in
+orders.signals apply them as ``count = count + n`` upserts in the same
+transaction as the order write, so a counter never shows an
+order that was rolled back. Code that changes orders with queryset
+update() or bulk_create() bypasses the signals and must call
+``record_deltas`` itself. Deleting offers batches the deltas of the
+orders that cascade with them (``begin_batch``/``end_batch``, from
+orders.signals), so each counter row is updated once per delete
+instead of once per order.
+
+Business users listed in ``ORDER_COUNTER_WRITE_BEHIND_USERS`` take so
+many orders that their counter rows become a write hotspot. Their
+deltas are collected in an in-process buffer after commit and written
+in one batch every ``ORDER_COUNTER_FLUSH_INTERVAL`` seconds instead.
+Reads in the same process include the pending deltas; other processes
+see them after the flush. Deltas buffered in a process that dies are
+lost; ``reconcile_order_counters`` repairs that drift.
+"""
+
+import atexit
+import logging
+import operator
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from functools import reduce
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import DatabaseError, connections, router, transaction
+from django.db.models import Case, F, IntegerField, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce
+
+from core.counters import upsert_increments
+from orders.models import OrderCounter
+
+logger = logging.getLogger(__name__)
+
+# Deltas collected by an open batch (begin_batch), per thread
+_batch = threading.local()
+
+User = get_user_model()
+
+
+def status_deltas(old, new):
+    """
+    Return the counter deltas for an order moving from ``old`` to ``new``.
+
+    Args:
+        old (tuple): (business_user_id, status) before, or None for an insert.
+        new (tuple): (business_user_id, status) after, or None for a delete.
+
+    Returns:
+        Counter: {(business_user_id, status): delta}, without zero entries.
+    """
+    deltas = Counter()
+    if old is not None:
+        deltas[old] -= 1
+    if new is not None:
+        deltas[new] += 1
+    return Counter({key: delta for key, delta in deltas.items() if delta})
+
+
+def apply_deltas(deltas):
+    """
+    Add deltas to the counter rows.
+
+    Runs in the caller's transaction; call it inside the transaction
+    that writes the orders. Increments create missing rows
+    (core.counters.upsert_increments). Decrements only update existing
+    rows, all in one UPDATE, so deleting a business user (whose counters
+    cascade away with its orders) never recreates one.
+
+    Args:
+        deltas (dict): {(business_user_id, status): delta}.
+    """
+    increments, decrements = [], []
+    for (business_user_id, status), delta in sorted(deltas.items()):
+        if delta < 0:
+            decrements.append((Q(business_user_id=business_user_id, status=status), delta))
+        elif delta > 0:
+            increments.append((business_user_id, status, delta))
+    if decrements:
+        OrderCounter.objects.filter(reduce(operator.or_, [key for key, _ in decrements])).update(
+            count=F('count') + Case(
+                *[When(key, then=Value(delta)) for key, delta in decrements],
+                default=Value(0),
+            )
+        )
+    upsert_increments(OrderCounter, ('business_user_id', 'status'), ('count',), increments)
+
+
+def record_deltas(deltas):
+    """
+    Apply deltas now, or buffer those of write-behind users until commit.
+
+    While a batch is open the deltas are only collected.
+
+    Args:
+        deltas (dict): {(business_user_id, status): delta}.
+    """
+    pending = _open_batch()
+    if pending is not None:
+        pending.update(deltas)
+        return
+    hot_users = settings.ORDER_COUNTER_WRITE_BEHIND_USERS
+    direct = {key: delta for key, delta in deltas.items() if key[0] not in hot_users}
+    buffered = {key: delta for key, delta in deltas.items() if key[0] in hot_users}
+    if direct:
+        apply_deltas(direct)
+    if buffered:
+        transaction.on_commit(lambda: write_behind.add(buffered))
+
+
+def begin_batch():
+    """
+    Collect the deltas recorded in this thread until ``end_batch``.
+
+    Call it inside the transaction of a write that touches many orders,
+    e.g. from pre_delete of a model whose delete cascades to orders:
+    every order's post_delete handler would otherwise update the same
+    counter row. Calls nest; the outermost ``end_batch`` records the
+    sum. Outside a transaction nothing is batched.
+
+    If the transaction ends without ``end_batch`` (the write failed and
+    rolled back), the batch is dropped with it.
+    """
+    if _open_batch() is None:
+        connection = connections[router.db_for_write(OrderCounter)]
+        if not connection.atomic_blocks:
+            return
+        _batch.deltas = Counter()
+        _batch.block = connection.atomic_blocks[-1]
+        _batch.depth = 0
+    _batch.depth += 1
+
+
+def end_batch(record=True):
+    """
+    Close one ``begin_batch``; the outermost records the collected deltas.
+
+    Args:
+        record (bool): False drops the collected deltas instead, e.g.
+            when the write failed.
+    """
+    deltas = _open_batch()
+    if deltas is None:
+        return
+    _batch.depth -= 1
+    if _batch.depth and record:
+        return
+    _batch.deltas = _batch.block = None
+    if record:
+        record_deltas({key: delta for key, delta in deltas.items() if delta})
+
+
+@contextmanager
+def batched_deltas():
+    """
+    Batch the deltas recorded in the block; nothing is recorded if it raises.
+    """
+    begin_batch()
+    try:
+        yield
+    except BaseException:
+        end_batch(record=False)
+        raise
+    end_batch()
+
+
+def _open_batch():
+    """
+    Return the deltas of the open batch, or None.
+
+    A batch whose transaction has ended is dropped.
+    """
+    deltas = getattr(_batch, 'deltas', None)
+    if deltas is None:
+        return None
+    connection = connections[router.db_for_write(OrderCounter)]
+    if not any(block is _batch.block for block in connection.atomic_blocks):
+        _batch.deltas = _batch.block = None
+        return None
+    return deltas
+
+
+def get_order_count(business_user_id, status):
+    """
+    Return the number of orders of a business user with a status.
+
+    Reads the counter row and the business user in one query and adds
+    deltas still pending in this process.
+
+    Args:
+        business_user_id (int): Business user id.
+        status (str): Order status.
+
+    Returns:
+        int | None: The count, or None if there is no such business user.
+    """
+    counter = OrderCounter.objects.filter(
+        business_user_id=OuterRef('pk'), status=status
+    ).values('count')
+    count = (
+        User.objects
+        .filter(pk=business_user_id, type='business')
+        .annotate(order_count=Coalesce(Subquery(counter), Value(0), output_field=IntegerField()))
+        .values_list('order_count', flat=True)
+        .first()
+    )
+    if count is None:
+        return None
+    return count + write_behind.pending(business_user_id, status)
+
+
+class WriteBehindBuffer:
+    """
+    Thread-safe buffer of committed counter deltas, flushed in batches.
+    """
+
+    def __init__(self):
+        self._pending = Counter()
+        self._lock = threading.Lock()
+        self._timer = None
+
+    def add(self, deltas):
+        """
+        Buffer deltas and schedule a flush.
+        """
+        with self._lock:
+            self._pending.update(deltas)
+            if self._timer is None:
+                self._timer = threading.Timer(
+                    settings.ORDER_COUNTER_FLUSH_INTERVAL, self._flush_in_worker
+                )
+                self._timer.daemon = True
+                self._timer.start()
+
+    def pending(self, business_user_id, status):
+        """
+        Return the buffered delta of one counter.
+        """
+        with self._lock:
+            return self._pending.get((business_user_id, status), 0)
+
+    def flush(self):
+        """
+        Write all buffered deltas in one transaction.
+
+        On a database error the deltas go back into the buffer for the
+        next flush.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, Counter()
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if not pending:
+            return
+        try:
+            with transaction.atomic():
+                apply_deltas(pending)
+        except DatabaseError:
+            logger.exception('Flushing %d order counter deltas failed', len(pending))
+            self.add(pending)
+
+    def _flush_in_worker(self):
+        try:
+            self.flush()
+        finally:
+            connections.close_all()
+
+
+write_behind = WriteBehindBuffer()
+atexit.register(write_behind.flush)
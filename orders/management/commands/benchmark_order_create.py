@@ -0,0 +1,123 @@
+"""
+Management command that benchmarks POST /api/orders/ under concurrent load.
+"""
+
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from offers.models import Offer, OfferDetail
+from orders.models import Order
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """
+    Place orders from several threads and report throughput and latency.
+
+    Every thread has its own customer, token and database connection
+    and posts ``offer_detail_id`` through the full DRF stack. Seeded
+    rows are committed, because each thread uses its own connection,
+    and deleted at the end.
+    """
+
+    help = 'Benchmark order placement throughput with concurrent clients.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--orders', type=int, default=2000, help='Orders to place per run.')
+        parser.add_argument(
+            '--threads', type=int, nargs='+', default=[1, 4, 8], help='Client threads per run.'
+        )
+
+    def handle(self, *args, **options):
+        """
+        Seed one offer and customers, then run once per thread count.
+        """
+        business = User.objects.create(username='benchmark-orders-business', type='business')
+        customers = []
+        try:
+            offer = Offer.objects.create(user=business, title='Benchmark', description='Benchmark')
+            self.detail = OfferDetail.objects.create(
+                offer=offer, title='Benchmark Basic', revisions=1, delivery_time_in_days=3,
+                price=10, features=['A'], offer_type='basic'
+            )
+            customers = User.objects.bulk_create([
+                User(username=f'benchmark-orders-customer-{i}', type='customer')
+                for i in range(max(options['threads']))
+            ])
+            self.tokens = [Token.objects.create(user=customer).key for customer in customers]
+
+            with override_settings(ALLOWED_HOSTS=['testserver']):
+                self._check_queries()
+                self.stdout.write(f"{options['orders']} orders per run")
+                for threads in options['threads']:
+                    self._report(threads, *self._run(options['orders'], threads))
+        finally:
+            User.objects.filter(pk__in=[business.pk, *(c.pk for c in customers)]).delete()
+
+    def _check_queries(self):
+        """
+        Print the queries of one order placement, excluding authentication.
+        """
+        client = self._client(0)
+        client.post('/api/orders/', {'offer_detail_id': self.detail.id}, format='json')
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.post('/api/orders/', {'offer_detail_id': self.detail.id}, format='json')
+        if response.status_code != 201:
+            raise CommandError(f'Order creation failed with {response.status_code}: {response.data}')
+        self.stdout.write(f'Statements per order (token cached, incl. BEGIN/COMMIT): {len(ctx.captured_queries)}')
+
+    def _client(self, index):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Token {self.tokens[index]}')
+        return client
+
+    def _run(self, total, threads):
+        """
+        Split ``total`` orders over ``threads`` clients and time them.
+        """
+        latencies = []
+        lock = threading.Lock()
+
+        def worker(index):
+            client = self._client(index)
+            own = []
+            try:
+                for _ in range(total // threads):
+                    start = time.perf_counter()
+                    response = client.post(
+                        '/api/orders/', {'offer_detail_id': self.detail.id}, format='json'
+                    )
+                    own.append(time.perf_counter() - start)
+                    if response.status_code != 201:
+                        raise CommandError(f'Order creation failed with {response.status_code}.')
+            finally:
+                connections.close_all()
+            with lock:
+                latencies.extend(own)
+
+        before = Order.objects.count()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            for future in [executor.submit(worker, i) for i in range(threads)]:
+                future.result()
+        elapsed = time.perf_counter() - start
+        return elapsed, latencies, Order.objects.count() - before
+
+    def _report(self, threads, elapsed, latencies, placed):
+        latency_ms = sorted(t * 1000 for t in latencies)
+        p95 = latency_ms[int(len(latency_ms) * 0.95) - 1]
+        self.stdout.write(
+            f'  {threads:2} threads: {placed / elapsed:8.0f} orders/s | latency p50 '
+            f'{statistics.median(latency_ms):6.2f} ms, p95 {p95:6.2f} ms'
+        )
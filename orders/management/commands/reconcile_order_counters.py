@@ -0,0 +1,76 @@
+"""
+Management command that repairs drift in the order counters.
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+
+from orders.counters import write_behind
+from orders.models import Order, OrderCounter
+
+
+class Command(BaseCommand):
+    """
+    Recount orders per (business_user, status) and fix the counter rows.
+
+    Counter rows are locked (SELECT ... FOR UPDATE) before the orders
+    are counted, so order writes that commit meanwhile wait for the
+    repair and then apply their own delta on top of it. Drift comes
+    from queryset updates that skipped orders.counters, raw SQL, or
+    write-behind deltas lost with their process.
+    """
+
+    help = 'Recount orders and repair the OrderCounter table.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--business-user', type=int, action='append', dest='business_users',
+            help='Only reconcile this business user id (repeatable).'
+        )
+        parser.add_argument(
+            '--dry-run', action='store_true', help='Report drift without changing anything.'
+        )
+
+    def handle(self, *args, **options):
+        """
+        Compare stored counters with actual counts and apply the fixes.
+        """
+        write_behind.flush()
+        counters = OrderCounter.objects.all()
+        orders = Order.objects.all()
+        if options['business_users']:
+            counters = counters.filter(business_user_id__in=options['business_users'])
+            orders = orders.filter(business_user_id__in=options['business_users'])
+
+        with transaction.atomic():
+            stored = {
+                (c.business_user_id, c.status): c
+                for c in counters.select_for_update()
+            }
+            actual = {
+                (row['business_user_id'], row['status']): row['count']
+                for row in orders.order_by().values('business_user_id', 'status')
+                .annotate(count=Count('id'))
+            }
+
+            to_update, to_create = [], []
+            for key, counter in stored.items():
+                count = actual.get(key, 0)
+                if counter.count != count:
+                    counter.count = count
+                    to_update.append(counter)
+            for key, count in actual.items():
+                if key not in stored:
+                    to_create.append(
+                        OrderCounter(business_user_id=key[0], status=key[1], count=count)
+                    )
+
+            if not options['dry_run']:
+                OrderCounter.objects.bulk_update(to_update, ['count'], batch_size=500)
+                OrderCounter.objects.bulk_create(to_create, batch_size=500)
+
+        verb = 'Would fix' if options['dry_run'] else 'Fixed'
+        self.stdout.write(self.style.SUCCESS(
+            f'{verb} {len(to_update)} counters and created {len(to_create)}.'
+        ))
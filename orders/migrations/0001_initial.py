@@ -0,0 +1,37 @@
+# Generated by Django 4.2.7 on 2026-10-17 08:23
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('offers', '0005_offer_image_derivatives'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Order',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(help_text='Order title', max_length=200)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('in_progress', 'In Progress'), ('completed', 'Completed'), ('cancelled', 'Cancelled')], default='pending', help_text='Current order status', max_length=20)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('business_user', models.ForeignKey(help_text='Business user who owns the offer', on_delete=django.db.models.deletion.CASCADE, related_name='business_orders', to=settings.AUTH_USER_MODEL)),
+                ('customer_user', models.ForeignKey(help_text='Customer who placed this order', on_delete=django.db.models.deletion.CASCADE, related_name='customer_orders', to=settings.AUTH_USER_MODEL)),
+                ('offer', models.ForeignKey(help_text='The offer being ordered', on_delete=django.db.models.deletion.CASCADE, related_name='orders', to='offers.offer')),
+                ('offer_detail', models.ForeignKey(help_text='The specific package selected', on_delete=django.db.models.deletion.CASCADE, related_name='orders', to='offers.offerdetail')),
+            ],
+            options={
+                'verbose_name': 'Order',
+                'verbose_name_plural': 'Orders',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
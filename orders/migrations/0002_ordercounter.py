@@ -0,0 +1,33 @@
+# Generated by Django 4.2.7 on 2026-10-17 08:26
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('orders', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('in_progress', 'In Progress'), ('completed', 'Completed'), ('cancelled', 'Cancelled')], help_text='Order status counted', max_length=20)),
+                ('count', models.IntegerField(default=0, help_text='Number of orders with this status')),
+                ('business_user', models.ForeignKey(help_text='Business user the orders belong to', on_delete=django.db.models.deletion.CASCADE, related_name='order_counters', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Order counter',
+                'verbose_name_plural': 'Order counters',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='ordercounter',
+            constraint=models.UniqueConstraint(fields=('business_user', 'status'), name='order_counter_user_status_uniq'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.7 on 2026-10-17 08:33
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('orders', '0002_ordercounter'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='order',
+            name='business_user',
+            field=models.ForeignKey(db_index=False, help_text='Business user who owns the offer', on_delete=django.db.models.deletion.CASCADE, related_name='business_orders', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='customer_user',
+            field=models.ForeignKey(db_index=False, help_text='Customer who placed this order', on_delete=django.db.models.deletion.CASCADE, related_name='customer_orders', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['customer_user', '-created_at'], name='order_customer_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['business_user', 'status', '-created_at'], name='order_business_status_idx'),
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 4.2.7 on 2026-10-17 08:37
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+BACKFILL_FIELDS = ['revisions', 'delivery_time_in_days', 'price', 'features', 'offer_type']
+BATCH_SIZE = 500
+
+
+def backfill_detail_snapshot(apps, schema_editor):
+    # Orders already store the package title; copy the remaining terms
+    Order = apps.get_model('orders', 'Order')
+    orders = Order.objects.select_related('offer_detail').filter(offer_detail__isnull=False)
+    batch = []
+    for order in orders.iterator(chunk_size=BATCH_SIZE):
+        for field in BACKFILL_FIELDS:
+            setattr(order, field, getattr(order.offer_detail, field))
+        batch.append(order)
+        if len(batch) == BATCH_SIZE:
+            Order.objects.bulk_update(batch, BACKFILL_FIELDS)
+            batch = []
+    if batch:
+        Order.objects.bulk_update(batch, BACKFILL_FIELDS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers', '0005_offer_image_derivatives'),
+        ('orders', '0003_order_list_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='delivery_time_in_days',
+            field=models.IntegerField(default=0, help_text='Delivery time in days at purchase time'),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='features',
+            field=models.JSONField(default=list, help_text='Features included at purchase time'),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='offer_type',
+            field=models.CharField(blank=True, choices=[('basic', 'Basic'), ('standard', 'Standard'), ('premium', 'Premium')], help_text='Package tier at purchase time', max_length=20),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='price',
+            field=models.DecimalField(decimal_places=2, default=0, help_text='Package price at purchase time', max_digits=10),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='revisions',
+            field=models.IntegerField(default=0, help_text='Number of revisions included at purchase time'),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='offer_detail',
+            field=models.ForeignKey(blank=True, help_text='The specific package selected', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='orders', to='offers.offerdetail'),
+        ),
+        migrations.RunPython(backfill_detail_snapshot, migrations.RunPython.noop),
+    ]
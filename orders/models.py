@@ -6,19 +6,31 @@ from django.db import models
 from django.conf import settings
 from offers.models import Offer, OfferDetail
 
+# OfferDetail fields copied onto an Order when it is placed
+SNAPSHOT_FIELDS = ('title', 'revisions', 'delivery_time_in_days', 'price', 'features', 'offer_type')
+
 
 class Order(models.Model):
     """
     Represents a customer placing an order on a specific offer package.
 
-    The business_user is automatically set from the offer owner.
+    The business_user is automatically set from the offer owner. The
+    package terms are copied from the OfferDetail when the order is
+    placed, so order reads need no join and later offer edits do not
+    change what the customer bought.
 
     Attributes:
         customer_user (ForeignKey): The customer placing the order.
         business_user (ForeignKey): The freelancer who owns the offer.
         offer (ForeignKey): The parent offer.
-        offer_detail (ForeignKey): The specific package chosen.
-        title (str): Order title.
+        offer_detail (ForeignKey): The specific package chosen; None once
+            the package is removed from the offer.
+        title (str): Order title (package title at purchase time).
+        revisions (int): Revisions included at purchase time.
+        delivery_time_in_days (int): Delivery time at purchase time.
+        price (Decimal): Price paid.
+        features (list): Features included at purchase time.
+        offer_type (str): Package tier at purchase time.
         status (str): Current order status.
         created_at (datetime): Creation timestamp.
         updated_at (datetime): Last update timestamp.
@@ -31,16 +43,26 @@ class Order(models.Model):
         ('cancelled', 'Cancelled'),
     ]
 
+    # Status changes a business user may make: {from_status: to_statuses}
+    STATUS_TRANSITIONS = {
+        'pending': ('in_progress', 'cancelled'),
+        'in_progress': ('completed', 'cancelled'),
+    }
+
     customer_user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
         related_name='customer_orders',
+        # Covered by order_customer_created_idx
+        db_index=False,
         help_text="Customer who placed this order"
     )
     business_user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
         related_name='business_orders',
+        # Covered by order_business_status_idx
+        db_index=False,
         help_text="Business user who owns the offer"
     )
     offer = models.ForeignKey(
@@ -51,7 +73,9 @@ class Order(models.Model):
     )
     offer_detail = models.ForeignKey(
         OfferDetail,
-        on_delete=models.CASCADE,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
         related_name='orders',
         help_text="The specific package selected"
     )
@@ -59,6 +83,30 @@ class Order(models.Model):
         max_length=200,
         help_text="Order title"
     )
+    revisions = models.IntegerField(
+        default=0,
+        help_text="Number of revisions included at purchase time"
+    )
+    delivery_time_in_days = models.IntegerField(
+        default=0,
+        help_text="Delivery time in days at purchase time"
+    )
+    price = models.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        default=0,
+        help_text="Package price at purchase time"
+    )
+    features = models.JSONField(
+        default=list,
+        help_text="Features included at purchase time"
+    )
+    offer_type = models.CharField(
+        max_length=20,
+        choices=OfferDetail.OFFER_TYPE_CHOICES,
+        blank=True,
+        help_text="Package tier at purchase time"
+    )
     status = models.CharField(
         max_length=20,
         choices=STATUS_CHOICES,
@@ -72,7 +120,58 @@ class Order(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Order'
         verbose_name_plural = 'Orders'
+        indexes = [
+            # One index per branch of the order list UNION (orders.api.views)
+            models.Index(fields=['customer_user', '-created_at'], name='order_customer_created_idx'),
+            models.Index(
+                fields=['business_user', 'status', '-created_at'],
+                name='order_business_status_idx'
+            ),
+        ]
 
     def __str__(self):
         """String representation of Order."""
-        return f"Order #{self.id}: {self.title} - {self.get_status_display()}"
\ No newline at end of file
+        return f"Order #{self.id}: {self.title} - {self.get_status_display()}"
+
+class OrderCounter(models.Model):
+    """
+    Number of orders per business user and status.
+
+    Maintained by orders.counters on every Order insert, status change
+    and delete, so dashboards read one row instead of counting orders.
+    ``reconcile_order_counters`` repairs drift.
+
+    Attributes:
+        business_user (ForeignKey): Business user the orders belong to.
+        status (str): Order status counted.
+        count (int): Number of orders with that status.
+    """
+
+    business_user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='order_counters',
+        help_text="Business user the orders belong to"
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=Order.STATUS_CHOICES,
+        help_text="Order status counted"
+    )
+    count = models.IntegerField(
+        default=0,
+        help_text="Number of orders with this status"
+    )
+
+    class Meta:
+        verbose_name = 'Order counter'
+        verbose_name_plural = 'Order counters'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['business_user', 'status'], name='order_counter_user_status_uniq'
+            ),
+        ]
+
+    def __str__(self):
+        """String representation of OrderCounter."""
+        return f"{self.business_user_id} {self.status}: {self.count}"
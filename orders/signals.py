@@ -0,0 +1,60 @@
+"""
+Signal handlers for the orders app.
+"""
+
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from core.counters import loaded_values, remember_stored_values, saved_values
+from offers.models import Offer
+from orders.counters import begin_batch, end_batch, record_deltas, status_deltas
+from orders.models import Order
+
+User = get_user_model()
+
+# (business_user_id, status): the counter an order is counted in
+COUNTER_FIELDS = ('business_user_id', 'status')
+
+remember_stored_values(Order, '_counter_key', COUNTER_FIELDS)
+
+
+@receiver(post_save, sender=Order)
+def count_order_save(sender, instance, created, **kwargs):
+    """
+    Move the order between counters on insert or status change.
+    """
+    old = None if created else instance._counter_key
+    new = saved_values(instance, COUNTER_FIELDS, old)
+    if new is None:
+        # Saved with only other fields loaded; the counter key was not written
+        return
+    record_deltas(status_deltas(old, new))
+    instance._counter_key = new
+
+
+@receiver(post_delete, sender=Order)
+def count_order_delete(sender, instance, **kwargs):
+    """
+    Remove a deleted order from its counter.
+    """
+    old = instance._counter_key or loaded_values(instance, COUNTER_FIELDS)
+    record_deltas(status_deltas(old, None))
+
+
+@receiver(pre_delete, sender=Offer)
+@receiver(pre_delete, sender=User)
+def begin_cascade_batch(sender, instance, **kwargs):
+    """
+    Batch the counter deltas of the orders deleted with an offer or user.
+    """
+    begin_batch()
+
+
+@receiver(post_delete, sender=Offer)
+@receiver(post_delete, sender=User)
+def end_cascade_batch(sender, instance, **kwargs):
+    """
+    Record the batched deltas; the cascaded orders are deleted first.
+    """
+    end_batch()
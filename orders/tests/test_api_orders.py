@@ -0,0 +1,124 @@
+"""
+Tests for POST /api/orders/.
+"""
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+
+from core.query_budget import QueryBudgetTestMixin
+from offers.models import Offer, OfferDetail
+from orders.models import Order
+
+User = get_user_model()
+
+
+class OrderCreateAPITest(QueryBudgetTestMixin, APITestCase):
+    """
+    Tests order placement from an offer_detail_id.
+    """
+
+    def setUp(self):
+        """
+        Create a business user with an offer and an authenticated customer.
+        """
+        self.client = APIClient()
+        self.business = User.objects.create_user(
+            username='bizuser',
+            email='biz@example.com',
+            password='TestPass123!',
+            type='business'
+        )
+        self.customer = User.objects.create_user(
+            username='customer',
+            email='customer@example.com',
+            password='TestPass123!',
+            type='customer'
+        )
+        self.offer = Offer.objects.create(user=self.business, title='Logo', description='Test')
+        self.detail = OfferDetail.objects.create(
+            offer=self.offer, title='Logo Basic', revisions=2,
+            delivery_time_in_days=5, price=150, features=['Logo'], offer_type='basic'
+        )
+        self.token = Token.objects.create(user=self.customer)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+
+    def test_create_order(self):
+        """
+        Test that offer, business_user and title are derived from the detail.
+        """
+        response = self.client.post('/api/orders/', {'offer_detail_id': self.detail.id}, format='json')
+        order = Order.objects.get()
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['id'], order.id)
+        self.assertEqual(order.customer_user, self.customer)
+        self.assertEqual(order.business_user, self.business)
+        self.assertEqual(order.offer, self.offer)
+        self.assertEqual(order.offer_detail, self.detail)
+        self.assertEqual(order.title, 'Logo Basic')
+        self.assertEqual(order.status, 'pending')
+
+    def test_create_order_single_lookup(self):
+        """
+        Test that the detail, offer and owner come from one joined query.
+        """
+        self.client.post('/api/orders/', {'offer_detail_id': self.detail.id}, format='json')
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.post('/api/orders/', {'offer_detail_id': self.detail.id}, format='json')
+        selects = [q['sql'] for q in ctx.captured_queries if q['sql'].startswith('SELECT')]
+
+        self.assertEqual(len(selects), 1)
+        self.assertIn('JOIN "offers_offer"', selects[0])
+
+    def test_create_order_within_budget(self):
+        """
+        Test that POST /api/orders/ stays within its query budget.
+        """
+        response = self.assertWithinQueryBudget(
+            'post', '/api/orders/', {'offer_detail_id': self.detail.id}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_unknown_offer_detail(self):
+        """
+        Test that an unknown offer_detail_id returns 404.
+        """
+        response = self.client.post('/api/orders/', {'offer_detail_id': 999999}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_missing_offer_detail_id(self):
+        """
+        Test that offer_detail_id is required.
+        """
+        response = self.client.post('/api/orders/', {}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('offer_detail_id', response.data)
+
+    def test_business_user_forbidden(self):
+        """
+        Test that business users cannot place orders.
+        """
+        self.client.force_authenticate(self.business)
+
+        response = self.client.post('/api/orders/', {'offer_detail_id': self.detail.id}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(Order.objects.exists())
+
+    def test_unauthenticated(self):
+        """
+        Test that anonymous requests are rejected.
+        """
+        self.client.credentials()
+
+        response = self.client.post('/api/orders/', {'offer_detail_id': self.detail.id}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,134 @@
+"""
+Tests for PATCH /api/orders/bulk-status/.
+"""
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from rest_framework import status
+
+from core.query_budget import QueryBudgetTestMixin
+from orders.models import Order, OrderCounter
+from orders.tests.test_order_counters import OrderCounterTestMixin
+
+User = get_user_model()
+
+URL = '/api/orders/bulk-status/'
+
+
+class BulkOrderStatusAPITest(QueryBudgetTestMixin, OrderCounterTestMixin, APITestCase):
+    """
+    Tests bulk status transitions, per-id results and counters.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(self.business)
+
+    def test_transitions_orders(self):
+        """
+        Test that all allowed orders change status and updated_at.
+        """
+        orders = [self._order('pending') for _ in range(3)]
+        before = {order.id: order.updated_at for order in orders}
+
+        response = self.client.patch(
+            URL, {'ids': [order.id for order in orders], 'status': 'in_progress'}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(all(result['updated'] for result in response.data['results']))
+        for order in Order.objects.all():
+            self.assertEqual(order.status, 'in_progress')
+            self.assertGreater(order.updated_at, before[order.id])
+
+    def test_per_id_results(self):
+        """
+        Test results for allowed, disallowed, foreign and unknown ids, in request order.
+        """
+        pending = self._order('pending')
+        completed = self._order('completed')
+        other = User.objects.create_user(username='other', type='business')
+        foreign = Order.objects.create(
+            customer_user=self.customer, business_user=other, offer=self.offer,
+            offer_detail=self.detail, title='Foreign'
+        )
+
+        response = self.client.patch(
+            URL, {'ids': [completed.id, 999999, pending.id, foreign.id, pending.id],
+                  'status': 'in_progress'}, format='json'
+        )
+
+        self.assertEqual(response.data['results'], [
+            {'id': completed.id, 'updated': False,
+             'error': 'Cannot change status from completed to in_progress.'},
+            {'id': 999999, 'updated': False, 'error': 'Order not found.'},
+            {'id': pending.id, 'updated': True, 'status': 'in_progress'},
+            {'id': foreign.id, 'updated': False, 'error': 'Order not found.'},
+        ])
+        foreign.refresh_from_db()
+        self.assertEqual(foreign.status, 'pending')
+        completed.refresh_from_db()
+        self.assertEqual(completed.status, 'completed')
+
+    def test_counters_follow(self):
+        """
+        Test that the counters move with the bulk update.
+        """
+        orders = [self._order('pending') for _ in range(2)] + [self._order('in_progress')]
+
+        self.client.patch(
+            URL, {'ids': [order.id for order in orders], 'status': 'cancelled'}, format='json'
+        )
+
+        self.assertEqual(self._count('pending'), 0)
+        self.assertEqual(self._count('in_progress'), 0)
+        self.assertEqual(self._count('cancelled'), 3)
+
+    def test_single_update_statement(self):
+        """
+        Test that the orders are read once and written with one UPDATE.
+        """
+        ids = [self._order('pending').id for _ in range(20)]
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.patch(URL, {'ids': ids, 'status': 'in_progress'}, format='json')
+        order_sql = [q['sql'] for q in ctx.captured_queries if '"orders_order"' in q['sql']]
+
+        self.assertEqual(len(order_sql), 2)
+        self.assertTrue(order_sql[0].startswith('SELECT'))
+        self.assertTrue(order_sql[1].startswith('UPDATE'))
+
+    def test_within_query_budget(self):
+        """
+        Test that PATCH stays within its query budget.
+        """
+        ids = [self._order('pending').id for _ in range(5)]
+
+        response = self.assertWithinQueryBudget(
+            'patch', URL, {'ids': ids, 'status': 'in_progress'}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_invalid_body(self):
+        """
+        Test that missing ids or an unknown status return 400.
+        """
+        for data in ({'status': 'completed'}, {'ids': [], 'status': 'completed'},
+                     {'ids': [1], 'status': 'shipped'}):
+            response = self.client.patch(URL, data, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_customer_forbidden(self):
+        """
+        Test that customers cannot change order status.
+        """
+        order = self._order('pending')
+        self.client.force_authenticate(self.customer)
+
+        response = self.client.patch(URL, {'ids': [order.id], 'status': 'cancelled'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(OrderCounter.objects.filter(status='cancelled').exists())
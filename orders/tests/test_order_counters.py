@@ -0,0 +1,322 @@
+"""
+Tests for the order counters, the count endpoints and reconciliation.
+"""
+
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.db.models.signals import post_delete
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+
+from core.query_budget import QueryBudgetTestMixin
+from offers.models import Offer, OfferDetail
+from orders.counters import batched_deltas, write_behind
+from orders.models import Order, OrderCounter
+
+User = get_user_model()
+
+
+class OrderCounterTestMixin:
+    """
+    Create a business user with one offer detail and a customer.
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.business = User.objects.create_user(
+            username='bizuser', email='biz@example.com', password='TestPass123!', type='business'
+        )
+        self.customer = User.objects.create_user(
+            username='customer', email='cust@example.com', password='TestPass123!', type='customer'
+        )
+        self.offer = Offer.objects.create(user=self.business, title='Logo', description='Test')
+        self.detail = OfferDetail.objects.create(
+            offer=self.offer, title='Logo Basic', revisions=2,
+            delivery_time_in_days=5, price=150, features=['Logo'], offer_type='basic'
+        )
+        self.client.force_authenticate(self.customer)
+
+    def _order(self, order_status='pending'):
+        return Order.objects.create(
+            customer_user=self.customer, business_user=self.business, offer=self.offer,
+            offer_detail=self.detail, title='Logo Basic', status=order_status
+        )
+
+    def _count(self, order_status):
+        return OrderCounter.objects.filter(
+            business_user=self.business, status=order_status
+        ).values_list('count', flat=True).first() or 0
+
+
+class OrderCounterTest(OrderCounterTestMixin, APITestCase):
+    """
+    Tests that counters follow order inserts, status changes and deletes.
+    """
+
+    def test_insert_through_api(self):
+        """
+        Test that POST /api/orders/ increments the pending counter.
+        """
+        self.client.post('/api/orders/', {'offer_detail_id': self.detail.id}, format='json')
+        self.client.post('/api/orders/', {'offer_detail_id': self.detail.id}, format='json')
+
+        self.assertEqual(self._count('pending'), 2)
+
+    def test_status_change(self):
+        """
+        Test that a status change moves the order between counters.
+        """
+        order = self._order()
+        order.status = 'in_progress'
+        order.save()
+        order.status = 'completed'
+        order.save()
+
+        self.assertEqual(self._count('pending'), 0)
+        self.assertEqual(self._count('in_progress'), 0)
+        self.assertEqual(self._count('completed'), 1)
+
+    def test_save_without_status_change(self):
+        """
+        Test that saving other fields leaves the counters alone.
+        """
+        order = self._order('in_progress')
+        order.title = 'Renamed'
+        order.save()
+
+        self.assertEqual(self._count('in_progress'), 1)
+
+    def test_deferred_status_change(self):
+        """
+        Test that a status change on an order loaded with only() is counted.
+        """
+        self._order('in_progress')
+        order = Order.objects.only('id').get()
+        order.status = 'completed'
+        order.save(update_fields=['status'])
+
+        self.assertEqual(self._count('in_progress'), 0)
+        self.assertEqual(self._count('completed'), 1)
+
+    def test_delete(self):
+        """
+        Test that deleting an order (also by cascade) decrements its counter.
+        """
+        self._order('in_progress')
+        self._order('in_progress')
+        Order.objects.first().delete()
+        self.assertEqual(self._count('in_progress'), 1)
+
+        self.offer.delete()
+
+        self.assertEqual(self._count('in_progress'), 0)
+
+    def _counter_updates(self, instance):
+        """
+        Delete an instance and return the counter UPDATEs it ran.
+        """
+        with CaptureQueriesContext(connection) as ctx:
+            instance.delete()
+        return [q for q in ctx.captured_queries
+                if q['sql'].startswith('UPDATE "orders_ordercounter"')]
+
+    def test_offer_delete_batched(self):
+        """
+        Test that deleting an offer updates the counters of its orders in one UPDATE.
+        """
+        for order_status in ['in_progress', 'in_progress', 'completed']:
+            self._order(order_status)
+
+        self.assertEqual(len(self._counter_updates(self.offer)), 1)
+        self.assertEqual((self._count('in_progress'), self._count('completed')), (0, 0))
+
+    def test_customer_delete_batched(self):
+        """
+        Test that deleting a customer updates the counters of its orders in one UPDATE.
+        """
+        for order_status in ['in_progress', 'in_progress', 'completed']:
+            self._order(order_status)
+
+        self.assertEqual(len(self._counter_updates(self.customer)), 1)
+        self.assertEqual((self._count('in_progress'), self._count('completed')), (0, 0))
+
+    def test_batch_dropped_with_failed_delete(self):
+        """
+        Test that a batch opened by a delete that rolls back does not swallow later deltas.
+        """
+        self._order('in_progress')
+
+        def fail(sender, **kwargs):
+            raise ValueError
+
+        post_delete.connect(fail, sender=Order)
+        try:
+            with self.assertRaises(ValueError), transaction.atomic():
+                self.offer.delete()
+        finally:
+            post_delete.disconnect(fail, sender=Order)
+        self.assertEqual(self._count('in_progress'), 1)
+
+        Order.objects.get().delete()
+
+        self.assertEqual(self._count('in_progress'), 0)
+
+    def test_batch_ends_on_error(self):
+        """
+        Test that a failing batched block records nothing and ends the batch.
+        """
+        self._order('in_progress')
+
+        with self.assertRaises(ValueError):
+            with transaction.atomic(), batched_deltas():
+                Order.objects.get().delete()
+                raise ValueError
+        self.assertEqual(self._count('in_progress'), 1)
+
+        Order.objects.get().delete()
+
+        self.assertEqual(self._count('in_progress'), 0)
+
+    def test_delete_business_user(self):
+        """
+        Test that deleting a business user with orders removes its counters.
+        """
+        self._order('in_progress')
+
+        self.business.delete()
+
+        self.assertFalse(OrderCounter.objects.exists())
+
+
+class OrderCountAPITest(QueryBudgetTestMixin, OrderCounterTestMixin, APITestCase):
+    """
+    Tests for the order count endpoints.
+    """
+
+    def test_order_count(self):
+        """
+        Test GET /api/order-count/<id>/ counts in-progress orders.
+        """
+        self._order('in_progress')
+        self._order('in_progress')
+        self._order('pending')
+
+        response = self.assertWithinQueryBudget('get', f'/api/order-count/{self.business.id}/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {'order_count': 2})
+
+    def test_completed_order_count(self):
+        """
+        Test GET /api/completed-order-count/<id>/ counts completed orders.
+        """
+        self._order('completed')
+
+        response = self.client.get(f'/api/completed-order-count/{self.business.id}/')
+
+        self.assertEqual(response.data, {'completed_order_count': 1})
+
+    def test_count_without_orders(self):
+        """
+        Test that a business user without orders has a count of 0.
+        """
+        response = self.client.get(f'/api/order-count/{self.business.id}/')
+
+        self.assertEqual(response.data, {'order_count': 0})
+
+    def test_unknown_business_user(self):
+        """
+        Test that unknown and non-business users return 404.
+        """
+        for pk in (999999, self.customer.id):
+            response = self.client.get(f'/api/order-count/{pk}/')
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_unauthenticated(self):
+        """
+        Test that the count endpoints require authentication.
+        """
+        self.client.force_authenticate(None)
+
+        response = self.client.get(f'/api/order-count/{self.business.id}/')
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class WriteBehindTest(OrderCounterTestMixin, APITestCase):
+    """
+    Tests batched counter updates for hot business users.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(write_behind.flush)
+
+    def test_buffered_until_flush(self):
+        """
+        Test that deltas wait in the buffer after commit and are read from it.
+        """
+        with override_settings(
+            ORDER_COUNTER_WRITE_BEHIND_USERS={self.business.id},
+            ORDER_COUNTER_FLUSH_INTERVAL=3600
+        ):
+            with self.captureOnCommitCallbacks(execute=True):
+                self._order('in_progress')
+                self._order('in_progress')
+
+            self.assertEqual(self._count('in_progress'), 0)
+            response = self.client.get(f'/api/order-count/{self.business.id}/')
+            self.assertEqual(response.data, {'order_count': 2})
+
+            write_behind.flush()
+
+        self.assertEqual(self._count('in_progress'), 2)
+        self.assertEqual(write_behind.pending(self.business.id, 'in_progress'), 0)
+
+    def test_rolled_back_orders_not_buffered(self):
+        """
+        Test that deltas of an uncommitted transaction never reach the buffer.
+        """
+        with override_settings(ORDER_COUNTER_WRITE_BEHIND_USERS={self.business.id}):
+            with self.captureOnCommitCallbacks(execute=False):
+                self._order('in_progress')
+
+        self.assertEqual(write_behind.pending(self.business.id, 'in_progress'), 0)
+
+
+class ReconcileOrderCountersTest(OrderCounterTestMixin, APITestCase):
+    """
+    Tests for the reconcile_order_counters command.
+    """
+
+    def test_repairs_drift(self):
+        """
+        Test that counters changed behind the signals are recomputed.
+        """
+        self._order('in_progress')
+        self._order('in_progress')
+        Order.objects.update(status='completed')
+        OrderCounter.objects.filter(status='in_progress').update(count=5)
+
+        call_command('reconcile_order_counters', stdout=StringIO())
+
+        self.assertEqual(self._count('in_progress'), 0)
+        self.assertEqual(self._count('completed'), 2)
+
+    def test_dry_run(self):
+        """
+        Test that --dry-run reports without writing.
+        """
+        self._order('in_progress')
+        OrderCounter.objects.update(count=7)
+        out = StringIO()
+
+        call_command('reconcile_order_counters', dry_run=True, stdout=out)
+
+        self.assertIn('Would fix 1 counters', out.getvalue())
+        self.assertEqual(self._count('in_progress'), 7)
@@ -0,0 +1,197 @@
+"""
+Tests for GET /api/orders/: UNION of indexed scans with keyset pagination.
+"""
+
+from datetime import timedelta
+from unittest import skipUnless
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+
+from core.query_budget import QueryBudgetTestMixin
+from offers.models import Offer, OfferDetail
+from orders.models import Order
+
+User = get_user_model()
+
+
+class OrderListAPITest(QueryBudgetTestMixin, APITestCase):
+    """
+    Tests content, order and pagination of the order list.
+    """
+
+    def setUp(self):
+        """
+        Create orders where the user is customer, business user, or neither.
+        """
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='bizuser', email='biz@example.com', password='TestPass123!', type='business'
+        )
+        other_business = User.objects.create_user(username='other', type='business')
+        customer = User.objects.create_user(username='customer', type='customer')
+        own_offer = self._offer(self.user)
+        other_offer = self._offer(other_business)
+
+        statuses = ['pending', 'in_progress', 'completed', 'cancelled']
+        expected = []
+        for i in range(12):
+            if i % 3 == 0:
+                expected.append(self._order(self.user, other_business, other_offer, statuses[i % 4]))
+            elif i % 3 == 1:
+                expected.append(self._order(customer, self.user, own_offer, statuses[i % 4]))
+            else:
+                self._order(customer, other_business, other_offer, 'pending')
+        # Distinct timestamps, with one tie to exercise the id tiebreaker
+        start = timezone.now()
+        for i, order in enumerate(Order.objects.order_by('id')):
+            Order.objects.filter(pk=order.pk).update(created_at=start - timedelta(minutes=max(i, 1)))
+        self.expected_ids = list(
+            Order.objects.filter(pk__in=[order.pk for order in expected])
+            .order_by('-created_at', 'id').values_list('id', flat=True)
+        )
+        self.client.force_authenticate(self.user)
+
+    def _offer(self, owner):
+        offer = Offer.objects.create(user=owner, title='Offer', description='Test')
+        OfferDetail.objects.create(
+            offer=offer, title='Basic', revisions=1, delivery_time_in_days=3,
+            price=10, features=['A'], offer_type='basic'
+        )
+        return offer
+
+    def _order(self, customer, business, offer, order_status):
+        return Order.objects.create(
+            customer_user=customer, business_user=business, offer=offer,
+            offer_detail=offer.details.get(), title='Basic', status=order_status
+        )
+
+    def _all_ids(self, url):
+        ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids.extend(item['id'] for item in response.data['results'])
+            url = response.data['next']
+        return ids
+
+    def test_lists_customer_and_business_orders(self):
+        """
+        Test that both sides are listed, newest first, and nothing else.
+        """
+        response = self.client.get('/api/orders/')
+
+        ids = [item['id'] for item in response.data['results']]
+        self.assertEqual(ids, self.expected_ids)
+
+    def test_keyset_pagination(self):
+        """
+        Test that small pages walk the whole list without gaps or repeats.
+        """
+        self.assertEqual(self._all_ids('/api/orders/?page_size=3'), self.expected_ids)
+
+    def test_previous_page(self):
+        """
+        Test that the previous link returns the earlier page.
+        """
+        first = self.client.get('/api/orders/?page_size=3')
+        second = self.client.get(first.data['next'])
+        back = self.client.get(second.data['previous'])
+
+        self.assertEqual(
+            [item['id'] for item in back.data['results']],
+            [item['id'] for item in first.data['results']]
+        )
+
+    def test_status_filter(self):
+        """
+        Test that ?status= filters both sides.
+        """
+        expected = [
+            pk for pk in self.expected_ids
+            if Order.objects.get(pk=pk).status == 'pending'
+        ]
+
+        self.assertEqual(self._all_ids('/api/orders/?status=pending&page_size=1'), expected)
+
+    def test_unknown_status(self):
+        """
+        Test that an unknown status returns 400.
+        """
+        response = self.client.get('/api/orders/?status=shipped')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_within_query_budget(self):
+        """
+        Test that a page is one query after authentication.
+        """
+        response = self.assertWithinQueryBudget('get', '/api/orders/?page_size=3')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+@skipUnless(connection.vendor == 'sqlite', 'Checks SQLite query plans.')
+class OrderListQueryPlanTest(APITestCase):
+    """
+    Tests that SQLite executes the order list as index-ordered scans.
+    """
+
+    def setUp(self):
+        """
+        Create an authenticated business user.
+        """
+        self.user = User.objects.create_user(username='bizuser', type='business')
+        self.client.force_authenticate(self.user)
+
+    def _plan(self, url):
+        """
+        Return the EXPLAIN QUERY PLAN details of the list query for a URL.
+        """
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        sql = ctx.captured_queries[-1]['sql']
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+            return [row[-1] for row in cursor.fetchall()]
+
+    def _assert_index_ordered(self, plan):
+        self.assertTrue(any('order_customer_created_idx' in step for step in plan), plan)
+        self.assertTrue(any('order_business_status_idx' in step for step in plan), plan)
+        # Every branch is one index range search that already yields rows in
+        # created_at order; the UNION only sorts the page_size + 1 rows per branch
+        order_steps = [step for step in plan if 'orders_order' in step]
+        self.assertTrue(all(step.startswith('SEARCH') and 'INDEX' in step for step in order_steps), plan)
+        for i, step in enumerate(plan):
+            if step.startswith('CO-ROUTINE'):
+                self.assertEqual(plan[i + 2], f'SCAN {step.split()[-1]}', plan)
+
+    def test_first_page_plan(self):
+        """
+        Test the plan of the first page.
+        """
+        self._assert_index_ordered(self._plan('/api/orders/'))
+
+    def test_cursor_page_plan(self):
+        """
+        Test the plan of a page after a cursor, filtered by status.
+        """
+        offer = Offer.objects.create(user=self.user, title='Offer', description='Test')
+        detail = OfferDetail.objects.create(
+            offer=offer, title='Basic', revisions=1, delivery_time_in_days=3,
+            price=10, features=['A'], offer_type='basic'
+        )
+        customer = User.objects.create_user(username='customer', type='customer')
+        for _ in range(2):
+            Order.objects.create(
+                customer_user=customer, business_user=self.user, offer=offer,
+                offer_detail=detail, title='Basic'
+            )
+        first = self.client.get('/api/orders/?status=pending&page_size=1')
+
+        self._assert_index_ordered(self._plan(first.data['next']))
@@ -0,0 +1,136 @@
+"""
+Tests for the OfferDetail terms stored on Order at purchase time.
+"""
+
+from decimal import Decimal
+from importlib import import_module
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+
+from offers.models import Offer, OfferDetail
+from orders.models import Order
+
+User = get_user_model()
+
+snapshot_migration = import_module('orders.migrations.0004_order_detail_snapshot')
+
+
+class OrderSnapshotTest(APITestCase):
+    """
+    Tests that orders keep the package terms they were placed with.
+    """
+
+    def setUp(self):
+        """
+        Create a business user with a two-tier offer and a customer.
+        """
+        self.client = APIClient()
+        self.business = User.objects.create_user(
+            username='bizuser', email='biz@example.com', password='TestPass123!', type='business'
+        )
+        self.customer = User.objects.create_user(
+            username='customer', email='cust@example.com', password='TestPass123!', type='customer'
+        )
+        self.offer = Offer.objects.create(user=self.business, title='Logo', description='Test')
+        self.detail = OfferDetail.objects.create(
+            offer=self.offer, title='Logo Basic', revisions=2, delivery_time_in_days=5,
+            price=150, features=['Logo', 'Visitenkarte'], offer_type='basic'
+        )
+        OfferDetail.objects.create(
+            offer=self.offer, title='Logo Premium', revisions=5, delivery_time_in_days=10,
+            price=500, features=['Logo'], offer_type='premium'
+        )
+        self.customer_token = Token.objects.create(user=self.customer)
+        self.business_token = Token.objects.create(user=self.business)
+
+    def _place_order(self):
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.customer_token.key)
+        response = self.client.post('/api/orders/', {'offer_detail_id': self.detail.id}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response
+
+    def _patch_offer(self, details):
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.business_token.key)
+        response = self.client.patch(
+            f'/api/offers/{self.offer.id}/', {'details': details}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_terms_copied(self):
+        """
+        Test that the created order carries the package terms.
+        """
+        response = self._place_order()
+
+        self.assertEqual(response.data['title'], 'Logo Basic')
+        self.assertEqual(response.data['revisions'], 2)
+        self.assertEqual(response.data['delivery_time_in_days'], 5)
+        self.assertEqual(response.data['price'], '150.00')
+        self.assertEqual(response.data['features'], ['Logo', 'Visitenkarte'])
+        self.assertEqual(response.data['offer_type'], 'basic')
+
+    def test_offer_edit_does_not_change_order(self):
+        """
+        Test that editing the purchased package leaves the order unchanged.
+        """
+        self._place_order()
+
+        self._patch_offer([{'offer_type': 'basic', 'price': '999.00', 'features': ['Other']}])
+
+        order = Order.objects.get()
+        self.assertEqual(order.price, Decimal('150.00'))
+        self.assertEqual(order.features, ['Logo', 'Visitenkarte'])
+
+    def test_removed_package_keeps_order(self):
+        """
+        Test that removing the purchased package keeps the order and its terms.
+        """
+        self._place_order()
+
+        self._patch_offer([{
+            'title': 'Logo Premium', 'revisions': 5, 'delivery_time_in_days': 10,
+            'price': '500.00', 'features': ['Logo'], 'offer_type': 'premium'
+        }])
+
+        order = Order.objects.get()
+        self.assertIsNone(order.offer_detail)
+        self.assertEqual(order.offer_type, 'basic')
+        self.assertEqual(order.price, Decimal('150.00'))
+
+    def test_list_reads_single_table(self):
+        """
+        Test that the order list reads orders without joins.
+        """
+        self._place_order()
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/orders/')
+        list_sql = ctx.captured_queries[-1]['sql']
+
+        self.assertEqual(response.data['results'][0]['price'], '150.00')
+        self.assertNotIn('JOIN', list_sql)
+
+    def test_backfill_migration(self):
+        """
+        Test that the data migration copies terms onto existing orders.
+        """
+        order = Order.objects.create(
+            customer_user=self.customer, business_user=self.business, offer=self.offer,
+            offer_detail=self.detail, title='Old title'
+        )
+
+        snapshot_migration.backfill_detail_snapshot(apps, connection.schema_editor())
+
+        order.refresh_from_db()
+        self.assertEqual(order.title, 'Old title')
+        self.assertEqual(order.revisions, 2)
+        self.assertEqual(order.delivery_time_in_days, 5)
+        self.assertEqual(order.price, Decimal('150.00'))
+        self.assertEqual(order.features, ['Logo', 'Visitenkarte'])
+        self.assertEqual(order.offer_type, 'basic')
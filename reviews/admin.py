@@ -1,3 +1,26 @@
+"""
+Admin configuration for reviews app.
+"""
+
 from django.contrib import admin
+from .models import BusinessRating, Review
+
+
+@admin.register(Review)
+class ReviewAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for Review model.
+    """
+    list_display = ['id', 'business_user', 'reviewer', 'rating', 'updated_at']
+    list_filter = ['rating', 'updated_at']
+    search_fields = ['description', 'business_user__username', 'reviewer__username']
+    readonly_fields = ['created_at', 'updated_at']
+
 
-# Register your models here.
+@admin.register(BusinessRating)
+class BusinessRatingAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for BusinessRating model (maintained automatically).
+    """
+    list_display = ['business_user', 'review_count', 'rating_sum', 'average_rating']
+    readonly_fields = ['business_user', 'review_count', 'rating_sum']
@@ -0,0 +1,23 @@
+"""
+Query parameter filters for review endpoints.
+"""
+
+import django_filters
+
+from reviews.models import Review
+
+
+class ReviewFilter(django_filters.FilterSet):
+    """
+    Filters for GET /api/reviews/.
+
+    ?business_user_id=<int>  - reviews of this business user
+    ?reviewer_id=<int>       - reviews written by this user
+    """
+
+    business_user_id = django_filters.NumberFilter(field_name='business_user_id')
+    reviewer_id = django_filters.NumberFilter(field_name='reviewer_id')
+
+    class Meta:
+        model = Review
+        fields = ['business_user_id', 'reviewer_id']
@@ -0,0 +1,87 @@
+"""
+Serializers for reviews.
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import IntegrityError, transaction
+from rest_framework import serializers
+
+from reviews.models import BusinessRating, Review
+
+User = get_user_model()
+
+
+class ReviewSerializer(serializers.ModelSerializer):
+    """
+    Serializer for Review.
+
+    ``business_user`` is set on create only; ``reviewer`` comes from
+    serializer.save(). Writes run in a transaction so the review and
+    its BusinessRating delta commit together.
+    """
+
+    business_user = serializers.PrimaryKeyRelatedField(
+        queryset=User.objects.filter(type='business').only('id')
+    )
+
+    class Meta:
+        model = Review
+        fields = [
+            'id',
+            'business_user',
+            'reviewer',
+            'rating',
+            'description',
+            'created_at',
+            'updated_at'
+        ]
+        read_only_fields = ['reviewer', 'created_at', 'updated_at']
+        # The one-review-per-business rule is enforced in create()
+        validators = []
+
+    def create(self, validated_data):
+        """
+        Insert the review, or reject a second review of the same business user.
+
+        Raises:
+            ValidationError: The reviewer already reviewed this business user.
+        """
+        try:
+            with transaction.atomic():
+                return super().create(validated_data)
+        except IntegrityError:
+            raise serializers.ValidationError(
+                {'business_user': 'You have already reviewed this business user.'}
+            )
+
+    def update(self, instance, validated_data):
+        """
+        Update rating and description; the reviewed business user is fixed.
+        """
+        validated_data.pop('business_user', None)
+        with transaction.atomic():
+            return super().update(instance, validated_data)
+
+
+class RatingSummaryField(serializers.ReadOnlyField):
+    """
+    One BusinessRating value of a business user, for profile serializers.
+
+    Reads ``user.rating_summary`` (select_related it in the view) and
+    treats a missing row as no reviews.
+    """
+
+    # Read by core.sparse_fields.sparse_queryset
+    sources = ('rating_summary',)
+
+    def __init__(self, attribute, **kwargs):
+        self.attribute = attribute
+        super().__init__(source='*', **kwargs)
+
+    def to_representation(self, user):
+        try:
+            summary = user.rating_summary
+        except ObjectDoesNotExist:
+            summary = BusinessRating(business_user_id=user.pk)
+        return getattr(summary, self.attribute)
@@ -0,0 +1,13 @@
+"""
+URL configuration for reviews app.
+"""
+
+from django.urls import path
+from . import views
+
+app_name = 'reviews'
+
+urlpatterns = [
+    path('reviews/', views.ReviewListCreateView.as_view(), name='review-list-create'),
+    path('reviews/<int:pk>/', views.ReviewDetailView.as_view(), name='review-detail'),
+]
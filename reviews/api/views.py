@@ -0,0 +1,117 @@
+"""
+Views for reviews.
+"""
+
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import generics, status
+from rest_framework.filters import OrderingFilter
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from core.pagination import KeysetCursorPagination
+from core.query_budget import QueryBudgetMixin
+from reviews.models import Review
+from .filters import ReviewFilter
+from .serializers import ReviewSerializer
+
+
+class ReviewListCreateView(QueryBudgetMixin, generics.ListCreateAPIView):
+    """
+    List reviews or write one.
+
+    GET  /api/reviews/  - auth required, cursor-paginated (?cursor=, ?page_size=)
+                          filters: ?business_user_id=, ?reviewer_id=
+                          ordering: ?ordering=rating or updated_at (default
+                          -updated_at; prefix '-' to reverse)
+    POST /api/reviews/  - only customer users, one review per business user;
+                          body: {"business_user", "rating", "description"}
+    """
+
+    queryset = Review.objects.all()
+    serializer_class = ReviewSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = KeysetCursorPagination
+    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    filterset_class = ReviewFilter
+    ordering_fields = ['rating', 'updated_at']
+    ordering = ['-updated_at']
+    # Token, business user lookup, and the review insert plus rating
+    # upsert with their SAVEPOINT/RELEASE
+    query_budget = {'GET': 2, 'POST': 6}
+
+    def create(self, request, *args, **kwargs):
+        """
+        Only customers can write reviews.
+
+        Returns:
+            Response: Created review, 400 on a duplicate, or 403 Forbidden.
+        """
+        if request.user.type != 'customer':
+            return Response(
+                {'error': 'Only customers can write reviews.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        return super().create(request, *args, **kwargs)
+
+    def perform_create(self, serializer):
+        """
+        Set the current user as the reviewer.
+        """
+        serializer.save(reviewer=self.request.user)
+
+
+class ReviewDetailView(QueryBudgetMixin, generics.RetrieveUpdateDestroyAPIView):
+    """
+    Retrieve, update, or delete a single review.
+
+    GET    /api/reviews/<id>/  - auth required
+    PATCH  /api/reviews/<id>/  - only the reviewer; rating and description
+    DELETE /api/reviews/<id>/  - only the reviewer
+    """
+
+    queryset = Review.objects.all()
+    serializer_class = ReviewSerializer
+    permission_classes = [IsAuthenticated]
+    # Token, the review, and a rating change's UPDATE with the
+    # BusinessRating and PlatformStats deltas (SAVEPOINT/RELEASE around
+    # the update)
+    query_budget = {'GET': 2, 'PUT': 7, 'PATCH': 7, 'DELETE': 5}
+
+    def get_object(self):
+        """
+        Load the review once per request.
+
+        update() and destroy() check the reviewer before the generic
+        implementations call get_object() again.
+        """
+        if not hasattr(self, '_review'):
+            self._review = super().get_object()
+        return self._review
+
+    def update(self, request, *args, **kwargs):
+        """
+        Only the reviewer can update.
+
+        Returns:
+            Response: Updated review or 403 Forbidden.
+        """
+        if self.get_object().reviewer_id != request.user.id:
+            return Response(
+                {'error': 'You do not have permission to edit this review.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        return super().update(request, *args, **kwargs)
+
+    def destroy(self, request, *args, **kwargs):
+        """
+        Only the reviewer can delete.
+
+        Returns:
+            Response: 204 No Content or 403 Forbidden.
+        """
+        if self.get_object().reviewer_id != request.user.id:
+            return Response(
+                {'error': 'You do not have permission to delete this review.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        return super().destroy(request, *args, **kwargs)
@@ -0,0 +1,73 @@
+"""
+Management command that repairs drift in the business rating aggregates.
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Sum
+
+from reviews.models import BusinessRating, Review
+
+
+class Command(BaseCommand):
+    """
+    Recount reviews per business user and fix the BusinessRating rows.
+
+    Aggregate rows are locked (SELECT ... FOR UPDATE) before the reviews
+    are counted, so review writes that commit meanwhile wait for the
+    repair and then apply their own delta on top of it. Drift comes from
+    queryset updates that skipped reviews.ratings or raw SQL.
+    """
+
+    help = 'Recount reviews and repair the BusinessRating table.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--business-user', type=int, action='append', dest='business_users',
+            help='Only reconcile this business user id (repeatable).'
+        )
+        parser.add_argument(
+            '--dry-run', action='store_true', help='Report drift without changing anything.'
+        )
+
+    def handle(self, *args, **options):
+        """
+        Compare stored aggregates with actual ones and apply the fixes.
+        """
+        ratings = BusinessRating.objects.all()
+        reviews = Review.objects.all()
+        if options['business_users']:
+            ratings = ratings.filter(business_user_id__in=options['business_users'])
+            reviews = reviews.filter(business_user_id__in=options['business_users'])
+
+        with transaction.atomic():
+            stored = {rating.business_user_id: rating for rating in ratings.select_for_update()}
+            actual = {
+                row['business_user_id']: (row['review_count'], row['rating_sum'])
+                for row in reviews.order_by().values('business_user_id')
+                .annotate(review_count=Count('id'), rating_sum=Sum('rating'))
+            }
+
+            to_update, to_create = [], []
+            for business_user_id, rating in stored.items():
+                review_count, rating_sum = actual.get(business_user_id, (0, 0))
+                if (rating.review_count, rating.rating_sum) != (review_count, rating_sum):
+                    rating.review_count, rating.rating_sum = review_count, rating_sum
+                    to_update.append(rating)
+            for business_user_id, (review_count, rating_sum) in actual.items():
+                if business_user_id not in stored:
+                    to_create.append(BusinessRating(
+                        business_user_id=business_user_id,
+                        review_count=review_count, rating_sum=rating_sum
+                    ))
+
+            if not options['dry_run']:
+                BusinessRating.objects.bulk_update(
+                    to_update, ['review_count', 'rating_sum'], batch_size=500
+                )
+                BusinessRating.objects.bulk_create(to_create, batch_size=500)
+
+        verb = 'Would fix' if options['dry_run'] else 'Fixed'
+        self.stdout.write(self.style.SUCCESS(
+            f'{verb} {len(to_update)} ratings and created {len(to_create)}.'
+        ))
@@ -0,0 +1,53 @@
+# Generated by Django 4.2.7 on 2026-10-17 08:44
+
+from django.conf import settings
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('accounts', '0003_revokedtoken'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BusinessRating',
+            fields=[
+                ('business_user', models.OneToOneField(help_text='Reviewed business user', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='rating_summary', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('review_count', models.IntegerField(default=0, help_text='Number of reviews')),
+                ('rating_sum', models.IntegerField(default=0, help_text='Sum of all review ratings')),
+            ],
+            options={
+                'verbose_name': 'Business rating',
+                'verbose_name_plural': 'Business ratings',
+            },
+        ),
+        migrations.CreateModel(
+            name='Review',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rating', models.PositiveSmallIntegerField(help_text='Rating from 1 to 5', validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(5)])),
+                ('description', models.TextField(blank=True, default='', help_text='Review text')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('business_user', models.ForeignKey(db_index=False, help_text='Reviewed business user', on_delete=django.db.models.deletion.CASCADE, related_name='received_reviews', to=settings.AUTH_USER_MODEL)),
+                ('reviewer', models.ForeignKey(db_index=False, help_text='Customer who wrote the review', on_delete=django.db.models.deletion.CASCADE, related_name='written_reviews', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Review',
+                'verbose_name_plural': 'Reviews',
+                'ordering': ['-updated_at'],
+                'indexes': [models.Index(fields=['-updated_at'], name='review_updated_idx'), models.Index(fields=['business_user', '-updated_at'], name='review_business_updated_idx'), models.Index(fields=['business_user', '-rating'], name='review_business_rating_idx'), models.Index(fields=['reviewer', '-updated_at'], name='review_reviewer_updated_idx'), models.Index(fields=['reviewer', '-rating'], name='review_reviewer_rating_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='review',
+            constraint=models.UniqueConstraint(fields=('business_user', 'reviewer'), name='review_business_reviewer_uniq'),
+        ),
+    ]
@@ -1,3 +1,122 @@
+"""
+Models for reviews of business users.
+"""
+
+from django.conf import settings
+from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 
-# Create your models here.
+
+class Review(models.Model):
+    """
+    A customer's rating and review of a business user.
+
+    Each reviewer can review a business user once.
+
+    Attributes:
+        business_user (ForeignKey): The reviewed business user.
+        reviewer (ForeignKey): The customer who wrote the review.
+        rating (int): Rating from 1 to 5.
+        description (str): Review text.
+        created_at (datetime): Creation timestamp.
+        updated_at (datetime): Last update timestamp.
+    """
+
+    business_user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='received_reviews',
+        # Covered by review_business_reviewer_uniq and the business indexes
+        db_index=False,
+        help_text="Reviewed business user"
+    )
+    reviewer = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='written_reviews',
+        # Covered by the reviewer indexes
+        db_index=False,
+        help_text="Customer who wrote the review"
+    )
+    rating = models.PositiveSmallIntegerField(
+        validators=[MinValueValidator(1), MaxValueValidator(5)],
+        help_text="Rating from 1 to 5"
+    )
+    description = models.TextField(
+        blank=True,
+        default='',
+        help_text="Review text"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-updated_at']
+        verbose_name = 'Review'
+        verbose_name_plural = 'Reviews'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['business_user', 'reviewer'], name='review_business_reviewer_uniq'
+            ),
+        ]
+        indexes = [
+            # One per filter and ?ordering= of GET /api/reviews/
+            models.Index(fields=['-updated_at'], name='review_updated_idx'),
+            models.Index(fields=['business_user', '-updated_at'], name='review_business_updated_idx'),
+            models.Index(fields=['business_user', '-rating'], name='review_business_rating_idx'),
+            models.Index(fields=['reviewer', '-updated_at'], name='review_reviewer_updated_idx'),
+            models.Index(fields=['reviewer', '-rating'], name='review_reviewer_rating_idx'),
+        ]
+
+    def __str__(self):
+        """String representation of Review."""
+        return f"Review #{self.id}: {self.rating}/5 for {self.business_user_id}"
+
+
+class BusinessRating(models.Model):
+    """
+    Review count and rating sum of a business user.
+
+    Maintained by reviews.ratings in the transaction of every review
+    insert, rating change and delete, so profile cards read one row
+    instead of running AVG() over the reviews.
+    ``reconcile_business_ratings`` repairs drift.
+
+    Attributes:
+        business_user (OneToOneField): The reviewed business user.
+        review_count (int): Number of reviews.
+        rating_sum (int): Sum of their ratings.
+    """
+
+    business_user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='rating_summary',
+        help_text="Reviewed business user"
+    )
+    review_count = models.IntegerField(
+        default=0,
+        help_text="Number of reviews"
+    )
+    rating_sum = models.IntegerField(
+        default=0,
+        help_text="Sum of all review ratings"
+    )
+
+    class Meta:
+        verbose_name = 'Business rating'
+        verbose_name_plural = 'Business ratings'
+
+    @property
+    def average_rating(self):
+        """
+        Return the average rating rounded to one decimal, or None without reviews.
+        """
+        if not self.review_count:
+            return None
+        return round(self.rating_sum / self.review_count, 1)
+
+    def __str__(self):
+        """String representation of BusinessRating."""
+        return f"{self.business_user_id}: {self.average_rating} ({self.review_count})"
@@ -0,0 +1,79 @@
+"""
+Incrementally maintained rating aggregates (BusinessRating).
+
+Every Review insert, rating change and delete turns into deltas of
+``review_count`` and ``rating_sum`` on the reviewed business user's
+BusinessRating row. The signal handlers in reviews.signals apply them
+in the same transaction as the review write, so the average never
+includes a review that was rolled back. Code that writes reviews with
+queryset update() or bulk_create() bypasses the signals and must call
+``apply_rating_deltas`` itself; ``reconcile_business_ratings`` repairs
+drift.
+
+``apply_rating_deltas`` sends ``rating_deltas_applied`` with the same
+deltas, so platform-wide totals (stats.signals) follow every path that
+keeps BusinessRating up to date.
+"""
+
+from collections import defaultdict
+
+from django.db.models import F
+from django.dispatch import Signal
+
+from core.counters import upsert_increments
+from reviews.models import BusinessRating
+
+# Sent by apply_rating_deltas with ``deltas``, in the writing transaction
+rating_deltas_applied = Signal()
+
+
+def rating_deltas(old, new):
+    """
+    Return the aggregate deltas for a review moving from ``old`` to ``new``.
+
+    Args:
+        old (tuple): (business_user_id, rating) before, or None for an insert.
+        new (tuple): (business_user_id, rating) after, or None for a delete.
+
+    Returns:
+        dict: {business_user_id: (count delta, rating sum delta)}, without
+            zero entries.
+    """
+    deltas = defaultdict(lambda: [0, 0])
+    if old is not None:
+        deltas[old[0]][0] -= 1
+        deltas[old[0]][1] -= old[1]
+    if new is not None:
+        deltas[new[0]][0] += 1
+        deltas[new[0]][1] += new[1]
+    return {
+        business_user_id: tuple(delta)
+        for business_user_id, delta in deltas.items() if any(delta)
+    }
+
+
+def apply_rating_deltas(deltas):
+    """
+    Add deltas to the BusinessRating rows.
+
+    Runs in the caller's transaction. A new review creates the missing
+    row (core.counters.upsert_increments). Other changes only update
+    existing rows, so deleting a business user (whose row cascades away
+    with its reviews) never recreates one.
+
+    Args:
+        deltas (dict): {business_user_id: (count delta, rating sum delta)}.
+    """
+    increments = []
+    for business_user_id, (count, rating_sum) in sorted(deltas.items()):
+        if count <= 0:
+            BusinessRating.objects.filter(business_user_id=business_user_id).update(
+                review_count=F('review_count') + count, rating_sum=F('rating_sum') + rating_sum
+            )
+        else:
+            increments.append((business_user_id, count, rating_sum))
+    upsert_increments(
+        BusinessRating, ('business_user_id',), ('review_count', 'rating_sum'), increments
+    )
+    if deltas:
+        rating_deltas_applied.send(sender=BusinessRating, deltas=deltas)
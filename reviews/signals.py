@@ -0,0 +1,38 @@
+"""
+Signal handlers for the reviews app.
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.counters import loaded_values, remember_stored_values, saved_values
+from reviews.models import Review
+from reviews.ratings import apply_rating_deltas, rating_deltas
+
+# (business_user_id, rating): the aggregate and rating a review is counted with
+RATING_FIELDS = ('business_user_id', 'rating')
+
+remember_stored_values(Review, '_rating_key', RATING_FIELDS)
+
+
+@receiver(post_save, sender=Review)
+def rate_review_save(sender, instance, created, **kwargs):
+    """
+    Update the aggregate on insert or rating change.
+    """
+    old = None if created else instance._rating_key
+    new = saved_values(instance, RATING_FIELDS, old)
+    if new is None:
+        # Saved with only other fields loaded; the rating key was not written
+        return
+    apply_rating_deltas(rating_deltas(old, new))
+    instance._rating_key = new
+
+
+@receiver(post_delete, sender=Review)
+def rate_review_delete(sender, instance, **kwargs):
+    """
+    Remove a deleted review from its aggregate.
+    """
+    old = instance._rating_key or loaded_values(instance, RATING_FIELDS)
+    apply_rating_deltas(rating_deltas(old, None))
@@ -0,0 +1,254 @@
+"""
+Tests for /api/reviews/.
+"""
+
+from datetime import timedelta
+from unittest import skipUnless
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+
+from core.query_budget import QueryBudgetTestMixin
+from reviews.models import Review
+
+User = get_user_model()
+
+
+class ReviewTestMixin:
+    """
+    Create two business users and two customers; the first customer is logged in.
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.business = User.objects.create_user(
+            username='bizuser', email='biz@example.com', password='TestPass123!', type='business'
+        )
+        self.other_business = User.objects.create_user(username='otherbiz', type='business')
+        self.customer = User.objects.create_user(
+            username='customer', email='cust@example.com', password='TestPass123!', type='customer'
+        )
+        self.other_customer = User.objects.create_user(username='othercust', type='customer')
+        self.client.force_authenticate(self.customer)
+
+    def _review(self, reviewer, business_user, rating):
+        return Review.objects.create(
+            reviewer=reviewer, business_user=business_user, rating=rating, description='Text'
+        )
+
+
+class ReviewListAPITest(QueryBudgetTestMixin, ReviewTestMixin, APITestCase):
+    """
+    Tests filtering, ordering and pagination of GET /api/reviews/.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.reviews = [
+            self._review(self.customer, self.business, 3),
+            self._review(self.other_customer, self.business, 5),
+            self._review(self.customer, self.other_business, 1),
+        ]
+        now = timezone.now()
+        for age, review in enumerate(self.reviews):
+            Review.objects.filter(pk=review.pk).update(updated_at=now - timedelta(minutes=age))
+
+    def _ids(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [item['id'] for item in response.data['results']]
+
+    def test_default_ordering(self):
+        """
+        Test that reviews are listed most recently updated first.
+        """
+        self.assertEqual(self._ids('/api/reviews/'), [review.id for review in self.reviews])
+
+    def test_filter_business_user(self):
+        """
+        Test ?business_user_id= with rating ordering.
+        """
+        ids = self._ids(f'/api/reviews/?business_user_id={self.business.id}&ordering=-rating')
+
+        self.assertEqual(ids, [self.reviews[1].id, self.reviews[0].id])
+
+    def test_filter_reviewer(self):
+        """
+        Test ?reviewer_id= with updated_at ordering.
+        """
+        ids = self._ids(f'/api/reviews/?reviewer_id={self.customer.id}&ordering=updated_at')
+
+        self.assertEqual(ids, [self.reviews[2].id, self.reviews[0].id])
+
+    def test_pagination(self):
+        """
+        Test that pages follow each other without gaps.
+        """
+        first = self.client.get('/api/reviews/?ordering=rating&page_size=2')
+        second = self.client.get(first.data['next'])
+
+        ids = [item['id'] for item in first.data['results'] + second.data['results']]
+        self.assertEqual(ids, [self.reviews[2].id, self.reviews[0].id, self.reviews[1].id])
+        self.assertIsNone(second.data['next'])
+
+    def test_within_query_budget(self):
+        """
+        Test that GET stays within its query budget.
+        """
+        response = self.assertWithinQueryBudget('get', f'/api/reviews/?business_user_id={self.business.id}')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @skipUnless(connection.vendor == 'sqlite', 'Checks SQLite query plans.')
+    def test_filtered_lists_use_indexes(self):
+        """
+        Test that filtered, ordered lists read a composite index without sorting.
+        """
+        cases = {
+            f'business_user_id={self.business.id}&ordering=-rating': 'review_business_rating_idx',
+            f'business_user_id={self.business.id}': 'review_business_updated_idx',
+            f'reviewer_id={self.customer.id}&ordering=-rating': 'review_reviewer_rating_idx',
+            f'reviewer_id={self.customer.id}': 'review_reviewer_updated_idx',
+        }
+        for query, index in cases.items():
+            with CaptureQueriesContext(connection) as ctx:
+                self.client.get(f'/api/reviews/?{query}')
+            with connection.cursor() as cursor:
+                cursor.execute(f"EXPLAIN QUERY PLAN {ctx.captured_queries[-1]['sql']}")
+                plan = [row[-1] for row in cursor.fetchall()]
+            self.assertTrue(any(index in step for step in plan), (query, plan))
+            self.assertFalse(any('ORDER BY' in step for step in plan), (query, plan))
+
+    def test_unauthenticated(self):
+        """
+        Test that listing requires authentication.
+        """
+        self.client.force_authenticate(None)
+
+        response = self.client.get('/api/reviews/')
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class ReviewWriteAPITest(QueryBudgetTestMixin, ReviewTestMixin, APITestCase):
+    """
+    Tests creating, updating and deleting reviews.
+    """
+
+    def _post(self, business_user, rating=4):
+        return self.client.post(
+            '/api/reviews/',
+            {'business_user': business_user.id, 'rating': rating, 'description': 'Good'},
+            format='json'
+        )
+
+    def test_create(self):
+        """
+        Test that a customer can review a business user.
+        """
+        response = self._post(self.business)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        review = Review.objects.get()
+        self.assertEqual(review.reviewer, self.customer)
+        self.assertEqual(review.business_user, self.business)
+        self.assertEqual(response.data['rating'], 4)
+
+    def test_create_within_budget(self):
+        """
+        Test that POST stays within its query budget.
+        """
+        response = self.assertWithinQueryBudget(
+            'post', '/api/reviews/',
+            {'business_user': self.business.id, 'rating': 4, 'description': 'Good'}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_duplicate_review(self):
+        """
+        Test that a second review of the same business user returns 400.
+        """
+        self._post(self.business)
+
+        response = self._post(self.business, rating=1)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('business_user', response.data)
+        self.assertEqual(Review.objects.get().rating, 4)
+
+    def test_invalid_rating_and_target(self):
+        """
+        Test that ratings outside 1-5 and non-business targets return 400.
+        """
+        for business_user, rating in ((self.business, 0), (self.business, 6), (self.other_customer, 3)):
+            response = self._post(business_user, rating)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_business_user_forbidden(self):
+        """
+        Test that business users cannot write reviews.
+        """
+        self.client.force_authenticate(self.other_business)
+
+        response = self._post(self.business)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_update_own_review(self):
+        """
+        Test that the reviewer can change rating and description but not the target.
+        """
+        review = self._review(self.customer, self.business, 2)
+
+        response = self.client.patch(
+            f'/api/reviews/{review.id}/',
+            {'rating': 5, 'business_user': self.other_business.id}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        review.refresh_from_db()
+        self.assertEqual(review.rating, 5)
+        self.assertEqual(review.business_user, self.business)
+
+    def test_update_and_delete_within_budget(self):
+        """
+        Test that a rating change and a delete stay within their query budgets.
+        """
+        review = self._review(self.customer, self.business, 2)
+
+        patch = self.assertWithinQueryBudget(
+            'patch', f'/api/reviews/{review.id}/', {'rating': 5}, format='json'
+        )
+        delete = self.assertWithinQueryBudget('delete', f'/api/reviews/{review.id}/')
+
+        self.assertEqual(patch.status_code, status.HTTP_200_OK)
+        self.assertEqual(delete.status_code, status.HTTP_204_NO_CONTENT)
+
+    def test_update_foreign_review(self):
+        """
+        Test that other users cannot change or delete a review.
+        """
+        review = self._review(self.other_customer, self.business, 2)
+
+        patch = self.client.patch(f'/api/reviews/{review.id}/', {'rating': 5}, format='json')
+        delete = self.client.delete(f'/api/reviews/{review.id}/')
+
+        self.assertEqual(patch.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(delete.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertTrue(Review.objects.filter(pk=review.pk, rating=2).exists())
+
+    def test_delete_own_review(self):
+        """
+        Test that the reviewer can delete the review.
+        """
+        review = self._review(self.customer, self.business, 2)
+
+        response = self.client.delete(f'/api/reviews/{review.id}/')
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Review.objects.exists())
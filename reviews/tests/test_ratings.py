@@ -0,0 +1,172 @@
+"""
+Tests for the BusinessRating aggregates, profile cards and reconciliation.
+"""
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from reviews.models import BusinessRating, Review
+from reviews.tests.test_api_reviews import ReviewTestMixin
+
+
+class BusinessRatingTestMixin(ReviewTestMixin):
+    """
+    Helpers to read a business user's aggregate row.
+    """
+
+    def _rating(self, business_user=None):
+        rating = BusinessRating.objects.filter(
+            business_user=business_user or self.business
+        ).first()
+        return (rating.review_count, rating.rating_sum) if rating else None
+
+
+class BusinessRatingTest(BusinessRatingTestMixin, APITestCase):
+    """
+    Tests that aggregates follow review inserts, updates and deletes.
+    """
+
+    def test_insert_through_api(self):
+        """
+        Test that POST /api/reviews/ updates the aggregate in the same request.
+        """
+        self.client.post(
+            '/api/reviews/', {'business_user': self.business.id, 'rating': 4}, format='json'
+        )
+        self.client.force_authenticate(self.other_customer)
+        self.client.post(
+            '/api/reviews/', {'business_user': self.business.id, 'rating': 5}, format='json'
+        )
+
+        self.assertEqual(self._rating(), (2, 9))
+        self.assertEqual(BusinessRating.objects.get().average_rating, 4.5)
+
+    def test_rating_change(self):
+        """
+        Test that changing a rating adjusts the sum but not the count.
+        """
+        review = self._review(self.customer, self.business, 2)
+
+        self.client.patch(f'/api/reviews/{review.id}/', {'rating': 5}, format='json')
+        review = Review.objects.only('id').get()
+        review.description = 'Only the text'
+        review.save(update_fields=['description'])
+
+        self.assertEqual(self._rating(), (1, 5))
+
+    def test_deferred_rating_change(self):
+        """
+        Test that a rating change on a review loaded with only() is applied.
+        """
+        self._review(self.customer, self.business, 2)
+        review = Review.objects.only('id').get()
+        review.rating = 4
+        review.save(update_fields=['rating'])
+
+        self.assertEqual(self._rating(), (1, 4))
+
+    def test_delete(self):
+        """
+        Test that deleting reviews (also by cascade) removes them from the aggregate.
+        """
+        self._review(self.customer, self.business, 2)
+        self._review(self.other_customer, self.business, 4)
+
+        self.client.delete(f'/api/reviews/{Review.objects.get(reviewer=self.customer).id}/')
+        self.assertEqual(self._rating(), (1, 4))
+
+        self.other_customer.delete()
+        self.assertEqual(self._rating(), (0, 0))
+        self.assertIsNone(BusinessRating.objects.get().average_rating)
+
+    def test_delete_business_user(self):
+        """
+        Test that deleting a reviewed business user removes its aggregate.
+        """
+        self._review(self.customer, self.business, 3)
+
+        self.business.delete()
+
+        self.assertFalse(BusinessRating.objects.exists())
+
+    def test_rolled_back_review(self):
+        """
+        Test that a duplicate review leaves the aggregate unchanged.
+        """
+        self._review(self.customer, self.business, 3)
+
+        self.client.post(
+            '/api/reviews/', {'business_user': self.business.id, 'rating': 5}, format='json'
+        )
+
+        self.assertEqual(self._rating(), (1, 3))
+
+
+class BusinessProfileRatingTest(BusinessRatingTestMixin, APITestCase):
+    """
+    Tests review numbers on GET /api/profiles/business/.
+    """
+
+    def test_profile_cards(self):
+        """
+        Test that cards carry count and average without aggregating reviews.
+        """
+        self._review(self.customer, self.business, 4)
+        self._review(self.other_customer, self.business, 5)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/profiles/business/')
+        cards = {card['id']: card for card in response.data['results']}
+
+        self.assertEqual(cards[self.business.id]['review_count'], 2)
+        self.assertEqual(cards[self.business.id]['average_rating'], 4.5)
+        self.assertEqual(cards[self.other_business.id]['review_count'], 0)
+        self.assertIsNone(cards[self.other_business.id]['average_rating'])
+        self.assertFalse(any('reviews_review' in q['sql'] for q in ctx.captured_queries))
+
+    def test_sparse_fields(self):
+        """
+        Test that ?fields= can select only the rating numbers.
+        """
+        self._review(self.customer, self.business, 4)
+
+        response = self.client.get('/api/profiles/business/?fields=id,average_rating')
+        card = next(c for c in response.data['results'] if c['id'] == self.business.id)
+
+        self.assertEqual(card, {'id': self.business.id, 'average_rating': 4.0})
+
+
+class ReconcileBusinessRatingsTest(BusinessRatingTestMixin, APITestCase):
+    """
+    Tests for the reconcile_business_ratings command.
+    """
+
+    def test_repairs_drift(self):
+        """
+        Test that aggregates changed behind the signals are recomputed.
+        """
+        self._review(self.customer, self.business, 3)
+        self._review(self.other_customer, self.business, 5)
+        Review.objects.filter(reviewer=self.customer).update(rating=1)
+        BusinessRating.objects.all().delete()
+
+        call_command('reconcile_business_ratings', stdout=StringIO())
+
+        self.assertEqual(self._rating(), (2, 6))
+
+    def test_dry_run(self):
+        """
+        Test that --dry-run reports without writing.
+        """
+        self._review(self.customer, self.business, 3)
+        BusinessRating.objects.update(review_count=7)
+        out = StringIO()
+
+        call_command('reconcile_business_ratings', dry_run=True, stdout=out)
+
+        self.assertIn('Would fix 1 ratings', out.getvalue())
+        self.assertEqual(self._rating(), (7, 3))
@@ -0,0 +1,15 @@
+"""
+Admin configuration for stats app.
+"""
+
+from django.contrib import admin
+from .models import PlatformStats
+
+
+@admin.register(PlatformStats)
+class PlatformStatsAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for PlatformStats model (maintained automatically).
+    """
+    list_display = ['id', 'business_profile_count', 'offer_count', 'review_count', 'average_rating']
+    readonly_fields = ['business_profile_count', 'offer_count', 'review_count', 'rating_sum']
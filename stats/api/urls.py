@@ -0,0 +1,12 @@
+"""
+URL configuration for stats app.
+"""
+
+from django.urls import path
+from . import views
+
+app_name = 'stats'
+
+urlpatterns = [
+    path('base-info/', views.BaseInfoView.as_view(), name='base-info'),
+]
@@ -0,0 +1,43 @@
+"""
+Views for platform statistics.
+"""
+
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.query_budget import QueryBudgetMixin
+from stats.counters import get_platform_stats
+
+
+class BaseInfoView(QueryBudgetMixin, APIView):
+    """
+    Platform totals for the landing page.
+
+    GET /api/base-info/  - public; {"review_count", "average_rating",
+                           "business_profile_count", "offer_count"}
+
+    Reads the single PlatformStats row by primary key, so the cost does
+    not grow with the number of users, offers or reviews.
+    """
+
+    permission_classes = [AllowAny]
+    authentication_classes = []
+    # 1 for the stored row; 5 once after the row went missing and is
+    # rebuilt from the source tables (stats.counters.get_platform_stats)
+    query_budget = {'GET': 5}
+
+    def get(self, request):
+        """
+        Return the stored platform totals.
+
+        Returns:
+            Response: The four totals; average_rating is None without reviews.
+        """
+        stats = get_platform_stats()
+        return Response({
+            'review_count': stats.review_count,
+            'average_rating': stats.average_rating,
+            'business_profile_count': stats.business_profile_count,
+            'offer_count': stats.offer_count,
+        })
@@ -0,0 +1,80 @@
+"""
+Incrementally maintained platform totals (PlatformStats).
+
+The signal handlers in stats.signals turn User, Offer and Review
+writes into deltas and add them to the single PlatformStats row with
+``field = field + n`` in the same transaction as the write. Code that
+creates or deletes those objects with bulk_create() or queryset
+update()/delete() bypasses the signals and must call
+``apply_stats_deltas`` itself; ``reconcile_platform_stats`` repairs
+drift.
+
+Every counted write updates the same row, so these writes serialize on
+it. That is cheap next to the write itself, and on SQLite writers are
+serialized anyway.
+"""
+
+from django.contrib.auth import get_user_model
+from django.db.models import Count, F, Sum
+
+from offers.models import Offer
+from reviews.models import Review
+from stats.models import PlatformStats
+
+User = get_user_model()
+
+FIELDS = ('review_count', 'rating_sum', 'business_profile_count', 'offer_count')
+
+
+def compute_platform_stats():
+    """
+    Aggregate the platform totals from the source tables.
+
+    Returns:
+        dict: {field: value} for every field in FIELDS.
+    """
+    reviews = Review.objects.aggregate(review_count=Count('id'), rating_sum=Sum('rating'))
+    return {
+        'review_count': reviews['review_count'],
+        'rating_sum': reviews['rating_sum'] or 0,
+        'business_profile_count': User.objects.filter(type='business').count(),
+        'offer_count': Offer.objects.count(),
+    }
+
+
+def apply_stats_deltas(**deltas):
+    """
+    Add deltas to the PlatformStats row.
+
+    Runs in the caller's transaction. If the row does not exist yet it
+    is created from the source tables, which already include the
+    caller's write.
+
+    Args:
+        **deltas: {field: delta} for fields in FIELDS.
+    """
+    update = {field: F(field) + delta for field, delta in deltas.items() if delta}
+    if not update:
+        return
+    if not PlatformStats.objects.filter(pk=PlatformStats.SINGLETON_ID).update(**update):
+        get_platform_stats()
+
+
+def get_platform_stats():
+    """
+    Return the PlatformStats row, creating it from the source tables if missing.
+
+    Reading an existing row is one query; rebuilding a missing one adds
+    the three aggregates of compute_platform_stats and one INSERT.
+
+    Returns:
+        PlatformStats: The row.
+    """
+    try:
+        return PlatformStats.objects.get(pk=PlatformStats.SINGLETON_ID)
+    except PlatformStats.DoesNotExist:
+        pass
+    stats = PlatformStats(pk=PlatformStats.SINGLETON_ID, **compute_platform_stats())
+    # A row created concurrently wins; both were computed from the same tables
+    PlatformStats.objects.bulk_create([stats], ignore_conflicts=True)
+    return stats
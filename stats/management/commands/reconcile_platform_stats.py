@@ -0,0 +1,51 @@
+"""
+Management command that repairs drift in the platform statistics.
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from stats.counters import FIELDS, compute_platform_stats, get_platform_stats
+from stats.models import PlatformStats
+
+
+class Command(BaseCommand):
+    """
+    Recompute the platform totals and fix the PlatformStats row.
+
+    The row is locked (SELECT ... FOR UPDATE) before the source tables
+    are aggregated, so writes that commit meanwhile wait for the repair
+    and then apply their own delta on top of it. Run it periodically
+    (e.g. nightly from cron); drift comes from bulk_create(), queryset
+    update()/delete() or raw SQL that skipped the signals.
+    """
+
+    help = 'Recompute platform totals and repair the PlatformStats row.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run', action='store_true', help='Report drift without changing anything.'
+        )
+
+    def handle(self, *args, **options):
+        """
+        Compare the stored totals with actual ones and apply the fixes.
+        """
+        get_platform_stats()
+        with transaction.atomic():
+            stats = PlatformStats.objects.select_for_update().get(pk=PlatformStats.SINGLETON_ID)
+            actual = compute_platform_stats()
+            drift = {
+                field: (getattr(stats, field), value)
+                for field, value in actual.items() if getattr(stats, field) != value
+            }
+            if drift and not options['dry_run']:
+                for field in FIELDS:
+                    setattr(stats, field, actual[field])
+                stats.save(update_fields=list(drift))
+
+        verb = 'Would fix' if options['dry_run'] else 'Fixed'
+        details = ', '.join(f'{field} {old} -> {new}' for field, (old, new) in drift.items())
+        self.stdout.write(self.style.SUCCESS(
+            f'{verb} {len(drift)} totals' + (f': {details}.' if details else '.')
+        ))
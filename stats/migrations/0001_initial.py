@@ -0,0 +1,48 @@
+# Generated by Django 4.2.7 on 2026-10-17 08:47
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def create_stats_row(apps, schema_editor):
+    User = apps.get_model('accounts', 'User')
+    Offer = apps.get_model('offers', 'Offer')
+    Review = apps.get_model('reviews', 'Review')
+    PlatformStats = apps.get_model('stats', 'PlatformStats')
+    reviews = Review.objects.aggregate(review_count=Count('id'), rating_sum=Sum('rating'))
+    PlatformStats.objects.create(
+        pk=1,
+        review_count=reviews['review_count'],
+        rating_sum=reviews['rating_sum'] or 0,
+        business_profile_count=User.objects.filter(type='business').count(),
+        offer_count=Offer.objects.count(),
+    )
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('accounts', '0003_revokedtoken'),
+        ('offers', '0005_offer_image_derivatives'),
+        ('reviews', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlatformStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('review_count', models.IntegerField(default=0, help_text='Number of reviews')),
+                ('rating_sum', models.IntegerField(default=0, help_text='Sum of all review ratings')),
+                ('business_profile_count', models.IntegerField(default=0, help_text='Number of business users')),
+                ('offer_count', models.IntegerField(default=0, help_text='Number of offers')),
+            ],
+            options={
+                'verbose_name': 'Platform statistics',
+                'verbose_name_plural': 'Platform statistics',
+            },
+        ),
+        migrations.RunPython(create_stats_row, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,61 @@
+"""
+Models for platform-wide statistics.
+"""
+
+from django.db import models
+
+
+class PlatformStats(models.Model):
+    """
+    Single row of platform totals shown on the landing page.
+
+    Maintained by stats.counters from signal handlers on User, Offer
+    and Review writes, so GET /api/base-info/ reads one row instead of
+    aggregating three tables. ``reconcile_platform_stats`` repairs drift.
+
+    Attributes:
+        review_count (int): Number of reviews.
+        rating_sum (int): Sum of all review ratings.
+        business_profile_count (int): Number of business users.
+        offer_count (int): Number of offers.
+    """
+
+    # Primary key of the only row
+    SINGLETON_ID = 1
+
+    review_count = models.IntegerField(
+        default=0,
+        help_text="Number of reviews"
+    )
+    rating_sum = models.IntegerField(
+        default=0,
+        help_text="Sum of all review ratings"
+    )
+    business_profile_count = models.IntegerField(
+        default=0,
+        help_text="Number of business users"
+    )
+    offer_count = models.IntegerField(
+        default=0,
+        help_text="Number of offers"
+    )
+
+    class Meta:
+        verbose_name = 'Platform statistics'
+        verbose_name_plural = 'Platform statistics'
+
+    @property
+    def average_rating(self):
+        """
+        Return the average review rating rounded to one decimal, or None without reviews.
+        """
+        if not self.review_count:
+            return None
+        return round(self.rating_sum / self.review_count, 1)
+
+    def __str__(self):
+        """String representation of PlatformStats."""
+        return (
+            f"{self.business_profile_count} businesses, {self.offer_count} offers, "
+            f"{self.review_count} reviews"
+        )
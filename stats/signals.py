@@ -0,0 +1,70 @@
+"""
+Signal handlers for the stats app.
+"""
+
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.counters import loaded_values, remember_stored_values
+from offers.models import Offer
+from reviews.ratings import rating_deltas_applied
+from stats.counters import apply_stats_deltas
+
+User = get_user_model()
+
+# A user is counted as a business profile while its stored type is business
+TYPE_FIELDS = ('type',)
+BUSINESS = ('business',)
+
+remember_stored_values(User, '_stats_type', TYPE_FIELDS)
+
+
+@receiver(post_save, sender=User)
+def count_user_save(sender, instance, created, **kwargs):
+    """
+    Count new business users and users whose type changed.
+    """
+    user_type = loaded_values(instance, TYPE_FIELDS)
+    if user_type is None:
+        return
+    was_business = not created and instance._stats_type == BUSINESS
+    apply_stats_deltas(business_profile_count=int(user_type == BUSINESS) - int(was_business))
+    instance._stats_type = user_type
+
+
+@receiver(post_delete, sender=User)
+def count_user_delete(sender, instance, **kwargs):
+    """
+    Remove a deleted business user from the count.
+    """
+    if (instance._stats_type or loaded_values(instance, TYPE_FIELDS)) == BUSINESS:
+        apply_stats_deltas(business_profile_count=-1)
+
+
+@receiver(post_save, sender=Offer)
+def count_offer_save(sender, instance, created, **kwargs):
+    """
+    Count a new offer.
+    """
+    if created:
+        apply_stats_deltas(offer_count=1)
+
+
+@receiver(post_delete, sender=Offer)
+def count_offer_delete(sender, instance, **kwargs):
+    """
+    Remove a deleted offer from the count.
+    """
+    apply_stats_deltas(offer_count=-1)
+
+
+@receiver(rating_deltas_applied)
+def count_review_deltas(sender, deltas, **kwargs):
+    """
+    Add the review count and rating deltas of all business users.
+    """
+    apply_stats_deltas(
+        review_count=sum(count for count, _ in deltas.values()),
+        rating_sum=sum(rating_sum for _, rating_sum in deltas.values()),
+    )
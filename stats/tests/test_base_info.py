@@ -0,0 +1,176 @@
+"""
+Tests for GET /api/base-info/, the PlatformStats counters and reconciliation.
+"""
+
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+
+from core.query_budget import QueryBudgetTestMixin
+from offers.models import Offer
+from reviews.models import Review
+from stats.models import PlatformStats
+
+User = get_user_model()
+
+
+class BaseInfoTestMixin:
+    """
+    Create a business user with an offer and a customer.
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.business = User.objects.create_user(
+            username='bizuser', email='biz@example.com', password='TestPass123!', type='business'
+        )
+        self.customer = User.objects.create_user(
+            username='customer', email='cust@example.com', password='TestPass123!', type='customer'
+        )
+        self.offer = Offer.objects.create(user=self.business, title='Logo', description='Test')
+
+    def _stats(self):
+        return self.client.get('/api/base-info/').data
+
+
+class BaseInfoAPITest(QueryBudgetTestMixin, BaseInfoTestMixin, APITestCase):
+    """
+    Tests the endpoint and that the totals follow writes.
+    """
+
+    def test_base_info(self):
+        """
+        Test the totals and the rounded average rating.
+        """
+        other = User.objects.create_user(username='other', type='customer')
+        Review.objects.create(business_user=self.business, reviewer=self.customer, rating=4)
+        Review.objects.create(business_user=self.business, reviewer=other, rating=5)
+
+        self.assertEqual(self._stats(), {
+            'review_count': 2,
+            'average_rating': 4.5,
+            'business_profile_count': 1,
+            'offer_count': 1,
+        })
+
+    def test_without_reviews(self):
+        """
+        Test that the average is None without reviews.
+        """
+        self.assertEqual(self._stats()['review_count'], 0)
+        self.assertIsNone(self._stats()['average_rating'])
+
+    def test_single_row_read(self):
+        """
+        Test that the endpoint is public and reads only the stats row.
+        """
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.assertWithinQueryBudget('get', '/api/base-info/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertIn('"stats_platformstats"', ctx.captured_queries[0]['sql'])
+
+    def test_user_changes(self):
+        """
+        Test registration, type changes and deletes of business users.
+        """
+        self.client.post('/api/registration/', {
+            'username': 'newbiz', 'email': 'new@example.com', 'password': 'TestPass123!',
+            'repeated_password': 'TestPass123!', 'type': 'business'
+        }, format='json')
+        self.assertEqual(self._stats()['business_profile_count'], 2)
+
+        self.customer.type = 'business'
+        self.customer.save()
+        self.assertEqual(self._stats()['business_profile_count'], 3)
+
+        customer = User.objects.only('id').get(pk=self.customer.pk)
+        customer.type = 'customer'
+        customer.save(update_fields=['type'])
+        self.assertEqual(self._stats()['business_profile_count'], 2)
+
+        self.business.first_name = 'Renamed'
+        self.business.save()
+        self.assertEqual(self._stats()['business_profile_count'], 2)
+
+        User.objects.get(username='newbiz').delete()
+        self.assertEqual(self._stats()['business_profile_count'], 1)
+
+    def test_cascading_delete(self):
+        """
+        Test that deleting a business user removes its offers and reviews from the totals.
+        """
+        Review.objects.create(business_user=self.business, reviewer=self.customer, rating=2)
+        Offer.objects.create(user=self.business, title='Second', description='Test')
+
+        self.business.delete()
+
+        self.assertEqual(self._stats(), {
+            'review_count': 0,
+            'average_rating': None,
+            'business_profile_count': 0,
+            'offer_count': 0,
+        })
+
+    def test_review_changes(self):
+        """
+        Test that review rating changes and deletes update the totals.
+        """
+        review = Review.objects.create(business_user=self.business, reviewer=self.customer, rating=2)
+        review.rating = 4
+        review.save()
+        self.assertEqual(self._stats()['average_rating'], 4.0)
+
+        review.delete()
+        self.assertEqual(self._stats()['review_count'], 0)
+
+    def test_missing_row_recreated(self):
+        """
+        Test that a missing stats row is rebuilt from the source tables within budget.
+        """
+        PlatformStats.objects.all().delete()
+
+        response = self.assertWithinQueryBudget('get', '/api/base-info/')
+
+        self.assertEqual(response.data['offer_count'], 1)
+        self.assertTrue(PlatformStats.objects.exists())
+        Offer.objects.create(user=self.business, title='Second', description='Test')
+        self.assertEqual(self._stats()['offer_count'], 2)
+
+
+class ReconcilePlatformStatsTest(BaseInfoTestMixin, APITestCase):
+    """
+    Tests for the reconcile_platform_stats command.
+    """
+
+    def test_repairs_drift(self):
+        """
+        Test that totals changed behind the signals are recomputed.
+        """
+        Offer.objects.bulk_create([
+            Offer(user=self.business, title=f'Bulk {i}', description='Test') for i in range(3)
+        ])
+        out = StringIO()
+
+        call_command('reconcile_platform_stats', stdout=out)
+
+        self.assertIn('offer_count 1 -> 4', out.getvalue())
+        self.assertEqual(self._stats()['offer_count'], 4)
+
+    def test_dry_run(self):
+        """
+        Test that --dry-run reports without writing.
+        """
+        PlatformStats.objects.update(business_profile_count=9)
+        out = StringIO()
+
+        call_command('reconcile_platform_stats', dry_run=True, stdout=out)
+
+        self.assertIn('Would fix 1 totals', out.getvalue())
+        self.assertEqual(self._stats()['business_profile_count'], 9)